@@ -2,37 +2,207 @@
 Sequential selection
 """
 
+import heapq
+import inspect
 import numbers
+import os
+import pickle
+import time
 import warnings
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import scipy
-from scipy.linalg import eig
-from scipy.sparse.linalg import eigs as speig
+from joblib import effective_n_jobs
+from scipy.linalg import eigh
+from scipy.sparse.linalg import (
+    LinearOperator,
+    eigsh,
+)
 from sklearn.base import (
     BaseEstimator,
     MetaEstimatorMixin,
 )
+from sklearn.exceptions import ConvergenceWarning
 from sklearn.feature_selection._base import SelectorMixin
+from sklearn.random_projection import SparseRandomProjection
 from sklearn.utils import (
     check_array,
     check_random_state,
+    get_chunk_n_rows,
     safe_mask,
 )
 from sklearn.utils._tags import _safe_tags
+from sklearn.utils.extmath import (
+    randomized_svd,
+    row_norms,
+    safe_sparse_dot,
+)
 from sklearn.utils.validation import check_is_fitted
 
 from .utils import (
     X_orthogonalizer,
-    Y_feature_orthogonalizer,
-    Y_sample_orthogonalizer,
+    YFeatureOrthogonalizer,
+    YSampleOrthogonalizer,
     get_progress_bar,
     pcovr_covariance,
     pcovr_kernel,
 )
 
 
+def _get_blocks(n, block_size=None, n_workers=1):
+    """
+    Splits the range of `n` samples or features into contiguous slices of at most
+    `block_size` elements. If `block_size` is None, a single slice is returned.
+    When `n_workers > 1`, the slices are small enough to give at least one
+    slice to each worker.
+    """
+
+    if block_size is not None and (
+        not isinstance(block_size, numbers.Integral) or block_size < 1
+    ):
+        raise ValueError(
+            f"block_size must be None or a positive integer, got {block_size}."
+        )
+
+    if n_workers > 1:
+        shard_size = -(-n // n_workers)
+        block_size = shard_size if block_size is None else min(block_size, shard_size)
+
+    if block_size is None:
+        return [slice(0, n)]
+
+    return [slice(i, min(i + block_size, n)) for i in range(0, n, block_size)]
+
+
+def _get_executor(n_workers):
+    """
+    Returns a pool of `n_workers` threads, or None if a single worker is requested.
+    Threads are sufficient to use multiple cores, as numpy releases the GIL
+    during the matrix products and reductions of the Haussdorf updates.
+    """
+    if n_workers > 1:
+        return ThreadPoolExecutor(max_workers=n_workers)
+    return None
+
+
+def _sharded_minimum(haussdorf, get_distances, shards, executor=None):
+    """
+    Updates in-place the Haussdorf distances of each shard with the distances
+    returned by `get_distances(shard)`, and returns the index of the largest
+    updated Haussdorf distance. If an executor is given, the shards are processed
+    in parallel, and each of them only reports back its local maximum.
+    """
+
+    def update_shard(shard):
+        local_haussdorf = haussdorf[shard]
+        np.minimum(local_haussdorf, get_distances(shard), local_haussdorf)
+        local_max = np.argmax(local_haussdorf)
+        return shard.start + local_max, local_haussdorf[local_max]
+
+    if executor is None:
+        results = [update_shard(shard) for shard in shards]
+    else:
+        results = list(executor.map(update_shard, shards))
+
+    indices, maxima = zip(*results)
+    return indices[np.argmax(maxima)]
+
+
+def _get_sketch_seed(random_state):
+    """
+    Draws the seed of the random sketch used by the randomized solvers, such
+    that the same sketch is reused at every iteration of a selection.
+    """
+    return check_random_state(random_state).randint(np.iinfo(np.int32).max)
+
+
+def _randomized_operator_svd(A, n_components, n_oversamples, n_iter, random_state):
+    """
+    Computes approximate singular triplets of A with the randomized range
+    finder of Halko et al., as :py:func:`sklearn.utils.extmath.randomized_svd`,
+    but only through the products of A and its transpose with dense matrices,
+    so that A can be a :py:class:`scipy.sparse.linalg.LinearOperator`.
+    """
+
+    if n_iter == "auto":
+        n_iter = 7 if n_components < 0.1 * min(A.shape) else 4
+
+    random_state = check_random_state(random_state)
+    Q = random_state.normal(size=(A.shape[1], n_components + n_oversamples))
+
+    for _ in range(n_iter):
+        Q, _ = np.linalg.qr(A @ Q)
+        Q, _ = np.linalg.qr(A.T @ Q)
+    Q, _ = np.linalg.qr(A @ Q)
+
+    U, S, Vt = np.linalg.svd((A.T @ Q).T, full_matrices=False)
+    return (Q @ U)[:, :n_components], S[:n_components], Vt[:n_components]
+
+
+def _downdate_covariance(C, c, tolerance):
+    """
+    Orthogonalizes in place the covariance (Gram matrix) `C` of X by the column
+    (row) `c` of X, unless its norm is below `tolerance`.
+    """
+
+    # orthogonalizing by the column (row) c of X is a rank-one downdate
+    # of its covariance (Gram matrix) by the column c of the latter
+    g = C[:, c].copy()
+    if np.sqrt(abs(g[c])) > tolerance:
+        C -= np.outer(g, g) / g[c]
+
+
+def _get_distance_dtype(distance_dtype, X):
+    """
+    Returns the dtype in which the norms and Haussdorf distances of FPS are
+    stored, and the norms and scalar products combined: `distance_dtype`, or
+    the dtype of X if `distance_dtype` is None.
+    """
+
+    dtype = X.dtype if distance_dtype is None else np.dtype(distance_dtype)
+    if not np.issubdtype(dtype, np.floating):
+        raise ValueError(f"distance_dtype should be a floating dtype, got {dtype}.")
+    return dtype
+
+
+def _get_far_apart_batch(haussdorf, get_pairwise, n_batch, n_candidates, threshold):
+    """
+    Selects up to `n_batch` far-apart points by FPS among the `n_candidates`
+    points with the largest Haussdorf distances, using the squared distances
+    `get_pairwise(candidates)` between them, and stops before any point whose
+    Haussdorf distance, including the distances to the batch, falls below
+    `threshold`. Returns the batch and the Haussdorf distance of each of its
+    points at the time of its selection.
+    """
+
+    n_candidates = min(n_candidates, len(haussdorf))
+    candidates = np.argpartition(-haussdorf, n_candidates - 1)[:n_candidates]
+
+    # in increasing order, so that ties are broken as by a global argmax
+    candidates = np.sort(candidates)
+
+    pairwise = get_pairwise(candidates)
+    scores = haussdorf[candidates].copy()
+
+    batch, at_select = [], []
+    for _ in range(n_batch):
+        best = np.argmax(scores)
+        if scores[best] == -np.inf or (
+            threshold is not None and scores[best] < threshold
+        ):
+            break
+
+        batch.append(candidates[best])
+        at_select.append(scores[best])
+
+        np.minimum(scores, pairwise[best], scores)
+        scores[best] = -np.inf
+
+    return np.array(batch, dtype=int), np.array(at_select)
+
+
 class GreedySelector(SelectorMixin, MetaEstimatorMixin, BaseEstimator):
     """
 
@@ -69,14 +239,67 @@ class GreedySelector(SelectorMixin, MetaEstimatorMixin, BaseEstimator):
 
     random_state: int or RandomState instance, default=0
 
+    lazy: bool, default=False
+        Whether to evaluate the scores lazily. The candidates are kept in a
+        max-heap of their last evaluated score, and only the candidates which
+        reach the top of the heap are re-evaluated, until the top one is up to
+        date. This gives the same selections as evaluating all the scores at
+        each step, but only for scores which can only decrease as selections
+        are made, so that only the selectors which declare their score monotone
+        support it. Stored in :py:attr:`self.lazy`.
+
+    store_selected: bool, default=True
+        Whether to store the selected samples or features in `X_selected_`
+        (and the selected targets in `y_selected_`). If False, only the
+        indices of the selections are kept, which saves a copy of
+        `n_to_select` samples or features, for the selectors which do not
+        read the previous selections while selecting.
+        Stored in :py:attr:`self.store_selected`.
+
+    checkpoint: str or path-like, default=None
+        File to which the state of the selection is saved every
+        `checkpoint_every` selections and at the end of the fit, and from
+        which :py:func:`resume` restarts an interrupted selection. The
+        checkpoint holds the fitted attributes, such as `selected_idx_`, the
+        distances of FPS or the orthogonalized matrix of CUR (or its
+        low-rank factors), and the state of `random_state` when it is a
+        RandomState instance, but not the copies of the selections, which
+        are gathered from X when resuming. Stored in :py:attr:`self.checkpoint`.
+
+    checkpoint_every: int, default=100
+        Number of selections between two checkpoints.
+        Stored in :py:attr:`self.checkpoint_every`.
+
+    callback: callable, default=None
+        Called after each selection made by :py:func:`fit`, as
+        ``callback(info)``, with `info` a dict holding the position of the
+        selection in `selected_idx_` (`iteration`), its index (`selected`),
+        its score (`score`), and the time in seconds spent choosing it
+        (`score_time`) and updating the selector after it (`update_time`).
+        The selections made when initializing, such as the first point of
+        FPS, are reported too, with an infinite score, no scoring time, and
+        the time of the initialization as their update time.
+        If the callback returns True, the selection stops, e.g. when a time
+        budget is spent. For FPS in batches, the selection stops at the end
+        of the current batch, as the distances are updated a batch at a time.
+        Stored in :py:attr:`self.callback`.
+
     Attributes
     ----------
     n_selected_ : int
                   Counter tracking the number of selections that have been made
-    X_selected_ : ndarray,
-                  Matrix containing the selected samples or features, for use in fitting
+    X_selected_ : ndarray or sparse matrix,
+                  Matrix containing the selected samples or features, for use in fitting,
+                  in the dtype of X (float32 inputs are not converted to float64).
+                  For sparse X, a sparse matrix sliced from X once the selection
+                  is finished. Not stored if `store_selected` is False
     y_selected_ : ndarray,
                   In sample selection, the matrix containing the selected targets, for use in fitting
+    timings_ : ndarray of shape (n_selected_, 2)
+               Time in seconds spent choosing each selection made by
+               :py:func:`fit` (scoring the candidates), and updating the
+               selector after it, accumulated over warm starts, including the
+               selections made when initializing
 
 
     """
@@ -89,6 +312,11 @@ class GreedySelector(SelectorMixin, MetaEstimatorMixin, BaseEstimator):
         progress_bar=False,
         full=False,
         random_state=0,
+        lazy=False,
+        store_selected=True,
+        checkpoint=None,
+        checkpoint_every=100,
+        callback=None,
     ):
 
         self.selection_type = selection_type
@@ -98,6 +326,11 @@ class GreedySelector(SelectorMixin, MetaEstimatorMixin, BaseEstimator):
         self.full = full
         self.progress_bar = progress_bar
         self.random_state = random_state
+        self.lazy = lazy
+        self.store_selected = store_selected
+        self.checkpoint = checkpoint
+        self.checkpoint_every = checkpoint_every
+        self.callback = callback
 
     def fit(self, X, y=None, warm_start=False):
         """Learn the features to select.
@@ -131,13 +364,38 @@ class GreedySelector(SelectorMixin, MetaEstimatorMixin, BaseEstimator):
                 "You cannot specify both `score_threshold` and `full=True`."
             )
 
+        if self.lazy and not self._monotone_score:
+            raise ValueError(
+                f"{self.__class__.__name__} does not support lazy evaluation, "
+                "as its score is not monotone."
+            )
+
+        if not self.store_selected and self._reads_selected:
+            raise ValueError(
+                f"{self.__class__.__name__} reads the previous selections while "
+                "selecting, and cannot be used with store_selected=False."
+            )
+
+        if (
+            not isinstance(self.checkpoint_every, numbers.Integral)
+            or self.checkpoint_every < 1
+        ):
+            raise ValueError(
+                "checkpoint_every should be a positive integer, "
+                f"got {self.checkpoint_every}."
+            )
+
         self.report_progress = get_progress_bar() if self.progress_bar else lambda x: x
 
+        # sparse samples are accessed as rows, and sparse features as columns
+        accept_sparse = "csr" if self._axis == 0 else "csc"
+
         if y is not None:
             X, y = self._validate_data(
                 X,
                 y,
-                accept_sparse="csc",
+                accept_sparse=accept_sparse,
+                dtype=[np.float64, np.float32],
                 ensure_min_features=2,
                 force_all_finite=not tags.get("allow_nan", True),
                 multi_output=True,
@@ -145,7 +403,8 @@ class GreedySelector(SelectorMixin, MetaEstimatorMixin, BaseEstimator):
         else:
             X = check_array(
                 X,
-                accept_sparse="csc",
+                accept_sparse=accept_sparse,
+                dtype=[np.float64, np.float32],
                 ensure_min_features=2,
                 force_all_finite=not tags.get("allow_nan", True),
             )
@@ -180,36 +439,250 @@ class GreedySelector(SelectorMixin, MetaEstimatorMixin, BaseEstimator):
                 raise ValueError(
                     "Cannot fit with warm_start=True without having been previously initialized"
                 )
+            if self.store_selected and not hasattr(self, "X_selected_"):
+                # the selections are neither kept in index-only mode nor in
+                # checkpoints
+                self._gather_selected(X, y)
             self._continue_greedy_search(X, y, n_iterations)
+            self._timings = getattr(self, "_timings", [])
+            stop = False
         else:
+            start = time.perf_counter()
             self._init_greedy_search(X, y, n_iterations)
+            init_time = time.perf_counter() - start
+            self._timings = []
+            stop = False
+
+            # the selections made when initializing (the first point of FPS)
+            # are not scored: they are reported with an infinite score, like
+            # the distance at selection of the first point of FPS, and with the
+            # time of the initialization as their update time
+            for i in range(self.n_selected_):
+                self._timings.append((0.0, init_time if i == 0 else 0.0))
+                stop = (
+                    self._report_selection(
+                        i,
+                        self.selected_idx_[i],
+                        np.inf,
+                        0.0,
+                        init_time if i == 0 else 0.0,
+                    )
+                    or stop
+                )
+
+        self._n_checkpointed = self.n_selected_
 
-        n_iterations -= self.n_selected_
+        if self.lazy:
+            # after a warm start, the scores are only known to be upper bounds
+            self._init_lazy_heap(X, y, up_to_date=not warm_start)
 
-        for n in self.report_progress(range(n_iterations)):
+        n_iterations = 0 if stop else n_iterations - self.n_selected_
 
+        for _ in self.report_progress(range(n_iterations)):
+
+            start = time.perf_counter()
             new_idx = self._get_best_new_selection(self.score, X, y)
             if new_idx is not None:
+                score_time = time.perf_counter() - start
+                start = time.perf_counter()
                 self._update_post_selection(X, y, new_idx)
+                update_time = time.perf_counter() - start
+                self._timings.append((score_time, update_time))
+
+                if (
+                    self.checkpoint is not None
+                    and self.n_selected_ - self._n_checkpointed >= self.checkpoint_every
+                    and self._can_stop()
+                ):
+                    self._save_checkpoint(X)
+
+                # a stop requested by the callback is deferred until the state
+                # is consistent with the selections made
+                stop = (
+                    self._report_selection(
+                        self.n_selected_ - 1,
+                        new_idx,
+                        self._selected_score,
+                        score_time,
+                        update_time,
+                    )
+                    or stop
+                )
             else:
                 warnings.warn(
                     f"Score threshold of {self.score_threshold} reached."
                     f"Terminating search at {self.n_selected_} / {self.n_to_select}."
                 )
-                self.X_selected_ = np.take(
-                    self.X_selected_, np.arange(self.n_selected_), axis=self._axis
+                stop = True
+
+            if stop and self._can_stop():
+                break
+
+        if stop:
+            if self.store_selected and not scipy.sparse.issparse(X):
+                self.X_selected_ = (
+                    self.X_selected_[:, : self.n_selected_]
+                    if self._axis == 1
+                    else self.X_selected_[: self.n_selected_]
                 )
 
-                if hasattr(self, "y_selected_"):
-                    self.y_selected_ = self.y_selected_[:n]
+            if hasattr(self, "y_selected_"):
+                self.y_selected_ = self.y_selected_[: self.n_selected_]
 
-                self.selected_idx_ = self.selected_idx_[:n]
-                self._postprocess(X, y)
-                return self
+            self.selected_idx_ = self.selected_idx_[: self.n_selected_]
 
+        self.timings_ = np.array(self._timings).reshape(-1, 2)
         self._postprocess(X, y)
+
+        if self.checkpoint is not None and self._can_stop():
+            self._save_checkpoint(X)
         return self
 
+    def resume(self, X, y=None):
+        """Restarts an interrupted selection from :py:attr:`checkpoint`.
+
+        The state saved in the checkpoint is restored, and the selection
+        continues as with :py:func:`fit` and `warm_start`, without making the
+        saved selections again. If the checkpoint does not exist yet, a new
+        selection is started, so that a job which may be interrupted can
+        always call `resume`.
+
+        Parameters
+        ----------
+        X : ndarray of shape (n_samples, n_features)
+            Training vectors, the same as those of the interrupted selection.
+        y : ndarray of shape (n_samples,), default=None
+            Target values.
+
+        Returns
+        -------
+        self : object
+        """
+
+        if self.checkpoint is None:
+            raise ValueError("Cannot resume a selection without a checkpoint.")
+
+        if not os.path.exists(self.checkpoint):
+            return self.fit(X, y)
+
+        with open(self.checkpoint, "rb") as checkpoint_file:
+            checkpoint = pickle.load(checkpoint_file)
+        if checkpoint["class"] != self.__class__.__name__:
+            raise ValueError(
+                f"The checkpoint {self.checkpoint} was saved by "
+                f"{checkpoint['class']}, not {self.__class__.__name__}."
+            )
+        if checkpoint["shape"] != np.shape(X):
+            raise ValueError(
+                f"The checkpoint {self.checkpoint} was saved for an input of "
+                f"shape {checkpoint['shape']}, not {np.shape(X)}."
+            )
+
+        self.__dict__.update(checkpoint["state"])
+        if checkpoint["random_state"] is not None and isinstance(
+            self.random_state, np.random.RandomState
+        ):
+            self.random_state.set_state(checkpoint["random_state"])
+
+        return self.fit(X, y, warm_start=True)
+
+    # attributes which are not saved in checkpoints: the copies of the
+    # selections, and the live resources, which are recreated when continuing
+    _checkpoint_exclude = [
+        "X_selected_",
+        "y_selected_",
+        "_X_selected_buffer",
+        "_y_selected_buffer",
+        "report_progress",
+        "_executor",
+    ]
+
+    def _report_selection(self, iteration, new_idx, score, score_time, update_time):
+        """
+        Passes a selection to the callback, if any, and returns whether the
+        callback requested to stop.
+        """
+
+        if self.callback is None:
+            return False
+
+        return bool(
+            self.callback(
+                {
+                    "iteration": iteration,
+                    "selected": new_idx,
+                    "score": float(score),
+                    "score_time": score_time,
+                    "update_time": update_time,
+                }
+            )
+        )
+
+    def _can_stop(self):
+        """
+        Whether the state is consistent with the selections made so far, so
+        that the selection can stop, and the state can be saved, i.e. a resumed
+        selection would make the same selections as the uninterrupted one
+        """
+        return True
+
+    @classmethod
+    def _get_init_parameters(cls):
+        """
+        Returns the names of the parameters of the constructors along the MRO,
+        as the public selectors only forward theirs as `**kwargs`, which
+        get_params does not see
+        """
+
+        parameters = set()
+        for klass in cls.__mro__:
+            init = klass.__dict__.get("__init__")
+            if init is None or klass is object:
+                continue
+            parameters.update(
+                parameter.name
+                for parameter in inspect.signature(init).parameters.values()
+                if parameter.kind
+                not in (parameter.VAR_POSITIONAL, parameter.VAR_KEYWORD)
+            )
+        return parameters
+
+    def _save_checkpoint(self, X):
+        """
+        Saves the fitted attributes to :py:attr:`checkpoint`, without the
+        constructor parameters, which are those of the resuming selector
+        """
+
+        params = self._get_init_parameters()
+        state = {
+            name: value
+            for name, value in self.__dict__.items()
+            if name not in params and name not in self._checkpoint_exclude
+        }
+        state["_n_checkpointed"] = self.n_selected_
+
+        random_state = None
+        if isinstance(self.random_state, np.random.RandomState):
+            random_state = self.random_state.get_state()
+
+        # pickle keeps the attributes which share an array shared, and the
+        # checkpoint is replaced once fully written, so that an interruption
+        # while writing leaves the previous one intact
+        path = os.fspath(self.checkpoint)
+        with open(path + ".tmp", "wb") as checkpoint_file:
+            pickle.dump(
+                {
+                    "class": self.__class__.__name__,
+                    "shape": X.shape,
+                    "state": state,
+                    "random_state": random_state,
+                },
+                checkpoint_file,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(path + ".tmp", path)
+        self._n_checkpointed = self.n_selected_
+
     def transform(self, X, y=None):
         """Reduce X to the selected features.
 
@@ -313,9 +786,24 @@ class GreedySelector(SelectorMixin, MetaEstimatorMixin, BaseEstimator):
         sel_shape = list(X.shape)
         sel_shape[self._axis] = n_to_select
 
-        self.X_selected_ = np.zeros(sel_shape, float)
+        # the selections of a previous fit are not kept in index-only mode
+        for name in ["X_selected_", "y_selected_"]:
+            for attr in [name, f"_{name}buffer"]:
+                if hasattr(self, attr):
+                    delattr(self, attr)
+
+        if not self.store_selected:
+            pass
+        elif scipy.sparse.issparse(X):
+            # the selections are sliced from X when the selection is finished,
+            # so that they are stored with their nonzero entries only
+            self.X_selected_ = scipy.sparse.csr_matrix(
+                (0, X.shape[1]) if self._axis == 0 else (X.shape[0], 0), dtype=X.dtype
+            )
+        else:
+            self.X_selected_ = np.zeros(sel_shape, X.dtype)
 
-        if y is not None and self._axis == 0:
+        if self.store_selected and y is not None and self._axis == 0:
             self.y_selected_ = np.zeros(
                 (n_to_select, y.reshape(y.shape[0], -1).shape[1]), float
             )
@@ -324,54 +812,160 @@ class GreedySelector(SelectorMixin, MetaEstimatorMixin, BaseEstimator):
     def _continue_greedy_search(self, X, y, n_to_select):
         """Continues the search. Prepares an array to store the selected features."""
 
-        n_pad = [(0, 0), (0, 0)]
-        n_pad[self._axis] = (0, n_to_select - self.n_selected_)
-
-        self.X_selected_ = np.pad(
-            self.X_selected_,
-            n_pad,
-            "constant",
-            constant_values=0.0,
-        )
+        if hasattr(self, "X_selected_") and not scipy.sparse.issparse(X):
+            self._grow_selected("X_selected_", n_to_select, self._axis)
 
         if hasattr(self, "y_selected_"):
-            self.y_selected_ = np.pad(
-                self.y_selected_,
-                n_pad,
-                "constant",
-                constant_values=0.0,
-            )
+            self._grow_selected("y_selected_", n_to_select, 0)
 
-        old_idx = self.selected_idx_.copy()
+        old_idx = self.selected_idx_[: self.n_selected_].copy()
         self.selected_idx_ = np.zeros((n_to_select), int)
         self.selected_idx_[: self.n_selected_] = old_idx
 
+    def _gather_selected(self, X, y):
+        """Gathers the previous selections from X (and y) into `X_selected_`"""
+
+        selected = self.selected_idx_[: self.n_selected_]
+        if scipy.sparse.issparse(X):
+            self.X_selected_ = scipy.sparse.csr_matrix(
+                (0, X.shape[1]) if self._axis == 0 else (X.shape[0], 0), dtype=X.dtype
+            )
+        else:
+            self.X_selected_ = np.take(X, selected, axis=self._axis)
+
+        if y is not None and self._axis == 0:
+            self.y_selected_ = y.reshape(y.shape[0], -1)[selected].astype(float)
+
+    def _grow_selected(self, name, n_to_select, axis):
+        """
+        Makes the attribute `name` a view of the first `n_to_select` entries
+        along `axis` of a buffer holding the previous selections. The buffer is
+        reallocated with at least twice its capacity when it is too small, so
+        that restarts adding a few selections at a time only copy each
+        selection an amortized constant number of times.
+        """
+
+        buffer = getattr(self, f"_{name}buffer", getattr(self, name))
+
+        index = [slice(None)] * buffer.ndim
+        if buffer.shape[axis] < n_to_select:
+            shape = list(buffer.shape)
+            shape[axis] = max(n_to_select, 2 * buffer.shape[axis])
+            index[axis] = slice(0, self.n_selected_)
+
+            new_buffer = np.zeros(shape, buffer.dtype)
+            new_buffer[tuple(index)] = buffer[tuple(index)]
+            buffer = new_buffer
+
+        index[axis] = slice(0, n_to_select)
+        setattr(self, f"_{name}buffer", buffer)
+        setattr(self, name, buffer[tuple(index)])
+
     def _get_best_new_selection(self, scorer, X, y):
 
+        if self.lazy:
+            return self._get_lazy_selection(X, y)
+
         scores = scorer(X, y)
 
+        # the score of the selection is passed to the callback, and the
+        # selectors which override this method keep it as well
         amax = np.argmax(scores)
+        self._selected_score = scores[amax]
         if self.score_threshold is not None and scores[amax] < self.score_threshold:
             return None
         else:
             return amax
 
+    # Selectors whose scores can only decrease as selections are made set this
+    # to True, and implement `_score_candidates`, to support lazy evaluation.
+    _monotone_score = False
+
+    # number of candidates re-evaluated at once in lazy evaluation
+    _lazy_batch_size = 16
+
+    # Selectors which read `X_selected_` or `y_selected_` while selecting set
+    # this to True, and do not support store_selected=False.
+    _reads_selected = False
+
+    def _score_candidates(self, X, y, candidates):
+        """
+        Returns the up-to-date scores of the `candidates`, for lazy evaluation
+        """
+        raise NotImplementedError
+
+    def _init_lazy_heap(self, X, y, up_to_date=True):
+        """
+        Builds the max-heap of the scores of the candidates which have not been
+        selected, as tuples of the negated score and the index of the candidate.
+        """
+
+        scores = self.score(X, y)
+        candidates = np.setdiff1d(
+            np.arange(len(scores)), self.selected_idx_[: self.n_selected_]
+        )
+
+        self._heap = list(zip(-scores[candidates].astype(float), candidates.tolist()))
+        heapq.heapify(self._heap)
+
+        # the number of selections when each score was last evaluated
+        self._evaluated_at = np.full(
+            len(scores), self.n_selected_ if up_to_date else -1
+        )
+
+    def _get_lazy_selection(self, X, y):
+        """
+        Re-evaluates the candidates at the top of the heap until the top one
+        is up to date, which is then the best selection, as the scores of the
+        other candidates can only be lower than their last evaluation.
+        """
+
+        while len(self._heap) > 0:
+            negated_score, idx = self._heap[0]
+
+            if self._evaluated_at[idx] == self.n_selected_:
+                heapq.heappop(self._heap)
+                self._selected_score = -negated_score
+                if (
+                    self.score_threshold is not None
+                    and -negated_score < self.score_threshold
+                ):
+                    return None
+                return idx
+
+            candidates = np.array(
+                [
+                    heapq.heappop(self._heap)[1]
+                    for _ in range(min(self._lazy_batch_size, len(self._heap)))
+                ]
+            )
+            scores = self._score_candidates(X, y, candidates)
+            self._evaluated_at[candidates] = self.n_selected_
+
+            for score, candidate in zip(scores.tolist(), candidates.tolist()):
+                heapq.heappush(self._heap, (-score, candidate))
+
+        return None
+
     def _update_post_selection(self, X, y, last_selected):
         """
         Saves the most recently selected feature and increments the feature counter
         """
 
-        if self._axis == 1:
-            self.X_selected_[:, self.n_selected_] = np.take(
-                X, last_selected, axis=self._axis
-            )
+        if not self.store_selected or scipy.sparse.issparse(X):
+            # the selections are sliced from X in _postprocess for sparse X
+            pass
+        elif self._axis == 1:
+            # basic indexing returns a view of the column, whereas np.take would
+            # first copy a non C-contiguous X in full
+            self.X_selected_[:, self.n_selected_] = X[:, last_selected]
         else:
             self.X_selected_[self.n_selected_] = np.take(
                 X, last_selected, axis=self._axis
             )
 
-            if hasattr(self, "y_selected_"):
-                self.y_selected_[self.n_selected_] = y[last_selected]
+        if self._axis == 0 and hasattr(self, "y_selected_"):
+            self.y_selected_[self.n_selected_] = y[last_selected]
 
         self.selected_idx_[self.n_selected_] = last_selected
         self.n_selected_ += 1
@@ -399,6 +993,13 @@ class GreedySelector(SelectorMixin, MetaEstimatorMixin, BaseEstimator):
         self.support_ = np.full(X.shape[self._axis], False)
         self.support_[self.selected_idx_] = True
 
+        if self.store_selected and scipy.sparse.issparse(X):
+            selected = self.selected_idx_[: self.n_selected_]
+            if self._axis == 1:
+                self.X_selected_ = X[:, selected]
+            else:
+                self.X_selected_ = X[selected]
+
     def _more_tags(self):
         return {
             "requires_y": False,
@@ -426,6 +1027,62 @@ class _CUR(GreedySelector):
     tolerance: float
          threshold below which scores will be considered 0, defaults to 1E-12
 
+    svd_solver: {'arpack', 'subspace', 'randomized'}, default='arpack'
+        If arpack :
+            compute the singular vectors from scratch at each iteration,
+            calling the ARPACK solver via `scipy.sparse.linalg.svds`.
+        If subspace :
+            compute the singular vectors by subspace iteration with
+            Rayleigh-Ritz refinement, warm-started from the singular vectors
+            of the previous iteration. As each orthogonalization is a rank-one
+            update of `X_current_`, the previous singular vectors span the new
+            leading singular vectors up to a small correction, and only a few
+            matrix products with `X_current_` are needed per selection. This
+            is most effective when the leading singular values are well
+            separated from the following ones.
+        If randomized :
+            compute approximate singular vectors with the randomized range
+            finder of Halko et al., via `sklearn.utils.extmath.randomized_svd`.
+            The same random sketch, drawn from `random_state`, is used at
+            every iteration.
+
+    n_oversamples: int, default=10
+        Number of random vectors added to the `k` sketched singular vectors
+        when svd_solver == 'randomized'.
+
+    iterated_power: int or 'auto', default='auto'
+        Number of power iterations when svd_solver == 'randomized'.
+
+    covariance: bool, default=False
+        whether to work on the covariance :math:`\\mathbf{X}^T\\mathbf{X}`
+        (feature selection) or the Gram matrix :math:`\\mathbf{X}\\mathbf{X}^T`
+        (sample selection) instead of a copy of `X`. Orthogonalizing by a
+        selection is then a rank-one downdate of this matrix, and the importance
+        scores are obtained from its eigenvectors, so that the memory and the
+        cost per iteration do not depend on the number of samples (features)
+        when selecting features (samples). `X_current_` is not stored.
+
+    deflation: {'auto', 'explicit', 'implicit'}, default='auto'
+        How X is orthogonalized by the previous selections, unless
+        `covariance` is set.
+        If explicit :
+            a dense copy of X, `X_current_`, is orthogonalized after each
+            selection.
+        If implicit :
+            X is kept as it is, and the orthogonalization is stored as a dense
+            low-rank correction, so that the orthogonalized matrix is
+            :math:`\\mathbf{X} - \\mathbf{L}\\mathbf{R}^T`, with one column of
+            :math:`\\mathbf{L}` and :math:`\\mathbf{R}` per selection. With
+            :math:`\\mathbf{Q}` an orthonormal basis of the selected columns
+            (rows), :math:`\\mathbf{L} = \\mathbf{Q}` and
+            :math:`\\mathbf{R} = \\mathbf{X}^T\\mathbf{Q}` for feature
+            selection, and :math:`\\mathbf{L} = \\mathbf{X}\\mathbf{Q}` and
+            :math:`\\mathbf{R} = \\mathbf{Q}` for sample selection. The
+            singular vectors are computed through a
+            :py:class:`scipy.sparse.linalg.LinearOperator`, which only needs
+            products with X, so that a sparse X is never densified.
+        If auto :
+            implicit for sparse X, explicit otherwise.
 
     Attributes
     ----------
@@ -433,6 +1090,21 @@ class _CUR(GreedySelector):
     X_current_ : ndarray (n_samples, n_features)
                   The original matrix orthogonalized by previous selections
 
+    deflation_left_ : ndarray (n_samples, n_orthogonalized)
+                      The left factor :math:`\\mathbf{L}` of the low-rank
+                      correction stored instead of `X_current_` for
+                      implicit deflation
+
+    deflation_right_ : ndarray (n_features, n_orthogonalized)
+                       The right factor :math:`\\mathbf{R}` of the low-rank
+                       correction
+
+    C_current_ : ndarray (n_features, n_features) or (n_samples, n_samples)
+                  The covariance (feature selection) or Gram matrix (sample
+                  selection) of the original matrix orthogonalized by previous
+                  selections, stored instead of `X_current_` when `covariance`
+                  is set
+
     """
 
     def __init__(
@@ -440,12 +1112,22 @@ class _CUR(GreedySelector):
         iterative=True,
         k=1,
         tolerance=1e-12,
+        svd_solver="arpack",
+        n_oversamples=10,
+        iterated_power="auto",
+        covariance=False,
+        deflation="auto",
         **kwargs,
     ):
 
         self.k = k
         self.iterative = iterative
         self.tolerance = tolerance
+        self.svd_solver = svd_solver
+        self.n_oversamples = n_oversamples
+        self.iterated_power = iterated_power
+        self.covariance = covariance
+        self.deflation = deflation
 
         super().__init__(**kwargs)
 
@@ -479,8 +1161,38 @@ class _CUR(GreedySelector):
         features and computes their initial importance score.
         """
 
-        self.X_current_ = X.copy()
-        self.pi_ = self._compute_pi(self.X_current_)
+        if self.svd_solver not in ["arpack", "subspace", "randomized"]:
+            raise ValueError(
+                f"Unrecognized svd_solver {self.svd_solver}, "
+                "must be one of 'arpack', 'subspace' or 'randomized'."
+            )
+
+        if self.deflation not in ["auto", "explicit", "implicit"]:
+            raise ValueError(
+                f"Unrecognized deflation {self.deflation}, "
+                "must be one of 'auto', 'explicit' or 'implicit'."
+            )
+
+        self._singular_vectors = None
+        self._sketch_seed = _get_sketch_seed(self.random_state)
+        self._implicit = not self.covariance and (
+            self.deflation == "implicit"
+            or (self.deflation == "auto" and scipy.sparse.issparse(X))
+        )
+
+        if self.covariance:
+            self.C_current_ = X.T @ X if self._axis == 1 else X @ X.T
+            if scipy.sparse.issparse(self.C_current_):
+                self.C_current_ = self.C_current_.toarray()
+        elif self._implicit:
+            self.deflation_left_ = np.zeros((X.shape[0], 0), X.dtype)
+            self.deflation_right_ = np.zeros((X.shape[1], 0), X.dtype)
+        elif scipy.sparse.issparse(X):
+            self.X_current_ = X.toarray()
+        else:
+            self.X_current_ = X.copy()
+
+        self.pi_ = self._compute_pi(self._get_current(X))
 
         super()._init_greedy_search(X, y, n_to_select)
 
@@ -491,15 +1203,54 @@ class _CUR(GreedySelector):
         and computes their initial importance.
         """
 
-        for c in self.selected_idx_:
+        if self.covariance:
+            # the norm of each selection is the square root of its diagonal entry
+            for c in self.selected_idx_[: self.n_selected_]:
+                if np.sqrt(abs(self.C_current_[c, c])) > self.tolerance:
+                    self._orthogonalize(last_selected=c)
 
-            if (
-                np.linalg.norm(np.take(self.X_current_, [c], axis=self._axis))
+            self.pi_ = self._compute_pi(self.C_current_)
+
+        elif self._implicit:
+            # the correction is rebuilt from all the selections, as the
+            # round-off residuals of those already deflated are not negligible
+            # with respect to the tolerance
+            self.deflation_left_ = self.deflation_left_[:, :0]
+            self.deflation_right_ = self.deflation_right_[:, :0]
+            for c in self.selected_idx_[: self.n_selected_]:
+                x = self._get_deflated_vector(X, c)
+                if np.linalg.norm(x) > self.tolerance:
+                    self._append_deflation(X, x)
+
+            self.pi_ = self._compute_pi(self._get_current(X))
+
+        else:
+            # the previous selections which have not been orthogonalized yet are
+            # replayed at once, as a single projection of X_current_
+            replay = [
+                c
+                for c in self.selected_idx_[: self.n_selected_]
+                if np.linalg.norm(np.take(self.X_current_, [c], axis=self._axis))
                 > self.tolerance
-            ):
-                self._orthogonalize(last_selected=c)
+            ]
+
+            if len(replay) > 0:
+                if self._axis == 1:
+                    self.X_current_ = X_orthogonalizer(
+                        x1=self.X_current_,
+                        x2=self.X_current_[:, replay],
+                        tol=self.tolerance,
+                        block=True,
+                    )
+                else:
+                    self.X_current_ = X_orthogonalizer(
+                        x1=self.X_current_.T,
+                        x2=self.X_current_[replay].T,
+                        tol=self.tolerance,
+                        block=True,
+                    ).T
 
-        self.pi_ = self._compute_pi(self.X_current_)
+            self.pi_ = self._compute_pi(self.X_current_)
 
         super()._continue_greedy_search(X, y, n_to_select)
 
@@ -525,10 +1276,15 @@ class _CUR(GreedySelector):
 
         where :math:`\\mathbf{K} = \\mathbf{X}\\mathbf{X}^T`.
 
+        When `covariance` is set, the singular vectors are obtained as the
+        eigenvectors of :math:`\\mathbf{C}` or :math:`\\mathbf{K}`.
+
         Parameters
         ----------
-        X : ndarray of shape [n_samples, n_features]
-            The input samples.
+        X : ndarray of shape [n_samples, n_features] or LinearOperator
+            The input samples, or their covariance (Gram matrix) for feature
+            (sample) selection when `covariance` is set, as returned by
+            :py:func:`self._get_current`.
 
         y : ignored
 
@@ -538,7 +1294,42 @@ class _CUR(GreedySelector):
             :math:`\\pi` importance for the given samples or features
         """
 
-        if self._axis == 0:
+        if self.svd_solver == "subspace":
+            # the left singular vectors of X are the right singular vectors of X.T,
+            # and the singular vectors of C and K are their eigenvectors
+            A = X.T if self._axis == 0 and not self.covariance else X
+            V = self._subspace_iteration(A)
+            new_pi = (V[:, : self.k] ** 2.0).sum(axis=1)
+
+        elif self.svd_solver == "randomized":
+            # randomized_svd needs products from the left, which linear
+            # operators do not support
+            svd = (
+                _randomized_operator_svd
+                if isinstance(X, LinearOperator)
+                else randomized_svd
+            )
+            U, _, Vt = svd(
+                X,
+                n_components=self.k,
+                n_oversamples=self.n_oversamples,
+                n_iter=self.iterated_power,
+                random_state=self._sketch_seed,
+            )
+            if self._axis == 0 or self.covariance:
+                new_pi = (U ** 2.0).sum(axis=1)
+            else:
+                new_pi = (Vt ** 2.0).sum(axis=0)
+
+        elif self.covariance:
+            if self.k < X.shape[0] - 1:
+                v, U = eigsh(X, k=self.k, tol=1e-12)
+            else:
+                v, U = eigh(X)
+            U = U[:, np.flip(np.argsort(v))]
+            new_pi = (U[:, : self.k] ** 2.0).sum(axis=1)
+
+        elif self._axis == 0:
             U, _, _ = scipy.sparse.linalg.svds(X, k=self.k, return_singular_vectors="u")
             U = np.real(U)
             new_pi = (U[:, : self.k] ** 2.0).sum(axis=1)
@@ -550,6 +1341,48 @@ class _CUR(GreedySelector):
 
         return new_pi
 
+    def _subspace_iteration(self, A, max_iter=100, rtol=1e-8):
+        """
+        Computes the leading right singular vectors of A by subspace iteration
+        with Rayleigh-Ritz refinement, starting from the singular vectors
+        computed at the previous call. A few more vectors than `k` are iterated,
+        as the deflation of the leading singular vector brings the following
+        ones to the front. Warns with a ConvergenceWarning if the vectors have
+        not converged within `max_iter` iterations.
+        """
+
+        n_vectors = min(self.k + 10, min(A.shape))
+
+        V = self._singular_vectors
+        if V is None or V.shape != (A.shape[1], n_vectors):
+            random_state = check_random_state(self.random_state)
+            V = random_state.normal(size=(A.shape[1], n_vectors))
+        V, _ = np.linalg.qr(V)
+
+        for _ in range(max_iter):
+            # Rayleigh-Ritz: best singular triplets of A within the span of V
+            AV = A @ V
+            U, S, Wt = np.linalg.svd(AV, full_matrices=False)
+            V = V @ Wt.T
+
+            # for exact singular triplets, A.T @ u = s * v
+            AtU = A.T @ U
+            residuals = np.linalg.norm(AtU[:, : self.k] - V[:, : self.k] * S[: self.k])
+            if residuals <= rtol * max(S[0], self.tolerance):
+                break
+
+            V, _ = np.linalg.qr(AtU)
+        else:
+            warnings.warn(
+                f"The subspace iteration did not converge in {max_iter} "
+                f"iterations, with a residual of {residuals:.3g}. The selection "
+                "may differ from the one with svd_solver='arpack'.",
+                ConvergenceWarning,
+            )
+
+        self._singular_vectors = V
+        return V
+
     def _update_post_selection(self, X, y, last_selected):
         """
         Saves the most recently selected feature, increments the feature counter,
@@ -559,14 +1392,74 @@ class _CUR(GreedySelector):
         super()._update_post_selection(X, y, last_selected)
 
         if self.iterative:
-            self._orthogonalize(last_selected)
-            self.pi_ = self._compute_pi(self.X_current_)
+            self._orthogonalize(last_selected, X)
+            self.pi_ = self._compute_pi(self._get_current(X))
 
         self.pi_[last_selected] = 0.0
 
-    def _orthogonalize(self, last_selected):
+    def _get_current(self, X):
+        """
+        Returns the matrix from which the importance scores are computed: the
+        orthogonalized covariance (Gram matrix) when `covariance` is set,
+        `X_current_`, or, for implicit deflation, a linear operator applying
+        :math:`\\mathbf{X} - \\mathbf{L}\\mathbf{R}^T`.
+        """
 
+        if self.covariance:
+            return self.C_current_
+        elif not self._implicit:
+            return self.X_current_
+
+        L, R = self.deflation_left_, self.deflation_right_
+        return LinearOperator(
+            shape=X.shape,
+            dtype=X.dtype,
+            matvec=lambda v: X @ v - L @ (R.T @ v),
+            matmat=lambda V: X @ V - L @ (R.T @ V),
+            rmatvec=lambda u: X.T @ u - R @ (L.T @ u),
+            rmatmat=lambda U: X.T @ U - R @ (L.T @ U),
+        )
+
+    def _get_deflated_vector(self, X, c):
+        """
+        Returns the column (feature selection) or row (sample selection) c of
+        the orthogonalized matrix, densely, for implicit deflation.
+        """
+        if self._axis == 1:
+            x = X[:, [c]]
+            correction = self.deflation_left_ @ self.deflation_right_[c]
+        else:
+            x = X[[c]]
+            correction = self.deflation_right_ @ self.deflation_left_[c]
+
+        x = x.toarray() if scipy.sparse.issparse(x) else np.asarray(x)
+        return x.ravel() - correction
+
+    def _append_deflation(self, X, x):
+        """
+        Adds the normalized direction of the orthogonalized column (row) x
+        to the low-rank correction, which is orthogonal to the previous ones.
+        """
+        q = x / np.linalg.norm(x)
         if self._axis == 1:
+            left, right = q, X.T @ q
+        else:
+            left, right = X @ q, q
+
+        self.deflation_left_ = np.column_stack([self.deflation_left_, left])
+        self.deflation_right_ = np.column_stack([self.deflation_right_, right])
+
+    def _orthogonalize(self, last_selected, X=None):
+
+        if self.covariance:
+            _downdate_covariance(self.C_current_, last_selected, self.tolerance)
+        elif self._implicit:
+            x = self._get_deflated_vector(X, last_selected)
+            if np.linalg.norm(x) < self.tolerance:
+                warnings.warn("Column vector contains only zeros.")
+            else:
+                self._append_deflation(X, x)
+        elif self._axis == 1:
             self.X_current_ = X_orthogonalizer(
                 x1=self.X_current_, c=last_selected, tol=self.tolerance
             )
@@ -601,6 +1494,35 @@ class _PCovCUR(GreedySelector):
             The PCovR mixing parameter, as described in PCovR as
             :math:`{\\alpha}`. Stored in :py:attr:`self.mixing`.
 
+    incremental: bool, default=False
+            whether to keep the Gram matrix :math:`\\mathbf{X}\\mathbf{X}^T`
+            (sample selection) or the covariance :math:`\\mathbf{X}^T\\mathbf{X}`
+            (feature selection) of `X_current_` up to date with a rank-one
+            downdate after each orthogonalization, instead of recomputing
+            it from `X_current_` to build the PCovR kernel or covariance at each
+            iteration. This saves the product of `X_current_` with itself, but
+            for feature selection with `mixing` < 1 the inverse square root of
+            the covariance is still computed with a full eigendecomposition
+            at each iteration. Stored in :py:attr:`self.incremental`.
+
+    svd_solver: {'arpack', 'randomized'}, default='arpack'
+        If arpack :
+            compute the leading eigenvectors of the PCovR kernel or covariance
+            with the Lanczos solver `scipy.sparse.linalg.eigsh`, or with
+            `scipy.linalg.eigh` when `k` is close to its size.
+        If randomized :
+            compute approximate eigenvectors with the randomized range finder
+            of Halko et al., via `sklearn.utils.extmath.randomized_svd`. The
+            same random sketch, drawn from `random_state`, is used at every
+            iteration.
+
+    n_oversamples: int, default=10
+        Number of random vectors added to the `k` sketched eigenvectors
+        when svd_solver == 'randomized'.
+
+    iterated_power: int or 'auto', default='auto'
+        Number of power iterations when svd_solver == 'randomized'.
+
     Attributes
     ----------
 
@@ -619,12 +1541,20 @@ class _PCovCUR(GreedySelector):
         iterative=True,
         k=1,
         tolerance=1e-12,
+        incremental=False,
+        svd_solver="arpack",
+        n_oversamples=10,
+        iterated_power="auto",
         **kwargs,
     ):
 
         self.k = k
         self.iterative = iterative
         self.tolerance = tolerance
+        self.incremental = incremental
+        self.svd_solver = svd_solver
+        self.n_oversamples = n_oversamples
+        self.iterated_power = iterated_power
 
         self.mixing = mixing
 
@@ -659,11 +1589,31 @@ class _PCovCUR(GreedySelector):
         features and computes their initial importance score.
         """
 
+        if self.svd_solver not in ["arpack", "randomized"]:
+            raise ValueError(
+                f"Unrecognized svd_solver {self.svd_solver}, "
+                "must be one of 'arpack' or 'randomized'."
+            )
+
+        self._sketch_seed = _get_sketch_seed(self.random_state)
+
         self.X_current_ = X.copy()
         if y is not None:
             self.y_current_ = y.copy()
         else:
             self.y_current_ = None
+
+        if self.incremental:
+            if self._axis == 1:
+                self._gram = X.T @ X
+            else:
+                self._gram = X @ X.T
+
+        if self._axis == 1:
+            self._y_orthogonalizer = YFeatureOrthogonalizer(tol=self.tolerance)
+        else:
+            self._y_orthogonalizer = YSampleOrthogonalizer(tol=self.tolerance)
+
         self.pi_ = self._compute_pi(self.X_current_, self.y_current_)
 
         super()._init_greedy_search(X, y, n_to_select)
@@ -675,7 +1625,7 @@ class _PCovCUR(GreedySelector):
         and computes their initial importance.
         """
 
-        for c in self.selected_idx_:
+        for c in self.selected_idx_[: self.n_selected_]:
 
             if (
                 np.linalg.norm(np.take(self.X_current_, [c], axis=self._axis))
@@ -744,7 +1694,9 @@ class _PCovCUR(GreedySelector):
             :math:`\pi` importance for the given samples or features
         """
 
-        if self._axis == 0:
+        if self.incremental:
+            pcovr_distance = self._pcovr_from_gram(X, y)
+        elif self._axis == 0:
             pcovr_distance = pcovr_kernel(
                 self.mixing,
                 X,
@@ -759,16 +1711,63 @@ class _PCovCUR(GreedySelector):
                 rank=None,
             )
 
-        if self.k < pcovr_distance.shape[0] - 1:
-            v, U = speig(pcovr_distance, k=self.k, tol=1e-12)
+        if self.svd_solver == "randomized":
+            # the PCovR kernel and covariance are positive semi-definite, so
+            # their singular vectors are their eigenvectors
+            U, _, _ = randomized_svd(
+                pcovr_distance,
+                n_components=self.k,
+                n_oversamples=self.n_oversamples,
+                n_iter=self.iterated_power,
+                random_state=self._sketch_seed,
+            )
         else:
-            v, U = eig(pcovr_distance)
-        U = U[:, np.flip(np.argsort(v))]
-        pi = (np.real(U)[:, : self.k] ** 2.0).sum(axis=1)
+            # the PCovR kernel and covariance are symmetric by construction
+            if self.k < pcovr_distance.shape[0] - 1:
+                v, U = eigsh(pcovr_distance, k=self.k, tol=1e-12)
+            else:
+                v, U = eigh(pcovr_distance)
+            U = U[:, np.flip(np.argsort(v))]
+        pi = (U[:, : self.k] ** 2.0).sum(axis=1)
 
         return pi
 
+    def _pcovr_from_gram(self, X, y, rcond=1e-12):
+        """
+        Builds the PCovR kernel (sample selection) or covariance (feature
+        selection) from the Gram matrix or covariance of X kept up to date
+        by :py:func:`self._orthogonalize`, as done in
+        :py:func:`skcosmo.utils.pcovr_kernel` and
+        :py:func:`skcosmo.utils.pcovr_covariance`. Only the Gram matrix or
+        covariance is updated incrementally: for feature selection, its
+        inverse square root is recomputed from scratch.
+        """
+
+        pcovr_distance = np.zeros(self._gram.shape)
+
+        if self.mixing < 1:
+            if self._axis == 0:
+                pcovr_distance += (1 - self.mixing) * y @ y.T
+            else:
+                vC, UC = np.linalg.eigh(self._gram)
+                UC = UC[:, vC > rcond]
+                vC = np.sqrt(vC[vC > rcond])
+
+                C_Y = UC @ ((UC.T @ (X.T @ y).reshape(UC.shape[0], -1)) / vC[:, None])
+                pcovr_distance += (1 - self.mixing) * C_Y @ C_Y.T
+
+        if self.mixing > 0:
+            pcovr_distance += self.mixing * self._gram
+
+        return pcovr_distance
+
+    # the orthogonalizer of y is given the selections from X_selected_
+    _reads_selected = True
+
     def _orthogonalize(self, last_selected):
+        if self.incremental:
+            _downdate_covariance(self._gram, last_selected, self.tolerance)
+
         if self._axis == 1:
             self.X_current_ = X_orthogonalizer(
                 x1=self.X_current_, c=last_selected, tol=self.tolerance
@@ -779,21 +1778,77 @@ class _PCovCUR(GreedySelector):
             ).T
 
         if self.y_current_ is not None:
+            # the orthogonalizer is only given the selections it has not seen yet
+            for i in range(self._y_orthogonalizer.n_vectors_, self.n_selected_):
+                if self._axis == 1:
+                    self._y_orthogonalizer.append(self.X_selected_[:, i])
+                else:
+                    self._y_orthogonalizer.append(
+                        self.X_selected_[i], self.y_selected_[i]
+                    )
+
             if self._axis == 1:
-                self.y_current_ = Y_feature_orthogonalizer(
-                    self.y_current_, X=self.X_selected_, tol=self.tolerance
-                )
+                self.y_current_ = self._y_orthogonalizer.orthogonalize(self.y_current_)
             else:
-                self.y_current_ = Y_sample_orthogonalizer(
-                    self.y_current_,
-                    self.X_current_,
-                    y_ref=self.y_selected_,
-                    X_ref=self.X_selected_,
-                    tol=self.tolerance,
+                self.y_current_ = self._y_orthogonalizer.orthogonalize(
+                    self.y_current_, self.X_current_
                 )
 
 
-class _FPS(GreedySelector):
+class _BaseFPS(GreedySelector):
+    """
+    Base class of :py:class:`_FPS` and :py:class:`_PCovFPS`, which select the
+    point with the largest Haussdorf distance in `haussdorf_`. The maximum is
+    either taken by :py:class:`GreedySelector`, or reduced from the shards
+    by the update of the distances into `_next_selection`. With a
+    `batch_size`, the points are instead taken from `_batch`, filled by
+    `_select_batch(X)`. The distances are updated by the threads of
+    `_executor`, unless it is None.
+
+    **WARNING**: This base class should never be directly instantiated.
+    """
+
+    def _can_stop(self):
+        # the selections of a batch are made at once, so that a batch is not
+        # interrupted
+        return len(self._batch) == 0
+
+    def _get_best_new_selection(self, scorer, X, y):
+
+        if self.batch_size is not None:
+            if len(self._batch) == 0:
+                self._select_batch(X)
+
+            # an empty batch means that the score threshold was reached
+            if len(self._batch) == 0:
+                return None
+            self._selected_score = self.haussdorf_at_select_[self._batch[0]]
+            return self._batch.pop(0)
+
+        if self._next_selection is None:
+            return super()._get_best_new_selection(scorer, X, y)
+
+        # the maximum has already been reduced from the shards in the update
+        amax = self._next_selection
+        self._selected_score = self.haussdorf_[amax]
+        if (
+            self.score_threshold is not None
+            and self.haussdorf_[amax] < self.score_threshold
+        ):
+            return None
+        else:
+            return amax
+
+    def _postprocess(self, X, y):
+        """Shuts down the threads used to update the distances"""
+        super()._postprocess(X, y)
+
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+class _FPS(_BaseFPS):
     """
     Transformer that performs Greedy Selection using Farthest Point Sampling.
 
@@ -809,12 +1864,103 @@ class _FPS(GreedySelector):
         Index of the first selection. If 'random', picks a random
         value when fit starts. Stored in :py:attr:`self.initialize`.
 
+    block_size: int, default=None
+        Number of samples (or features) whose distances are computed at once
+        when updating the Haussdorf distances. If `None`, the whole matrix is
+        processed at once. Setting a block size bounds the size of the
+        temporary arrays by the block size, so that selections can be made
+        from memory-mapped matrices (e.g. loaded with
+        ``np.load(file, mmap_mode="r")``) which do not fit in memory.
+        Stored in :py:attr:`self.block_size`.
+
+    n_jobs: int, default=None
+        Number of threads among which the candidates are sharded when updating
+        the Haussdorf distances. Each thread updates the distances of its
+        shard in-place and only reports back its local maximum.
+        ``None`` means 1 unless in a :obj:`joblib.parallel_backend` context,
+        ``-1`` means using all processors. Stored in :py:attr:`self.n_jobs`.
+
+    sketch_size: int, default=None
+        If not `None`, the Haussdorf distances are maintained on a
+        Johnson-Lindenstrauss sketch of the samples (or features), i.e. their
+        sparse random projection onto `sketch_size` dimensions. Before each
+        selection, only the candidates whose sketched distance could be the
+        largest within the error of the sketch are re-scored with the full
+        dimension, against the selections made since they were last re-scored.
+        This reduces the cost of the updates for high-dimensional data, for which
+        `sketch_size` can be much smaller than the dimension. When sketching,
+        `block_size` (64 if `None`) is the number of candidates re-scored at
+        once, and `n_jobs` is ignored.
+        Stored in :py:attr:`self.sketch_size`.
+
+    sketch_tolerance: float, default=None
+        Relative error :math:`\\epsilon` of the sketched squared distances,
+        which bounds the true Haussdorf distance of a candidate by its sketched
+        Haussdorf distance divided by :math:`1 - \\epsilon`, and so determines
+        the number of candidates to re-score. The selections are exact if no
+        sketched distance is smaller than the true one by more than this
+        fraction. If `None`, it is estimated as the largest relative error of the
+        sketched distances to the first selection, for which the distances are
+        computed in full, so that the selections are near-exact. Stored in
+        :py:attr:`self.sketch_tolerance`, and the value used in
+        :py:attr:`self.sketch_tolerance_`.
+
+    batch_size: int, default=None
+        If not `None`, up to `batch_size` points are selected per pass over X
+        instead of one, which divides the number of passes by about
+        `batch_size`. The batch is selected by FPS among the
+        `4 * batch_size` points with the largest Haussdorf distances, using
+        their pairwise distances, and the Haussdorf distances of all points
+        are then updated with the whole batch in a single pass. Cannot be
+        combined with `sketch_size` or lazy evaluation.
+        Stored in :py:attr:`self.batch_size`.
+
+        A point of the batch is the one exact FPS would select whenever its
+        Haussdorf distance at selection is at least the largest Haussdorf
+        distance outside the candidates. Otherwise, the farthest point can be
+        a non-candidate, whose distance to the batch is unknown, and the
+        selection departs from FPS: each selected point is still the farthest
+        among the candidates, but the covering radius of the selection (the
+        square root of the largest value of :py:func:`get_distance`, which
+        remains exact) can be larger than with exact FPS. As the selected
+        points and the farthest point are pairwise farther apart than the
+        square root of the smallest value of :py:func:`get_select_distance`
+        and :py:func:`get_distance`, half of it bounds from below the
+        covering radius of any selection of the same size, which bounds the
+        loss with respect to exact FPS.
+
+    distance_dtype: data-type, default=None
+        Data-type of the norms and Haussdorf distances, in which the squared
+        norms are accumulated and the scalar products subtracted from them.
+        If `None`, the dtype of X, so that float32 inputs are processed in
+        float32 end to end, which halves the memory and bandwidth of each
+        pass over X. With ``np.float64``, the scalar products of float32
+        inputs are still computed in float32, but the norms are accumulated
+        and the products subtracted in float64, which limits the round-off
+        for points much closer to each other than to the origin.
+        Stored in :py:attr:`self.distance_dtype`.
 
     """
 
-    def __init__(self, initialize=0, **kwargs):
+    def __init__(
+        self,
+        initialize=0,
+        block_size=None,
+        n_jobs=None,
+        sketch_size=None,
+        sketch_tolerance=None,
+        batch_size=None,
+        distance_dtype=None,
+        **kwargs,
+    ):
 
         self.initialize = initialize
+        self.block_size = block_size
+        self.n_jobs = n_jobs
+        self.sketch_size = sketch_size
+        self.sketch_tolerance = sketch_tolerance
+        self.batch_size = batch_size
+        self.distance_dtype = distance_dtype
 
         super().__init__(
             **kwargs,
@@ -863,6 +2009,13 @@ class _FPS(GreedySelector):
                      points. once a point is selected, the distance is not updated;
                      the final list will reflect the distances when selected.
 
+        The distances are only exact when the selection is neither lazy nor
+        sketched. With lazy evaluation, the points which were not re-scored
+        against the last selections keep their distance to the previous ones,
+        an upper bound, and with `sketch_size`, the points which were not
+        re-scored keep a distance estimated from the sketch. The largest value
+        is then not the covering radius of the selection, which can be computed
+        from X for sample selection as ``get_summary(X)["radius"].max()``.
         """
         return self.haussdorf_
 
@@ -880,6 +2033,264 @@ class _FPS(GreedySelector):
         mask = self.get_support(indices=True, ordered=True)
         return self.haussdorf_at_select_[mask]
 
+    def get_summary(self, X, indices=None):
+        """
+        Returns a compact summary of the selection made on X, from which the
+        selections made on disjoint partitions of a dataset can be merged into
+        a global selection with
+        :py:func:`skcosmo.sample_selection.merge_fps_summaries`, without
+        gathering the samples, e.g.
+
+        >>> summaries = [
+        ...     FPS(n_to_select=100).fit(X_part).get_summary(X_part, indices=idx_part)
+        ...     for X_part, idx_part in partitions
+        ... ]
+        >>> summary = merge_fps_summaries(summaries, n_to_select=100)
+
+        The summary only contains arrays, and can be pickled or saved with
+        ``np.savez(file, **summary)``.
+
+        Parameters
+        ----------
+        X : ndarray of shape (n_samples, n_features)
+            Samples on which the selector was fitted
+        indices : ndarray of shape (n_samples,), default=None
+            Global indices of the samples of X, e.g. their rows in the full
+            dataset. If `None`, the rows of X.
+
+        Returns
+        -------
+        summary : dict
+            with the global indices of the selected samples (`selected_idx`),
+            the selected samples (`X_selected`, sparse for sparse X), the
+            coverage radius of each selected sample (`radius`), i.e. the
+            largest Euclidean distance between a selected sample and the
+            samples of X closer to it than to the other selected samples, and
+            the number of samples of X (`n_samples`)
+
+        The distances are computed by blocks of samples that fit in the
+        ``working_memory`` of :py:func:`sklearn.set_config`.
+        """
+
+        if self.selection_type != "sample":
+            raise ValueError("Summaries are only available for sample selection.")
+
+        check_is_fitted(self, ["selected_idx_"])
+        X = check_array(X, accept_sparse="csr")
+
+        if self.store_selected:
+            X_selected = self.X_selected_[: len(self.selected_idx_)]
+        else:
+            X_selected = X[self.selected_idx_]
+        selected_norms = row_norms(X_selected, squared=True)
+
+        # each sample extends the radius of the closest selection, a block at
+        # a time to bound the memory of the distances and products to the
+        # working memory of scikit-learn, whatever the block size of the fit
+        block_size = get_chunk_n_rows(row_bytes=16 * X_selected.shape[0])
+        radius = np.zeros(X_selected.shape[0])
+        for block in _get_blocks(X.shape[0], block_size):
+            distances = (
+                row_norms(X[block], squared=True)[:, np.newaxis]
+                + selected_norms[np.newaxis]
+                - 2 * safe_sparse_dot(X[block], X_selected.T, dense_output=True)
+            )
+            closest = np.argmin(distances, axis=1)
+            min_distances = distances[np.arange(len(closest)), closest]
+            np.maximum.at(radius, closest, np.sqrt(np.maximum(min_distances, 0)))
+
+        selected_idx = self.selected_idx_
+        if indices is not None:
+            selected_idx = np.asarray(indices)[selected_idx]
+
+        return {
+            "selected_idx": np.array(selected_idx),
+            "X_selected": X_selected.copy(),
+            "radius": radius,
+            "n_samples": X.shape[0],
+        }
+
+    def partial_fit(self, X, y=None):
+        """
+        Updates the selection with a new batch of samples, such that the
+        selection can be made in a single pass over a stream of samples, e.g.
+
+        >>> selector = FPS(n_to_select=100)
+        >>> for X_batch in batches:
+        ...     selector.partial_fit(X_batch)
+
+        The selection is maintained with the doubling algorithm for the
+        incremental k-center problem [Charikar1997]_: samples farther than a
+        merge radius from all selections are selected, and when more than
+        `n_to_select` samples are selected, the merge radius is doubled and
+        the selections closer than the merge radius to a previous selection
+        are discarded. The cost per sample is linear in the number of
+        selections, and the memory is bounded by `n_to_select`, apart from
+        :py:attr:`support_`, a mask over the samples seen so far. The selected
+        samples can thus be taken from the concatenation of the batches with
+        :py:func:`transform`.
+
+        Contrary to :py:func:`fit`, the selections are not ordered by their
+        Haussdorf distance. The covering radius of the selection (the largest
+        distance between a sample and the closest selection) is guaranteed to
+        be at most 8 times the optimal one. The quality of the selection with
+        respect to the exact FPS (which is within a factor 2 of the optimal
+        one) is reported by :py:attr:`coverage_radius_`, an upper bound to the
+        covering radius of the streaming selection, and
+        :py:attr:`radius_lower_bound_`, a lower bound to the covering radius of
+        any selection of `n_to_select` samples, including exact FPS. Both are
+        expressed as (non-squared) Euclidean distances.
+
+        Parameters
+        ----------
+        X : ndarray of shape (n_batch_samples, n_features)
+            Batch of samples
+        y : ignored
+
+        Returns
+        -------
+        self : object
+        """
+
+        if self.selection_type != "sample":
+            raise ValueError("Streaming selection is only available for samples.")
+
+        if not isinstance(self.n_to_select, numbers.Integral) or self.n_to_select < 1:
+            raise ValueError(
+                "Streaming selection requires n_to_select to be a positive integer, "
+                f"got {self.n_to_select}."
+            )
+
+        X = check_array(X, dtype=[np.float64, np.float32], ensure_min_features=2)
+
+        if not hasattr(self, "n_seen_"):
+            self._axis = 0
+            self.n_seen_ = 0
+            self.n_selected_ = 0
+            self.radius_lower_bound_ = 0.0
+            self._merge_radius = 0.0
+
+            # one more slot than n_to_select for the selection that triggers a merge
+            self._stream_X = np.zeros((self.n_to_select + 1, X.shape[1]), X.dtype)
+            self._stream_norms = np.zeros(self.n_to_select + 1)
+            self._stream_idx = np.zeros(self.n_to_select + 1, int)
+            self._stream_radii = np.zeros(self.n_to_select + 1)
+
+        elif X.shape[1] != self._stream_X.shape[1]:
+            raise ValueError(
+                f"X has {X.shape[1]} features, but the previous batches "
+                f"had {self._stream_X.shape[1]} features."
+            )
+
+        norms = (X ** 2).sum(axis=1)
+
+        # samples within the merge radius of the current selections are only
+        # used to update the covering radius of their closest selection
+        if self.n_selected_ > 0:
+            distances = self._stream_distances(X, norms)
+            closest = np.argmin(distances, axis=1)
+            min_distances = distances[np.arange(len(X)), closest]
+            covered = min_distances <= self._merge_radius
+            np.maximum.at(self._stream_radii, closest[covered], min_distances[covered])
+        else:
+            covered = np.zeros(len(X), dtype=bool)
+
+        for i in np.where(~covered)[0]:
+            self._stream_sample(X[i], norms[i], self.n_seen_ + i)
+
+        self.n_seen_ += len(X)
+        if self.store_selected:
+            self.X_selected_ = self._stream_X[: self.n_selected_]
+        self.selected_idx_ = self._stream_idx[: self.n_selected_]
+        self.coverage_radius_ = self._stream_radii[: self.n_selected_].max()
+
+        # the selections index the concatenation of the batches seen so far
+        self.support_ = np.full(self.n_seen_, False)
+        self.support_[self.selected_idx_] = True
+
+        return self
+
+    def _stream_distances(self, X, norms):
+        """Euclidean distances between the samples in X and the selections"""
+        squared_distances = (
+            norms[:, np.newaxis]
+            + self._stream_norms[np.newaxis, : self.n_selected_]
+            - 2 * X @ self._stream_X[: self.n_selected_].T
+        )
+        return np.sqrt(np.maximum(squared_distances, 0))
+
+    def _stream_sample(self, x, norm, idx):
+        """Covers the sample x with a previous selection, or selects it"""
+
+        if self.n_selected_ > 0:
+            distances = self._stream_distances(x[np.newaxis], np.array([norm]))[0]
+            closest = np.argmin(distances)
+            if distances[closest] <= self._merge_radius:
+                self._stream_radii[closest] = max(
+                    self._stream_radii[closest], distances[closest]
+                )
+                return
+
+        self._stream_X[self.n_selected_] = x
+        self._stream_norms[self.n_selected_] = norm
+        self._stream_idx[self.n_selected_] = idx
+        self._stream_radii[self.n_selected_] = 0.0
+        self.n_selected_ += 1
+
+        if self.n_selected_ > self.n_to_select:
+            self._stream_merge()
+
+    def _stream_merge(self):
+        """
+        Doubles the merge radius and merges the selections closer than the
+        merge radius, until at most n_to_select selections remain.
+        """
+
+        distances = self._stream_distances(
+            self._stream_X[: self.n_selected_], self._stream_norms[: self.n_selected_]
+        )
+        np.fill_diagonal(distances, np.inf)
+        min_distance = distances.min()
+
+        # n_to_select + 1 samples at least `min_distance` apart cannot be covered
+        # by n_to_select selections with a radius smaller than min_distance / 2
+        self.radius_lower_bound_ = max(self.radius_lower_bound_, min_distance / 2)
+        self._merge_radius = max(2 * self._merge_radius, min_distance)
+
+        kept = np.arange(self.n_selected_)
+        while True:
+            new_kept = []
+            for i in kept:
+                if len(new_kept) > 0:
+                    j = new_kept[np.argmin(distances[i, new_kept])]
+                    if distances[i, j] <= self._merge_radius:
+                        # samples covered by i are covered by j within this radius
+                        self._stream_radii[j] = max(
+                            self._stream_radii[j],
+                            distances[i, j] + self._stream_radii[i],
+                        )
+                        continue
+                new_kept.append(i)
+            kept = np.array(new_kept)
+
+            if len(kept) <= self.n_to_select:
+                break
+
+            # the kept selections are all farther apart than the merge radius
+            self.radius_lower_bound_ = max(
+                self.radius_lower_bound_, self._merge_radius / 2
+            )
+            self._merge_radius *= 2
+
+        self.n_selected_ = len(kept)
+        for buffer in [
+            self._stream_X,
+            self._stream_norms,
+            self._stream_idx,
+            self._stream_radii,
+        ]:
+            buffer[: self.n_selected_] = buffer[kept]
+
     def _init_greedy_search(self, X, y, n_to_select):
         """
         Initializes the search. Prepares an array to store the selections,
@@ -887,9 +2298,43 @@ class _FPS(GreedySelector):
         computes the starting haussdorf distances.
         """
 
+        # a fit starts over, so drop the state of any previous streaming selection
+        for attr in [
+            "n_seen_",
+            "coverage_radius_",
+            "radius_lower_bound_",
+            "_merge_radius",
+            "_stream_X",
+            "_stream_norms",
+            "_stream_idx",
+            "_stream_radii",
+        ]:
+            if hasattr(self, attr):
+                delattr(self, attr)
+
         super()._init_greedy_search(X, y, n_to_select)
 
-        self.norms_ = (X ** 2).sum(axis=abs(self._axis - 1))
+        self._n_workers = effective_n_jobs(self.n_jobs)
+        self._executor = _get_executor(self._n_workers)
+        self._next_selection = None
+        self._distance_dtype = _get_distance_dtype(self.distance_dtype, X)
+
+        if scipy.sparse.issparse(X):
+            # only the nonzero entries are squared, so that X is never densified
+            self.norms_ = np.asarray(
+                X.power(2).sum(axis=abs(self._axis - 1), dtype=self._distance_dtype)
+            ).ravel()
+        elif self.block_size is None:
+            self.norms_ = (X ** 2).sum(
+                axis=abs(self._axis - 1), dtype=self._distance_dtype
+            )
+        else:
+            # norms are accumulated block-by-block to avoid a temporary copy of X
+            self.norms_ = np.zeros(X.shape[self._axis], self._distance_dtype)
+            for block in _get_blocks(X.shape[self._axis], self.block_size):
+                self.norms_[block] = (self._take_block(X, block) ** 2).sum(
+                    axis=abs(self._axis - 1), dtype=self._distance_dtype
+                )
 
         if self.initialize == "random":
             random_state = check_random_state(self.random_state)
@@ -899,28 +2344,337 @@ class _FPS(GreedySelector):
         else:
             raise ValueError("Invalid value of the initialize parameter")
 
+        if self.sketch_size is not None:
+            if self.lazy:
+                raise ValueError("sketch_size cannot be combined with lazy evaluation.")
+            self._init_sketch(X)
+
+        if self.batch_size is not None:
+            if not isinstance(self.batch_size, numbers.Integral) or self.batch_size < 1:
+                raise ValueError(
+                    f"batch_size should be a positive integer, got {self.batch_size}."
+                )
+            if self.lazy or self.sketch_size is not None:
+                raise ValueError(
+                    "batch_size cannot be combined with sketch_size or lazy evaluation."
+                )
+        self._batch = []
+
         self.selected_idx_[0] = initialize
-        self.haussdorf_ = np.full(X.shape[self._axis], np.inf)
-        self.haussdorf_at_select_ = np.full(X.shape[self._axis], np.inf)
+        self.haussdorf_ = np.full(X.shape[self._axis], np.inf, self._distance_dtype)
+        self.haussdorf_at_select_ = np.full(
+            X.shape[self._axis], np.inf, self._distance_dtype
+        )
+
+        if self.lazy:
+            # the Haussdorf distances are re-scored in place, and are upper
+            # bounds for the candidates which have not been re-scored
+            self._exact_haussdorf = self.haussdorf_
+            self._n_exact = np.zeros(X.shape[self._axis], dtype=int)
+
         self._update_post_selection(X, y, self.selected_idx_[0])
 
+    def _continue_greedy_search(self, X, y, n_to_select):
+        """Continues the search. Prepares an array to store the selections."""
+
+        super()._continue_greedy_search(X, y, n_to_select)
+
+        self._n_workers = effective_n_jobs(self.n_jobs)
+        self._executor = _get_executor(self._n_workers)
+
+        self._batch = []
+
+        if self.lazy and getattr(self, "_exact_haussdorf", None) is not self.haussdorf_:
+            # the previous fit updated all the distances
+            self._exact_haussdorf = self.haussdorf_
+            self._n_exact = np.full(X.shape[self._axis], self.n_selected_)
+
+    def _init_sketch(self, X):
+        """
+        Projects the samples (or features) onto `sketch_size` random
+        directions, and prepares the Haussdorf distances computed in full
+        dimension, which are only updated for the re-scored candidates.
+        """
+
+        if not isinstance(self.sketch_size, numbers.Integral) or self.sketch_size < 1:
+            raise ValueError(
+                f"sketch_size should be a positive integer, got {self.sketch_size}."
+            )
+
+        projection = SparseRandomProjection(
+            n_components=self.sketch_size,
+            dense_output=True,
+            random_state=self.random_state,
+        )
+
+        # the candidates are re-scored a block at a time
+        self._sketch_chunk_size = 64 if self.block_size is None else self.block_size
+
+        # the sketch has one row per sample (or feature)
+        self._sketch = projection.fit_transform(X.T if self._axis == 1 else X).astype(
+            X.dtype, copy=False
+        )
+        self._sketch_norms = (self._sketch ** 2).sum(axis=1, dtype=self._distance_dtype)
+
+        # Haussdorf distances computed in full dimension, to the first
+        # `_n_exact` selections
+        self._exact_haussdorf = np.full(
+            X.shape[self._axis], np.inf, self._distance_dtype
+        )
+        self._n_exact = np.zeros(X.shape[self._axis], dtype=int)
+
+    def _get_full_distances(self, X, last_selected):
+        """Distances of all points to the new point, in full dimension"""
+        if scipy.sparse.issparse(X):
+            x_last = self._take_dense(X, [last_selected])[:, 0]
+            return (
+                self.norms_
+                + self.norms_[last_selected]
+                - 2 * self._get_products(X, x_last)
+            )
+        elif self._axis == 1:
+            return (
+                self.norms_ + self.norms_[last_selected] - 2 * X[:, last_selected].T @ X
+            )
+        else:
+            return self.norms_ + self.norms_[last_selected] - 2 * X[last_selected] @ X.T
+
+    def _take_block(self, X, block):
+        """Returns a view of the samples or features of X in the slice `block`"""
+        if self._axis == 1:
+            return X[:, block]
+        else:
+            return X[block]
+
+    def _take_dense(self, X, indices):
+        """
+        Returns a dense copy of the samples or features `indices` of X, one per
+        column, whose scalar products with a block of X are given by
+        :py:func:`_get_products`
+        """
+        points = self._take_block(X, indices)
+        if scipy.sparse.issparse(points):
+            points = points.toarray()
+        else:
+            points = np.array(points)
+
+        return points if self._axis == 1 else points.T
+
+    def _get_products(self, X_block, points):
+        """
+        Scalar products of the samples or features of `X_block` with the dense
+        `points`, one per column, as sparse-dense products for sparse X
+        """
+        if self._axis == 1:
+            return X_block.T @ points
+        else:
+            return X_block @ points
+
     def _update_haussdorf(self, X, y, last_selected):
 
+        if self.batch_size is not None and self.n_selected_ > 0:
+            # the distances to the batch were updated when it was selected
+            return
+
         self.haussdorf_at_select_[last_selected] = self.haussdorf_[last_selected]
 
-        # distances of all points to the new point
-        if self._axis == 1:
-            new_dist = (
-                self.norms_ + self.norms_[last_selected] - 2 * X[:, last_selected].T @ X
+        if self.lazy and self.n_selected_ > 0:
+            # the distances to the new point are only computed for the
+            # candidates which reach the top of the heap
+            self.haussdorf_[last_selected] = 0.0
+            return
+
+        if self.sketch_size is not None:
+            self._update_sketched_haussdorf(X, last_selected)
+
+        elif self.block_size is None and self._executor is None:
+            self._next_selection = None
+
+            # update in-place the Haussdorf distance list
+            np.minimum(
+                self.haussdorf_,
+                self._get_full_distances(X, last_selected),
+                self.haussdorf_,
             )
+
         else:
-            new_dist = (
-                self.norms_ + self.norms_[last_selected] - 2 * X[last_selected] @ X.T
+            x_last = self._take_dense(X, [last_selected])[:, 0]
+
+            # distances of the points in each block to the new point, so that
+            # only one block of X has to be loaded in memory at a time
+            def get_distances(block):
+                products = self._get_products(self._take_block(X, block), x_last)
+                return self.norms_[block] + self.norms_[last_selected] - 2 * products
+
+            shards = _get_blocks(X.shape[self._axis], self.block_size, self._n_workers)
+            self._next_selection = _sharded_minimum(
+                self.haussdorf_, get_distances, shards, self._executor
             )
 
-        # update in-place the Haussdorf distance list
+        if self.lazy:
+            # the distances to the first selection are computed for all points
+            self._n_exact[:] = 1
+            self._next_selection = None
+
+    def _select_batch(self, X):
+        """
+        Selects the next batch of points among the candidates with the largest
+        Haussdorf distances, and updates the Haussdorf distances of all points
+        with the distances to the batch, in a single pass over X.
+        """
+
+        def get_pairwise(candidates):
+            X_candidates = self._take_dense(X, candidates)
+            products = X_candidates.T @ X_candidates
+
+            norms = self.norms_[candidates]
+            return norms[:, np.newaxis] + norms[np.newaxis] - 2 * products
+
+        n_batch = min(self.batch_size, len(self.selected_idx_) - self.n_selected_)
+        batch, at_select = _get_far_apart_batch(
+            self.haussdorf_,
+            get_pairwise,
+            n_batch,
+            4 * self.batch_size,
+            self.score_threshold,
+        )
+        if len(batch) == 0:
+            return
+
+        self.haussdorf_at_select_[batch] = at_select
+        X_batch = self._take_dense(X, batch)
+
+        def get_distances(block):
+            products = self._get_products(self._take_block(X, block), X_batch)
+            distances = (
+                self.norms_[block, np.newaxis]
+                + self.norms_[np.newaxis, batch]
+                - 2 * products
+            )
+            return distances.min(axis=1)
+
+        shards = _get_blocks(X.shape[self._axis], self.block_size, self._n_workers)
+        _sharded_minimum(self.haussdorf_, get_distances, shards, self._executor)
+
+        self._batch = list(batch)
+
+    def _update_sketched_haussdorf(self, X, last_selected):
+        """
+        Updates the Haussdorf distances with the sketched distances to the new
+        point, then finds the farthest point by re-scoring the candidates in
+        full dimension, in decreasing order of an upper bound to their
+        Haussdorf distance, until no remaining candidate can be farther than
+        the farthest re-scored one.
+
+        The upper bound is the smaller of the Haussdorf distance to the
+        selections a candidate was last re-scored against, and the sketched
+        Haussdorf distance divided by :math:`1 - \\epsilon`.
+        """
+
+        new_dist = (
+            self._sketch_norms
+            + self._sketch_norms[last_selected]
+            - 2 * self._sketch @ self._sketch[last_selected]
+        )
         np.minimum(self.haussdorf_, new_dist, self.haussdorf_)
 
+        selected = np.append(self.selected_idx_[: self.n_selected_], last_selected)
+
+        if self.n_selected_ == 0:
+            # the distances to the first selection are computed in full, which
+            # gives an estimate of the error of the sketch
+            self._exact_haussdorf = self._get_full_distances(X, last_selected)
+            self._n_exact[:] = 1
+
+            if self.sketch_tolerance is None:
+                # the distance of the selection to itself is only round-off
+                nonzero = self._exact_haussdorf > 0
+                nonzero[last_selected] = False
+                self.sketch_tolerance_ = np.max(
+                    np.abs(new_dist[nonzero] / self._exact_haussdorf[nonzero] - 1),
+                    initial=0.0,
+                )
+            else:
+                self.sketch_tolerance_ = self.sketch_tolerance
+
+        if self.sketch_tolerance_ < 1:
+            upper_bound = np.minimum(
+                self._exact_haussdorf, self.haussdorf_ / (1 - self.sketch_tolerance_)
+            )
+        else:
+            upper_bound = self._exact_haussdorf.copy()
+
+        # the selections are already at distance zero
+        upper_bound[selected] = -np.inf
+
+        order = np.argsort(-upper_bound)
+        best, best_distance = None, -np.inf
+        for start in range(0, len(order), self._sketch_chunk_size):
+            chunk = order[start : start + self._sketch_chunk_size]
+            if upper_bound[chunk[0]] <= best_distance:
+                break
+
+            self._rescore(X, chunk, last_selected)
+            self.haussdorf_[chunk] = self._exact_haussdorf[chunk]
+
+            chunk_best = chunk[np.argmax(self._exact_haussdorf[chunk])]
+            if self._exact_haussdorf[chunk_best] > best_distance:
+                best, best_distance = chunk_best, self._exact_haussdorf[chunk_best]
+
+        self._next_selection = best
+
+    def _rescore(self, X, candidates, last_selected=None):
+        """
+        Updates the Haussdorf distances of the candidates, in full dimension,
+        with the selections made since they were last re-scored, including
+        `last_selected` if it is not stored yet.
+        """
+
+        selected = self.selected_idx_[: self.n_selected_]
+        if last_selected is not None:
+            selected = np.append(selected, last_selected)
+            x_last = self._take_dense(X, [last_selected])[:, 0]
+
+        n_exact = self._n_exact[candidates]
+        for n in np.unique(n_exact[n_exact < len(selected)]):
+            group = candidates[n_exact == n]
+            X_group = self._take_block(X, group)
+
+            # the previous selections are read from X_selected_, which is only
+            # filled at the end of the selection for sparse X, and not at all
+            # in index-only mode
+            if scipy.sparse.issparse(X) or not self.store_selected:
+                X_previous = self._take_dense(X, selected[n : self.n_selected_])
+            elif self._axis == 1:
+                X_previous = self.X_selected_[:, n : self.n_selected_]
+            else:
+                X_previous = self.X_selected_[n : self.n_selected_].T
+
+            products = [self._get_products(X_group, X_previous)]
+            if last_selected is not None:
+                products.append(self._get_products(X_group, x_last))
+
+            distances = (
+                self.norms_[group, np.newaxis]
+                + self.norms_[np.newaxis, selected[n:]]
+                - 2 * np.column_stack(products)
+            )
+            self._exact_haussdorf[group] = np.minimum(
+                self._exact_haussdorf[group], distances.min(axis=1)
+            )
+
+        self._n_exact[candidates] = len(selected)
+
+    _monotone_score = True
+
+    def _score_candidates(self, X, y, candidates):
+        """
+        Re-scores the Haussdorf distances of the candidates, against the
+        selections made since they were last re-scored
+        """
+        self._rescore(X, candidates)
+        return self.haussdorf_[candidates]
+
     def _update_post_selection(self, X, y, last_selected):
         """
         Saves the most recent selections, increments the counter,
@@ -930,7 +2684,7 @@ class _FPS(GreedySelector):
         super()._update_post_selection(X, y, last_selected)
 
 
-class _PCovFPS(GreedySelector):
+class _PCovFPS(_BaseFPS):
     """
     Transformer that performs Greedy Selection using PCovR-weighted
     Farthest Point Sampling.
@@ -950,9 +2704,42 @@ class _PCovFPS(GreedySelector):
         Index of the first selection. If 'random', picks a random
         value when fit starts.
 
+    n_jobs: int, default=None
+        Number of threads among which the candidates are sharded when updating
+        the Haussdorf distances. Each thread updates the distances of its
+        shard in-place and only reports back its local maximum.
+        ``None`` means 1 unless in a :obj:`joblib.parallel_backend` context,
+        ``-1`` means using all processors.
+
+    feature_map: bool, default=False
+        For sample selection, whether to compute the distances from the
+        explicit feature map :math:`[\\sqrt{\\alpha}\\mathbf{X},
+        \\sqrt{1 - \\alpha}\\mathbf{Y}]`, whose Gram matrix is the linear
+        PCovR kernel, instead of storing the kernel itself. The memory then
+        scales as :math:`n_{samples} \\times (n_{features} + n_{properties})`
+        rather than :math:`n_{samples}^2`. A 1-D `y` is taken as a single
+        property, so that the selection is the one made from the kernel with
+        ``y.reshape(-1, 1)``. Ignored for feature selection.
+
+    batch_size: int, default=None
+        If not `None`, up to `batch_size` points are selected per update of
+        the Haussdorf distances instead of one, by FPS among the
+        `4 * batch_size` points with the largest Haussdorf distances. The
+        selection departs from PCov-FPS when a point outside these candidates
+        becomes the farthest, as described for
+        :py:class:`skcosmo._selection._FPS`.
+
     """
 
-    def __init__(self, mixing=0.5, initialize=0, **kwargs):
+    def __init__(
+        self,
+        mixing=0.5,
+        initialize=0,
+        n_jobs=None,
+        feature_map=False,
+        batch_size=None,
+        **kwargs,
+    ):
 
         if mixing == 1.0:
             raise ValueError(
@@ -962,6 +2749,9 @@ class _PCovFPS(GreedySelector):
 
         self.mixing = mixing
         self.initialize = initialize
+        self.n_jobs = n_jobs
+        self.feature_map = feature_map
+        self.batch_size = batch_size
 
         super().__init__(
             **kwargs,
@@ -1023,12 +2813,24 @@ class _PCovFPS(GreedySelector):
 
         super()._init_greedy_search(X, y, n_to_select)
 
+        self._n_workers = effective_n_jobs(self.n_jobs)
+        self._executor = _get_executor(self._n_workers)
+        self._next_selection = None
+
         if self._axis == 1:
             self.pcovr_distance_ = pcovr_covariance(mixing=self.mixing, X=X, Y=y)
+            self.norms_ = np.diag(self.pcovr_distance_)
+        elif self.feature_map:
+            self.pcovr_map_ = np.hstack(
+                [
+                    np.sqrt(self.mixing) * X,
+                    np.sqrt(1 - self.mixing) * y.reshape(X.shape[0], -1),
+                ]
+            )
+            self.norms_ = (self.pcovr_map_ ** 2).sum(axis=1)
         else:
             self.pcovr_distance_ = pcovr_kernel(mixing=self.mixing, X=X, Y=y)
-
-        self.norms_ = np.diag(self.pcovr_distance_)
+            self.norms_ = np.diag(self.pcovr_distance_)
 
         if self.initialize == "random":
             random_state = check_random_state(self.random_state)
@@ -1038,24 +2840,117 @@ class _PCovFPS(GreedySelector):
         else:
             raise ValueError("Invalid value of the initialize parameter")
 
+        if self.batch_size is not None and (
+            not isinstance(self.batch_size, numbers.Integral) or self.batch_size < 1
+        ):
+            raise ValueError(
+                f"batch_size should be a positive integer, got {self.batch_size}."
+            )
+        self._batch = []
+
         self.selected_idx_[0] = initialize
         self.haussdorf_ = np.full(X.shape[self._axis], np.inf)
         self.haussdorf_at_select_ = np.full(X.shape[self._axis], np.inf)
         self._update_post_selection(X, y, self.selected_idx_[0])
 
+    def _continue_greedy_search(self, X, y, n_to_select):
+        """Continues the search. Prepares an array to store the selections."""
+
+        super()._continue_greedy_search(X, y, n_to_select)
+
+        self._n_workers = effective_n_jobs(self.n_jobs)
+        self._executor = _get_executor(self._n_workers)
+        self._batch = []
+
     def _update_haussdorf(self, X, y, last_selected):
 
+        if self.batch_size is not None and self.n_selected_ > 0:
+            # the distances to the batch were updated when it was selected
+            return
+
         self.haussdorf_at_select_[last_selected] = self.haussdorf_[last_selected]
 
-        # distances of all points to the new point
-        new_dist = (
-            self.norms_
-            + self.norms_[last_selected]
-            - 2 * np.take(self.pcovr_distance_, last_selected, axis=self._axis)
+        if self._executor is None:
+            self._next_selection = None
+
+            # distances of all points to the new point
+            new_dist = (
+                self.norms_
+                + self.norms_[last_selected]
+                - 2 * self._get_products(last_selected)
+            )
+
+            # update in-place the Haussdorf distance list
+            np.minimum(self.haussdorf_, new_dist, self.haussdorf_)
+
+        else:
+
+            def get_distances(shard):
+                return (
+                    self.norms_[shard]
+                    + self.norms_[last_selected]
+                    - 2 * self._get_products(last_selected, shard)
+                )
+
+            shards = _get_blocks(len(self.haussdorf_), n_workers=self._n_workers)
+            self._next_selection = _sharded_minimum(
+                self.haussdorf_, get_distances, shards, self._executor
+            )
+
+    def _select_batch(self, X):
+        """
+        Selects the next batch of points among the candidates with the largest
+        Haussdorf distances, and updates the Haussdorf distances of all points
+        with the distances to the batch at once.
+        """
+
+        def get_distances(batch, shard):
+            if self._axis == 0 and self.feature_map:
+                products = self.pcovr_map_[shard] @ self.pcovr_map_[batch].T
+            else:
+                products = self.pcovr_distance_[batch][:, shard].T
+
+            return (
+                self.norms_[shard, np.newaxis]
+                + self.norms_[np.newaxis, batch]
+                - 2 * products
+            )
+
+        n_batch = min(self.batch_size, len(self.selected_idx_) - self.n_selected_)
+        batch, at_select = _get_far_apart_batch(
+            self.haussdorf_,
+            lambda candidates: get_distances(candidates, candidates),
+            n_batch,
+            4 * self.batch_size,
+            self.score_threshold,
         )
+        if len(batch) == 0:
+            return
 
-        # update in-place the Haussdorf distance list
-        np.minimum(self.haussdorf_, new_dist, self.haussdorf_)
+        self.haussdorf_at_select_[batch] = at_select
+
+        shards = _get_blocks(len(self.haussdorf_), n_workers=self._n_workers)
+        _sharded_minimum(
+            self.haussdorf_,
+            lambda shard: get_distances(batch, shard).min(axis=1),
+            shards,
+            self._executor,
+        )
+
+        self._batch = list(batch)
+
+    def _get_products(self, last_selected, shard=slice(None)):
+        """
+        Returns the PCovR scalar products of the points in `shard` with the last
+        selection, read from the modified covariance or kernel, or computed
+        from the explicit feature map when `feature_map` is set.
+        """
+        if self._axis == 0 and self.feature_map:
+            return self.pcovr_map_[shard] @ self.pcovr_map_[last_selected]
+
+        # the modified covariance and kernel are symmetric, so the
+        # products can be read from the row of the last selection
+        return self.pcovr_distance_[last_selected, shard]
 
     def _update_post_selection(self, X, y, last_selected):
         """
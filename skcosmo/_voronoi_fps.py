@@ -0,0 +1,647 @@
+import json
+import numbers
+import os
+import warnings
+from time import time
+
+import numpy as np
+from sklearn.metrics import pairwise_distances
+from sklearn.utils import check_random_state
+from threadpoolctl import threadpool_info
+
+from ._selection import (
+    GreedySelector,
+    _get_distance_dtype,
+)
+
+_DEFAULT_FULL_FRACTION = 0.25
+# switching point used by the fits which find no calibration for their data
+
+_CALIBRATION_SIZE = 2 ** 22
+# largest size in bytes of the random matrix timed by the calibration
+
+_MISSING_CALIBRATIONS = set()
+# keys of the switching points found missing, which are only warned about once
+
+
+def _get_calibration_path(cache_dir=None):
+    """
+    Returns the file in which the switching points of VoronoiFPS are cached,
+    in `cache_dir`, the `SKCOSMO_CACHE_DIR` environment variable, or
+    ``~/.cache/skcosmo``.
+    """
+    if cache_dir is None:
+        cache_dir = os.environ.get(
+            "SKCOSMO_CACHE_DIR",
+            os.path.join(os.path.expanduser("~"), ".cache", "skcosmo"),
+        )
+    return os.path.join(cache_dir, "voronoi_fps_calibration.json")
+
+
+def _get_calibration_key(n_features, dtype):
+    """
+    Returns the key of a switching point in the calibration cache, made of
+    the dtype, the number of features rounded up to a power of two, and the
+    BLAS libraries with their number of threads.
+    """
+    n_features = 2 ** int(np.ceil(np.log2(max(n_features, 1))))
+    blas = sorted(
+        f"{info['internal_api']}-{info.get('version')}-{info['num_threads']}"
+        for info in threadpool_info()
+        if info["user_api"] == "blas"
+    )
+    return f"{np.dtype(dtype).name}-{n_features}-{'+'.join(blas)}"
+
+
+def _load_calibration(path):
+    """Reads the cached switching points, or returns an empty cache"""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _measure_full_fraction(X, n_trial_calculation, random_state=0):
+    """
+    Finds by bisection the fraction of the rows of X above which computing the
+    distances to a subset of rows (which requires gathering them) takes longer
+    than computing the distances to all of them.
+    """
+    simple_fps_timing = -time()
+    for i in range(n_trial_calculation):
+        _ = X @ X[0]
+    simple_fps_timing += time()
+    simple_fps_timing /= n_trial_calculation
+
+    random_state = check_random_state(random_state)
+
+    lower_fraction = 0
+    top_fraction = 1
+    while top_fraction - lower_fraction > 0.01:
+        voronoi_fps_times = np.zeros(n_trial_calculation)
+        full_fraction = (top_fraction + lower_fraction) / 2
+        for i in range(n_trial_calculation):
+            sel = random_state.randint(
+                X.shape[0],
+                size=int(X.shape[0] * full_fraction),
+            )
+            voronoi_fps_times[i] = -time()
+            _ = X[sel] @ X[0]
+            voronoi_fps_times[i] += time()
+        voronoi_fps_timing = np.sum(voronoi_fps_times)
+        voronoi_fps_timing /= n_trial_calculation
+        if voronoi_fps_timing < simple_fps_timing:
+            lower_fraction = full_fraction
+        else:
+            top_fraction = full_fraction
+
+    return lower_fraction
+
+
+def calibrate_voronoi_fps(
+    n_features,
+    dtype=np.float64,
+    n_samples=None,
+    n_trial_calculation=4,
+    cache_dir=None,
+):
+    """
+    Measures the switching point between the pruned and the full updates of
+    :py:class:`VoronoiFPS` on this machine, for the Euclidean metric, and
+    caches it on disk. The switching point is stored for the given dtype,
+    the number of features rounded up to a power of two, and the current
+    BLAS configuration, and is then used by all the fits with
+    ``full_fraction=None`` matching these, which start without any timing.
+    The timings are made on a fixed random matrix of shape
+    ``(n_samples, n_features)``, with the number of features rounded up to
+    a power of two.
+
+    Parameters
+    ----------
+    n_features: int
+        Number of features of the data the selections will be made from.
+
+    dtype: data-type, default=np.float64
+        Data type of the data the selections will be made from.
+
+    n_samples: int, default=None
+        Number of samples of the matrix used for the timings. If None, at most
+        10000, so that the matrix takes at most 4 MB.
+
+    n_trial_calculation: int, default=4
+        Number of timings averaged for each tested switching point.
+
+    cache_dir: str, default=None
+        Directory of the cache. If None, the `SKCOSMO_CACHE_DIR` environment
+        variable, or ``~/.cache/skcosmo``.
+
+    Returns
+    -------
+    full_fraction: float
+        The switching point which has been cached.
+    """
+
+    if not isinstance(n_trial_calculation, numbers.Integral):
+        raise TypeError("Number of trial calculation should be integer")
+    if n_trial_calculation < 1:
+        raise ValueError("Number of trial calculation should be more or equal to 1")
+
+    key = _get_calibration_key(n_features, dtype)
+    n_features = int(key.split("-")[1])
+    if n_samples is None:
+        n_samples = _CALIBRATION_SIZE // (n_features * np.dtype(dtype).itemsize)
+        n_samples = min(max(n_samples, 16), 10000)
+    X = check_random_state(0).uniform(-1, 1, size=(n_samples, n_features))
+
+    full_fraction = _measure_full_fraction(X.astype(dtype), n_trial_calculation)
+
+    path = _get_calibration_path(cache_dir)
+    calibration = _load_calibration(path)
+    calibration[key] = full_fraction
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(calibration, f, indent=2, sort_keys=True)
+
+    return full_fraction
+
+
+class _VoronoiFPS(GreedySelector):
+    """
+    In FPS, points are selected based upon their Hausdorff distance to
+    previous selections, i.e. the minimum distance between a given point and
+    any previously selected points. This implicitly constructs a Voronoi
+    tessellation which is updated with each new selection, as each unselected
+    point "belongs" to the Voronoi polyhedron of the nearest previous selection.
+
+    This implicit tessellation enabled a more efficient evaluation of the FPS --
+    at each iteration, we need only consider for selection those points at the
+    boundaries of the Voronoi polyhedra, and when updating the tessellation
+    we need only consider moving those points whose Hausdorff distance is
+    greater than half of the distance between the corresponding Voronoi center
+    and the newly selected point, per the triangle equality.
+
+    .. image:: VoronoiFPS-Schematic.pdf
+
+    To demonstrate the algorithm behind Voronoi FPS, let :math:`*_{m+1}` be a new chosen point,
+    :math:`v(j)` was chosen earlier, :math:`j` is a point in the polyhedron with center
+    :math:`v(j)`. From the inequalities of the triangle one can easily see that if
+    :math:`d(v(j),j)<d(*_{m+1}, j)/2`, then point :math:`j` is guaranteed not to fall
+    into the formed polyhedron and the distance to it can be uncalculated.
+
+    This algorithm is particularly appealing when using a non-Euclidean or
+    computationally-intensive distance metric, for which the
+    decrease in computational time due to the reduction in distance
+    calculations outweighs the increase from book-keeping. For simple
+    metrics (such as Euclidean distance), VoronoiFPS will likely not
+    accelerate, and may decelerate, computations when compared
+    to FPS.
+
+    **WARNING**: This base class should never be directly instantiated.
+    Instead, use :py:class:`skcosmo.feature_selection.VoronoiFPS` and
+    :py:class:`skcosmo.sample_selection.VoronoiFPS`,
+    which have the same constructor signature. For feature selection, the
+    columns of X are accessed in place, which is most efficient for
+    Fortran-ordered inputs.
+
+    Parameters
+    ----------
+
+    n_trial_calculation: integer, default="deprecated"
+        Deprecated and ignored, as the fit does not measure the switching point
+        between Voronoi FPS and traditional FPS itself anymore (for detail look
+        at full_fraction). Pass it to :py:func:`calibrate_voronoi_fps` instead.
+
+    full_fraction: float, default=None
+        Proportion of calculated distances from the total number of features at
+        which the switch from Voronoi FPS to FPS occurs.
+        At a certain number of distances to be calculated,
+        the use of Voronoi FPS becomes unreasonably expensive due to the associated
+        costs connected with reading data from the memory. The switching point
+        depends on many conditions, and it is determined once per machine with a
+        few test calculations and memory operations by
+        :py:func:`calibrate_voronoi_fps`, which caches it on disk for the
+        dtype and number of features of the data and the BLAS configuration.
+        If no matching switching point has been cached, a default switching
+        point of 0.25 is used, with a warning at the first such fit. For metrics other than
+        "euclidean", the default switching point is 1, as their cost is
+        dominated by the number of distances. The switching point used by the
+        fit is stored in :py:attr:`full_fraction_`.
+
+    metric: str or callable, default="euclidean"
+        The distance between samples (features). If "euclidean", the squared
+        Euclidean distance is computed from the norms and scalar products of the
+        samples (features), as in :py:class:`skcosmo.sample_selection.FPS`. Any
+        other string is passed as the metric of
+        :py:func:`sklearn.metrics.pairwise_distances`. If callable, it is called
+        as ``metric(X, i, indices)`` and must return the distances between the
+        sample (feature) `i` and each of the samples (features) `indices` as an
+        array of shape ``(len(indices),)``, so that only the distances to the
+        points that might change cell are computed. The pruning of
+        the Voronoi cells relies on the triangle inequality, so the selection
+        only matches that of a plain FPS for true metrics.
+
+    distance_dtype: data-type, default=None
+        Data-type of the norms, Haussdorf distances and cell radii. If `None`,
+        the dtype of X, so that float32 inputs are processed in float32 end to
+        end. ``np.float64`` accumulates the norms and the subtraction of the
+        scalar products in float64, as in
+        :py:class:`skcosmo.sample_selection.FPS`.
+    """
+
+    def __init__(
+        self,
+        n_trial_calculation="deprecated",
+        full_fraction=None,
+        initialize=0,
+        metric="euclidean",
+        distance_dtype=None,
+        **kwargs,
+    ):
+
+        self.n_trial_calculation = n_trial_calculation
+        self.full_fraction = full_fraction
+        self.initialize = initialize
+        self.metric = metric
+        self.distance_dtype = distance_dtype
+        super().__init__(**kwargs)
+
+    def score(self, X=None, y=None):
+        """
+        Returns the Haussdorf distances of all samples to previous selections
+
+        NOTE: This function does not compute the importance score each time it
+        is called, in order to avoid unnecessary computations. The haussdorf
+        distance is updated in :py:func:`self._update_post_selection`
+
+        Parameters
+        ----------
+        X : ignored
+        y : ignored
+
+        Returns
+        -------
+        haussdorf : Haussdorf distances
+        """
+        return self.haussdorf_
+
+    def get_distance(self):
+        """
+
+        Traditional FPS employs a column-wise Euclidean
+        distance for feature selection, which can be expressed using the covariance matrix
+        :math:`\\mathbf{C} = \\mathbf{X} ^ T \\mathbf{X}`
+
+        .. math::
+            \\operatorname{d}_c(i, j) = C_{ii} - 2 C_{ij} + C_{jj}.
+
+        For sample selection, this is a row-wise Euclidean distance, which can
+        be expressed in terms of the Gram matrix :math:`\\mathbf{K} = \\mathbf{X} \\mathbf{X} ^ T`
+
+        .. math::
+            \\operatorname{d}_r(i, j) = K_{ii} - 2 K_{ij} + K_{jj}.
+
+        Returns
+        -------
+
+        haussdorf : ndarray of shape (`n_to_select_from_`)
+                     the minimum distance from each point to the set of selected
+                     points. once a point is selected, the distance is not updated;
+                     the final list will reflect the distances when selected.
+
+        """
+        return self.haussdorf_
+
+    def get_select_distance(self):
+        """
+
+        Returns
+        -------
+
+        haussdorf_at_select : ndarray of shape (`n_to_select`)
+                     at the time of selection, the minimum distance from each
+                     selected point to the set of previously selected points.
+
+        """
+        mask = self.get_support(indices=True, ordered=True)
+        return self.haussdorf_at_select_[mask]
+
+    def _init_greedy_search(self, X, y, n_to_select):
+        """
+        Initializes the search. Prepares an array to store the selected
+        features. This function also determines the switching point if it was not
+        given during initialization.
+        The point is that when calculating distances in Voronoi_FPS it is
+        necessary to "jump" between indexes in the array. This results in a
+        significant increase in time. Therefore, if you need to recalculate a
+        large number of distances, it is more advantageous to run simple
+        calculation along the whole matrix.
+        """
+
+        n_to_select_from = X.shape[self._axis]
+        self._distance_dtype = _get_distance_dtype(self.distance_dtype, X)
+
+        if self.metric == "euclidean":
+            self.norms_ = (X ** 2).sum(
+                axis=abs(self._axis - 1), dtype=self._distance_dtype
+            )
+
+        self.vlocation_of_idx = np.full(n_to_select_from, 1)
+        # index of the voronoi cell associated with each of the columns of X
+
+        self.dSL_ = np.zeros(self.n_to_select, self._distance_dtype)
+        # distance between new selected point and previously
+        # selected points
+
+        self.cell_radius_ = np.zeros(n_to_select, self._distance_dtype)
+        self._cell_members = []
+        # largest haussdorf distance and indices of the points in each cell
+
+        if self.n_trial_calculation != "deprecated":
+            warnings.warn(
+                "n_trial_calculation is deprecated and has no effect, as the "
+                "switching point is calibrated by calibrate_voronoi_fps.",
+                FutureWarning,
+            )
+            if not isinstance(self.n_trial_calculation, numbers.Integral):
+                raise TypeError("Number of trial calculation should be integer")
+            if self.n_trial_calculation < 1:
+                raise ValueError(
+                    "Number of trial calculation should be more or equal to 1"
+                )
+
+        if self.full_fraction is None:
+            if self.metric != "euclidean":
+                # the cost of other metrics is dominated by the number of
+                # distances, so the pruned update is always preferred
+                self.full_fraction_ = 1.0
+            else:
+                self.full_fraction_ = self._get_calibrated_full_fraction(X)
+
+        else:
+            if isinstance(self.full_fraction, numbers.Real):
+                if not 0 < self.full_fraction <= 1:
+                    raise ValueError(
+                        "Switching point should be real and more than 0 and less than 1",
+                        f"received {self.full_fraction}",
+                    )
+            else:
+                raise ValueError(
+                    "Switching point should be real and more than 0 and less than 1",
+                    f"received {self.full_fraction}",
+                )
+            self.full_fraction_ = self.full_fraction
+
+        super()._init_greedy_search(X, y, n_to_select)
+
+        if self.initialize == "random":
+            random_state = check_random_state(self.random_state)
+            initialize = random_state.randint(X.shape[self._axis])
+        elif isinstance(self.initialize, numbers.Integral):
+            initialize = self.initialize
+        else:
+            raise ValueError("Invalid value of the initialize parameter")
+
+        self.selected_idx_[0] = initialize
+        self.haussdorf_ = np.full(X.shape[self._axis], np.inf, self._distance_dtype)
+        self.haussdorf_at_select_ = np.full(
+            X.shape[self._axis], np.inf, self._distance_dtype
+        )
+        self._update_post_selection(X, y, self.selected_idx_[0])
+
+    def _get_calibrated_full_fraction(self, X):
+        """
+        Reads the switching point for the dtype and the number of features of X
+        from the calibration cache, or returns the default switching point
+        if the cache has no matching entry, with a warning the first time in
+        the process.
+        """
+
+        # the length of the vectors between which distances are computed
+        n_features = X.shape[abs(self._axis - 1)]
+
+        key = _get_calibration_key(n_features, X.dtype)
+        calibration = _load_calibration(_get_calibration_path())
+
+        if key in calibration:
+            return calibration[key]
+
+        if key in _MISSING_CALIBRATIONS:
+            return _DEFAULT_FULL_FRACTION
+        _MISSING_CALIBRATIONS.add(key)
+
+        warnings.warn(
+            "No calibrated switching point for VoronoiFPS on this machine, "
+            f"using full_fraction={_DEFAULT_FULL_FRACTION}. Run "
+            f"calibrate_voronoi_fps({n_features}, dtype=np.{X.dtype.name}) "
+            "to calibrate it."
+        )
+        return _DEFAULT_FULL_FRACTION
+
+    def _continue_greedy_search(self, X, y, n_to_select):
+        """Continues the search. Prepares an array to store the selected
+        features."""
+
+        super()._continue_greedy_search(X, y, n_to_select)
+
+        # a resumed selection already has room for `n_to_select` selections
+        n_pad = max(n_to_select - len(self.dSL_), 0)
+
+        self.dSL_ = np.pad(self.dSL_, (0, n_pad), "constant", constant_values=0)
+        self.cell_radius_ = np.pad(
+            self.cell_radius_, (0, n_pad), "constant", constant_values=0
+        )
+
+    def _get_best_new_selection(self, scorer, X, y):
+        """
+        Finds the farthest point among the members of the cells of largest
+        radius, instead of among all the points, taking the smallest index
+        among ties as :py:func:`numpy.argmax` does.
+        """
+
+        radius = self.cell_radius_[: self.n_selected_]
+        max_radius = radius.max()
+
+        members = np.concatenate(
+            [self._cell_members[c] for c in np.flatnonzero(radius == max_radius)]
+        )
+        amax = members[self.haussdorf_[members] == max_radius].min()
+
+        self._selected_score = self.haussdorf_[amax]
+        if self.score_threshold is not None and max_radius < self.score_threshold:
+            return None
+        else:
+            return amax
+
+    def _get_distances(self, X, i, indices=None):
+        """
+        Computes the distances between the sample (feature) `i` and the samples
+        (features) `indices`, or all of them if `indices` is None, with the
+        chosen metric. For the Euclidean metric, these are squared distances.
+        """
+
+        if self.metric == "euclidean":
+            if self._axis == 1:
+                if indices is None:
+                    return self.norms_ + self.norms_[i] - 2 * X[:, i] @ X
+                return (
+                    self.norms_[indices] + self.norms_[i] - 2 * X[:, i] @ X[:, indices]
+                )
+            else:
+                if indices is None:
+                    return self.norms_ + self.norms_[i] - 2 * X[i] @ X.T
+                return self.norms_[indices] + self.norms_[i] - 2 * X[i] @ X[indices].T
+
+        if indices is None:
+            indices = np.arange(X.shape[self._axis])
+
+        if callable(self.metric):
+            return self.metric(X, i, indices)
+
+        if self._axis == 1:
+            return pairwise_distances(X[:, [i]].T, X[:, indices].T, metric=self.metric)[
+                0
+            ]
+        else:
+            return pairwise_distances(X[[i]], X[indices], metric=self.metric)[0]
+
+    def _get_active(self, X, last_selected):
+        """
+        Finds the indices of the Voronoi cells that might change due to the fact
+        that a new point has been selected (index is last_selected,
+        because we haven't called super() yet, self.n_selected_ has not been
+        incremented yet)
+
+        This function calculates the distances between the last selected point
+        and the previously selected points. Next, the list of points to which
+        the distance is to be calculated is shortened.
+
+        These are the points for which need to recompute distances.
+        Let:
+        L is the last point selected;
+        S are the selected points from before this iteration;
+        X are the candidates;
+        The logic here is that we want to check if d(XL) can be smaller than
+        min(d(X,S)) (which is stored in self.haussdorf_)
+        now, if a point belongs to the Voronoi cell of S then
+        min(d(X,S_i))=d(X,S). Triangle inequality implies that
+        d(S,L) < |d(X,S) + d(L,X)| so we just need to check if
+        |d(X,S) - d(S,L)|>= d(X,S) to know that we don't need to check X.
+        but |d(X,S) - d(S,L)|^2>= d(X,S)^2 if and only if d(S,L)/2 > d(S,X)
+
+        The same condition applied to the largest d(S,X) in the cell of S
+        (stored in self.cell_radius_) rules out the whole cell at once, so that
+        only the members of the remaining cells are tested.
+        """
+
+        if not hasattr(self, "n_selected_") or self.n_selected_ == 0:
+            self._active_cells = np.array([], dtype=int)
+            # nothing has been fit yet, so the axis is taken from selection_type
+            axis = 1 if self.selection_type == "feature" else 0
+            return np.arange(X.shape[axis], dtype=int)
+
+        else:
+            if self.metric == "euclidean":
+                # squared distances, so that d(S,L)^2/4 is compared to d(X,S)^2,
+                # with the previous selections gathered from X in index-only mode
+                selected = self.selected_idx_[: self.n_selected_]
+                if self._axis == 1:
+                    X_previous = (
+                        self.X_selected_[:, : self.n_selected_]
+                        if self.store_selected
+                        else X[:, selected]
+                    )
+                    products = X[:, last_selected] @ X_previous
+                else:
+                    X_previous = (
+                        self.X_selected_[: self.n_selected_]
+                        if self.store_selected
+                        else X[selected]
+                    )
+                    products = X_previous @ X[last_selected]
+
+                self.dSL_[: self.n_selected_] = (
+                    self.norms_[selected]
+                    + self.norms_[last_selected]
+                    - 2 * products
+                ) * 0.25
+                # calculation in a single block
+            else:
+                self.dSL_[: self.n_selected_] = (
+                    self._get_distances(
+                        X, last_selected, self.selected_idx_[: self.n_selected_]
+                    )
+                    * 0.5
+                )
+
+            self._active_cells = np.where(
+                self.dSL_[: self.n_selected_] < self.cell_radius_[: self.n_selected_]
+            )[0]
+
+            if len(self._active_cells) == 0:
+                return np.array([], dtype=int)
+
+            candidates = np.concatenate(
+                [self._cell_members[c] for c in self._active_cells]
+            )
+            active_points = candidates[
+                self.dSL_[self.vlocation_of_idx[candidates]]
+                < self.haussdorf_[candidates]
+            ]
+
+            # sorted indices give a more regular access to the rows of X
+            return np.sort(active_points)
+
+    def _update_post_selection(self, X, y, last_selected):
+        """
+        Saves the most recently selected feature, increments the feature counter
+        and update the haussdorf distances
+        Let:
+        L is the last point selected;
+        S are the selected points from before this iteration;
+        X is the one active point;
+        This function calculates d(L, X) and checks the condition
+        d(L, X)< min d(X, S_i). If so, we move X to a new polyhedron.
+        If the number of active points is too high, it is faster to calculate
+        the distances between L and all the points in the dataset.
+        The cells which lose points have their members and radius updated.
+        """
+
+        self.haussdorf_at_select_[last_selected] = self.haussdorf_[last_selected]
+        active_points = self._get_active(X, last_selected)
+
+        if len(active_points) > 0:
+            if len(active_points) / X.shape[self._axis] > self.full_fraction_:
+                new_dist = self._get_distances(X, last_selected)
+                updated_points = np.where(new_dist < self.haussdorf_)[0]
+                np.minimum(self.haussdorf_, new_dist, self.haussdorf_, casting="unsafe")
+            else:
+                new_dist = self._get_distances(X, last_selected, active_points)
+                updated = new_dist < self.haussdorf_[active_points]
+                updated_points = active_points[updated]
+                self.haussdorf_[updated_points] = new_dist[updated]
+        else:
+            updated_points = np.array([], dtype=int)
+
+        self.haussdorf_[last_selected] = 0
+        moved_points = np.union1d(updated_points, [last_selected])
+
+        # the points can only move out of existing cells
+        old_cells = np.unique(self.vlocation_of_idx[moved_points])
+        old_cells = old_cells[old_cells < self.n_selected_]
+
+        self.vlocation_of_idx[moved_points] = self.n_selected_
+
+        for c in old_cells:
+            members = self._cell_members[c]
+            members = members[self.vlocation_of_idx[members] == c]
+            self._cell_members[c] = members
+            self.cell_radius_[c] = (
+                self.haussdorf_[members].max() if len(members) > 0 else 0.0
+            )
+
+        self._cell_members.append(moved_points)
+        self.cell_radius_[self.n_selected_] = self.haussdorf_[moved_points].max()
+
+        super()._update_post_selection(X, y, last_selected)
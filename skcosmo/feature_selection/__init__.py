@@ -8,6 +8,7 @@ from ._base import (
     FPS,
     PCovCUR,
     PCovFPS,
+    VoronoiFPS,
 )
 
-__all__ = ["PCovFPS", "PCovCUR", "FPS", "CUR"]
+__all__ = ["PCovFPS", "PCovCUR", "FPS", "CUR", "VoronoiFPS"]
@@ -3,12 +3,26 @@ The :mod:`sklearn.sample selection` module will include FPS and CUR selection, e
 with the optional PCov-flavor
 """
 
+from .._voronoi_fps import calibrate_voronoi_fps
 from ._base import (
     CUR,
     FPS,
     PCovCUR,
     PCovFPS,
+    VoronoiFPS,
+)
+from ._multilevel_fps import (
+    MultilevelFPS,
+    merge_fps_summaries,
 )
-from ._voronoi_fps import VoronoiFPS
 
-__all__ = ["PCovFPS", "PCovCUR", "FPS", "CUR", "VoronoiFPS"]
+__all__ = [
+    "PCovFPS",
+    "PCovCUR",
+    "FPS",
+    "CUR",
+    "VoronoiFPS",
+    "MultilevelFPS",
+    "calibrate_voronoi_fps",
+    "merge_fps_summaries",
+]
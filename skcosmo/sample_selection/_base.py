@@ -8,6 +8,7 @@ from .._selection import (
     _PCovCUR,
     _PCovFPS,
 )
+from .._voronoi_fps import _VoronoiFPS
 
 
 class FPS(_FPS):
@@ -50,3 +51,13 @@ class PCovCUR(_PCovCUR):
     def __init__(self, **kwargs):
 
         super().__init__(selection_type="sample", **kwargs)
+
+
+class VoronoiFPS(_VoronoiFPS):
+    """Transformer that performs Greedy Sample Selection using Farthest Point
+    Sampling, pruning the distance updates with the Voronoi tessellation of the
+    selected samples.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(selection_type="sample", **kwargs)
@@ -0,0 +1,363 @@
+import numbers
+
+import numpy as np
+import scipy.sparse
+from joblib import effective_n_jobs
+from sklearn.utils import check_random_state
+from sklearn.utils.extmath import (
+    row_norms,
+    safe_sparse_dot,
+)
+
+from .._selection import (
+    GreedySelector,
+    _get_blocks,
+    _get_executor,
+)
+from ._base import FPS
+
+
+def merge_fps_summaries(summaries, n_to_select):
+    """
+    Merges the summaries of FPS selections made on disjoint partitions of a
+    dataset, obtained with :py:func:`skcosmo.sample_selection.FPS.get_summary`,
+    into the summary of a global selection of `n_to_select` samples.
+
+    As every sample of a partition lies within the coverage radius of a
+    selection of its partition, FPS is run over the union of the selections,
+    the candidates, choosing at each step the candidate with the largest
+    distance to the merged selection plus its coverage radius, which bounds the
+    distance of the samples it covers. The coverage radius of each merged
+    selection is the largest such bound among the candidates closest to it.
+    The merged summary can itself be merged, e.g. along a reduction tree.
+
+    Parameters
+    ----------
+    summaries : list of dict
+        Summaries of the selections on each partition
+    n_to_select : int
+        Number of samples to select among the candidates
+
+    Returns
+    -------
+    summary : dict
+        Summary of the merged selection, with the same keys as the summaries.
+        ``summary["radius"].max()`` bounds the covering radius of the whole
+        dataset by the merged selection.
+    """
+
+    if not isinstance(n_to_select, numbers.Integral) or n_to_select < 1:
+        raise ValueError(
+            f"n_to_select should be a positive integer, got {n_to_select}."
+        )
+
+    selected_idx = np.concatenate([summary["selected_idx"] for summary in summaries])
+    if any(scipy.sparse.issparse(summary["X_selected"]) for summary in summaries):
+        X_selected = scipy.sparse.vstack(
+            [summary["X_selected"] for summary in summaries], format="csr"
+        )
+    else:
+        X_selected = np.vstack([summary["X_selected"] for summary in summaries])
+    radius = np.concatenate([summary["radius"] for summary in summaries])
+    n_samples = sum(summary["n_samples"] for summary in summaries)
+
+    norms = row_norms(X_selected, squared=True)
+    haussdorf = np.full(len(selected_idx), np.inf)
+    closest = np.zeros(len(selected_idx), dtype=int)
+    available = np.ones(len(selected_idx), dtype=bool)
+
+    merged = [0]
+    for i in range(min(n_to_select, len(selected_idx))):
+        products = safe_sparse_dot(
+            X_selected, X_selected[[merged[i]]].T, dense_output=True
+        )
+        new_dist = norms + norms[merged[i]] - 2 * products.ravel()
+        new_dist[merged[i]] = 0.0
+        closer = new_dist < haussdorf
+        haussdorf[closer] = new_dist[closer]
+        closest[closer] = i
+        available[merged[i]] = False
+
+        # the merged candidates still bound the distance of the samples they
+        # cover, but cannot be selected again
+        bound = np.sqrt(np.maximum(haussdorf, 0)) + radius
+        merged.append(np.argmax(np.where(available, bound, -np.inf)))
+
+    merged = np.array(merged[:-1])
+    merged_radius = np.zeros(len(merged))
+    np.maximum.at(merged_radius, closest, bound)
+
+    return {
+        "selected_idx": selected_idx[merged],
+        "X_selected": X_selected[merged],
+        "radius": merged_radius,
+        "n_samples": n_samples,
+    }
+
+
+class MultilevelFPS(GreedySelector):
+    """
+    Transformer that performs Greedy Sample Selection using a multilevel
+    approximation of Farthest Point Sampling, for datasets on which exact FPS,
+    at a cost :math:`O(n k p)` for :math:`n` samples with :math:`p` features and
+    :math:`k` selections, is infeasible.
+
+    The samples are split into `n_shards` contiguous shards, on which
+    :py:class:`skcosmo.sample_selection.FPS` selects `n_to_select` samples
+    independently (and in parallel). A final FPS then selects `n_to_select`
+    samples among the union of the shard selections, the candidates. As every
+    sample of a shard lies within the covering radius of the shard selection,
+    the distance of a sample to the final selection is at most the distance of
+    a candidate to the final selection plus the covering radius of its shard.
+    The final FPS carries these radii over, and selects at each step the
+    candidate with the largest such bound.
+
+    The covering radius of the selection (the largest Euclidean distance between
+    a sample and the closest selection) is bounded from above by
+    :py:attr:`coverage_radius_`. :py:attr:`radius_lower_bound_` is a lower bound
+    to the covering radius of any selection of `n_to_select` samples, including
+    exact FPS, so that their ratio bounds the loss of quality with respect to
+    exact FPS.
+
+    Parameters
+    ----------
+
+    n_shards: int, default=4
+        Number of shards on which the first level of FPS is run. The cost of
+        the first level is :math:`O(n k p)` in total, but is spread over
+        `n_shards` independent selections, and the cost of the final FPS is
+        :math:`O(n_{shards} k^2 p)`. Stored in :py:attr:`self.n_shards`.
+
+    initialize: int or 'random', default=0
+        Index of the first selection. If 'random', picks a random
+        value when fit starts. The shard containing the first selection starts
+        from it, the other shards from their first sample.
+        Stored in :py:attr:`self.initialize`.
+
+    block_size: int, default=None
+        Block size of the FPS on each shard, see
+        :py:class:`skcosmo.sample_selection.FPS`.
+        Stored in :py:attr:`self.block_size`.
+
+    n_jobs: int, default=None
+        Number of threads among which the shards are distributed.
+        ``None`` means 1 unless in a :obj:`joblib.parallel_backend` context,
+        ``-1`` means using all processors. Stored in :py:attr:`self.n_jobs`.
+
+    Attributes
+    ----------
+
+    candidates_ : ndarray of shape (n_candidates,)
+                  indices of the samples selected on the shards, among which the
+                  final selection is made
+
+    shard_radius_ : ndarray of shape (n_shards,)
+                    covering radius of each shard by its own selection
+
+    haussdorf_ : ndarray of shape (n_candidates,)
+                 the squared distance of each candidate to the final selection
+
+    coverage_radius_ : float
+                       upper bound to the covering radius of all the samples by
+                       the selection
+
+    radius_lower_bound_ : float
+                          lower bound to the covering radius of any selection of
+                          `n_to_select` samples
+
+    """
+
+    def __init__(
+        self, n_shards=4, initialize=0, block_size=None, n_jobs=None, **kwargs
+    ):
+
+        self.n_shards = n_shards
+        self.initialize = initialize
+        self.block_size = block_size
+        self.n_jobs = n_jobs
+
+        super().__init__(selection_type="sample", **kwargs)
+
+    def score(self, X, y=None):
+        """
+        Returns the Haussdorf distances of the candidates to previous selections
+
+        Parameters
+        ----------
+        X : ignored
+        y : ignored
+
+        Returns
+        -------
+        haussdorf : Haussdorf distances
+        """
+        return self.haussdorf_
+
+    def get_distance(self):
+        """
+
+        Returns
+        -------
+
+        haussdorf : ndarray of shape (`n_candidates`)
+                     the squared distance from each candidate to the set of
+                     selected samples.
+
+        """
+        return self.haussdorf_
+
+    def _init_greedy_search(self, X, y, n_to_select):
+        """
+        Initializes the search. Runs FPS on each of the shards, and prepares
+        the final FPS over the union of the shard selections.
+        """
+
+        super()._init_greedy_search(X, y, n_to_select)
+
+        if not isinstance(self.n_shards, numbers.Integral) or self.n_shards < 1:
+            raise ValueError(
+                f"n_shards should be a positive integer, got {self.n_shards}."
+            )
+
+        if self.initialize == "random":
+            random_state = check_random_state(self.random_state)
+            initialize = random_state.randint(X.shape[0])
+        elif isinstance(self.initialize, numbers.Integral):
+            initialize = self.initialize
+        else:
+            raise ValueError("Invalid value of the initialize parameter")
+
+        def select_shard(shard):
+            n_shard = shard.stop - shard.start
+
+            # shards with no more samples than selections are kept whole
+            if n_shard <= n_to_select:
+                return np.arange(shard.start, shard.stop), 0.0
+
+            if shard.start <= initialize < shard.stop:
+                shard_initialize = initialize - shard.start
+            else:
+                shard_initialize = 0
+
+            # only the indices and the distances of the shard selection are
+            # used, so that the selected samples are not copied
+            selector = FPS(
+                n_to_select=n_to_select,
+                initialize=shard_initialize,
+                block_size=self.block_size,
+                store_selected=False,
+            )
+            selector.fit(X[shard])
+
+            # the farthest sample is at the distance the next selection would be
+            radius = np.sqrt(max(selector.haussdorf_.max(), 0.0))
+            return shard.start + selector.selected_idx_, radius
+
+        shards = _get_blocks(X.shape[0], -(-X.shape[0] // self.n_shards))
+        executor = _get_executor(effective_n_jobs(self.n_jobs))
+        if executor is None:
+            results = [select_shard(shard) for shard in shards]
+        else:
+            with executor:
+                results = list(executor.map(select_shard, shards))
+
+        shard_idx, shard_radius = zip(*results)
+        self.candidates_ = np.concatenate(shard_idx)
+        self.shard_radius_ = np.array(shard_radius)
+
+        # the covering radius of its shard, carried over to each candidate
+        self._candidate_radius = np.repeat(
+            self.shard_radius_, [len(idx) for idx in shard_idx]
+        )
+        self._candidate_position = np.full(X.shape[0], -1)
+        self._candidate_position[self.candidates_] = np.arange(len(self.candidates_))
+
+        # sparse candidates are kept sparse
+        if scipy.sparse.issparse(X):
+            self._X_candidates = X[self.candidates_]
+        else:
+            self._X_candidates = np.array(X[self.candidates_])
+        self._candidate_norms = row_norms(self._X_candidates, squared=True)
+
+        self.haussdorf_ = np.full(len(self.candidates_), np.inf)
+        self._min_select_distance = np.inf
+        self._update_post_selection(X, y, initialize)
+
+    def _continue_greedy_search(self, X, y, n_to_select):
+        """
+        Continues the search among the candidates of the previous fit, which
+        cannot provide more than `n_candidates` selections.
+        """
+
+        if n_to_select > len(self.candidates_):
+            raise ValueError(
+                f"Cannot select {n_to_select} samples among the "
+                f"{len(self.candidates_)} candidates of the previous fit, "
+                "refit with warm_start=False."
+            )
+
+        super()._continue_greedy_search(X, y, n_to_select)
+
+    def _get_best_new_selection(self, scorer, X, y):
+
+        distances = np.sqrt(np.maximum(scorer(X, y), 0.0)) + self._candidate_radius
+
+        # the selected candidates cannot be selected again, even when all the
+        # remaining candidates tie with them
+        selected = self._candidate_position[self.selected_idx_[: self.n_selected_]]
+        distances[selected] = -np.inf
+
+        amax = np.argmax(distances)
+        self._selected_score = self.haussdorf_[amax]
+        if (
+            self.score_threshold is not None
+            and self.haussdorf_[amax] < self.score_threshold
+        ):
+            return None
+        else:
+            return self.candidates_[amax]
+
+    def _update_post_selection(self, X, y, last_selected):
+        """
+        Saves the most recent selections, increments the counter,
+        and, recomputes the haussdorf distances of the candidates.
+        """
+
+        position = self._candidate_position[last_selected]
+
+        # the smallest squared distance between a selection and the previous ones
+        self._min_select_distance = min(
+            self._min_select_distance, self.haussdorf_[position]
+        )
+
+        products = safe_sparse_dot(
+            self._X_candidates, self._X_candidates[[position]].T, dense_output=True
+        )
+
+        new_dist = (
+            self._candidate_norms
+            + self._candidate_norms[position]
+            - 2 * np.asarray(products).ravel()
+        )
+        np.minimum(self.haussdorf_, new_dist, self.haussdorf_)
+
+        super()._update_post_selection(X, y, last_selected)
+
+    def _postprocess(self, X, y):
+        """Computes the bounds to the covering radius of the selection"""
+
+        super()._postprocess(X, y)
+
+        distances = np.sqrt(np.maximum(self.haussdorf_, 0.0))
+        self.coverage_radius_ = (distances + self._candidate_radius).max()
+
+        # the selections and the farthest candidate are pairwise at least
+        # `min_distance` apart, so that covering them with `n_to_select`
+        # samples requires a radius of at least `min_distance / 2`. The smallest
+        # distance between them is the smallest distance of each to the
+        # previous ones, known from the selection
+        farthest = self.haussdorf_[np.argmax(distances)]
+        min_distance = np.sqrt(max(min(self._min_select_distance, farthest), 0.0))
+
+        # each shard selection is an exact FPS, with the same bound on its shard
+        self.radius_lower_bound_ = max(self.shard_radius_.max(), min_distance) / 2
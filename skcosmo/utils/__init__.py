@@ -7,6 +7,8 @@ from ._orthogonalizers import (
     X_orthogonalizer,
     Y_feature_orthogonalizer,
     Y_sample_orthogonalizer,
+    YFeatureOrthogonalizer,
+    YSampleOrthogonalizer,
 )
 from ._pcovr_utils import (
     check_lr_fit,
@@ -23,4 +25,6 @@ __all__ = [
     "X_orthogonalizer",
     "Y_sample_orthogonalizer",
     "Y_feature_orthogonalizer",
+    "YSampleOrthogonalizer",
+    "YFeatureOrthogonalizer",
 ]
@@ -12,9 +12,10 @@ Authors: Rose K. Cersonsky
 import warnings
 
 import numpy as np
+from scipy.linalg import qr
 
 
-def X_orthogonalizer(x1, c=None, x2=None, tol=1e-12, copy=False):
+def X_orthogonalizer(x1, c=None, x2=None, tol=1e-12, copy=False, block=False):
     """
     Orthogonalizes a feature matrix by the given columns. Can be used to
     orthogonalize by samples by calling `X = X_orthogonalizer(X.T, row_index).T`.
@@ -32,6 +33,16 @@ def X_orthogonalizer(x1, c=None, x2=None, tol=1e-12, copy=False):
     x2: matrix of shape (n x a), default=x1[:, c]
         a separate set of columns to orthogonalize with respect to
         Note: the orthogonalizer will work column-by-column in column-index order
+
+    block: bool, default=False
+        whether to orthogonalize by all the columns of x2 at once. The columns
+        are orthonormalized with a QR decomposition, and x1 is projected out of
+        the space they span with a single matrix product, instead of one pass
+        over x1 per column. Contrary to the column-by-column mode, the result
+        does not depend on the columns of x2 being orthogonal to one another.
+        The rank of x2 is found by a QR decomposition with column pivoting,
+        such that null and linearly dependent columns are dropped wherever
+        they appear.
     """
 
     if x2 is None and c is not None:
@@ -49,6 +60,23 @@ def X_orthogonalizer(x1, c=None, x2=None, tol=1e-12, copy=False):
     else:
         xnew = x1
 
+    if block:
+        # with column pivoting, the diagonal of R is non-increasing, so that
+        # the leading columns of Q span the columns of x2, whatever the order
+        # of their null or linearly dependent columns
+        Q, R, _ = qr(cols, mode="economic", pivoting=True)
+
+        diag = np.abs(np.diag(R))
+        eps = np.finfo(Q.dtype).eps
+        rank = np.count_nonzero(diag > max(tol, diag[:1].sum() * max(cols.shape) * eps))
+        if rank == 0:
+            warnings.warn("Column vector contains only zeros.")
+
+        Q = Q[:, :rank]
+        xnew -= Q @ (Q.T @ xnew)
+
+        return xnew
+
     for i in range(cols.shape[-1]):
 
         col = cols[:, [i]]
@@ -144,3 +172,254 @@ def Y_sample_orthogonalizer(y, X, y_ref, X_ref, tol=1e-12, copy=True):
     else:
         y -= y_frag
         return y
+
+
+def _gram_schmidt(Q, x, tol=1e-12):
+    """
+    Orthogonalizes the vector x against the orthonormal columns of Q, with
+    a second pass to recover the orthogonality lost to round-off. Returns the
+    coefficients of x in the basis Q, the normalized orthogonal component of x,
+    and its norm, or None and 0 when x is linearly dependent on Q, i.e. when
+    the orthogonal component is smaller than :math:`\\sqrt{tol}` times the
+    norm of x, consistent with the `rcond` given to np.linalg.pinv on
+    :math:`\\mathbf{X}^T\\mathbf{X}`.
+    """
+
+    coefs = Q.T @ x
+    v = x - Q @ coefs
+    correction = Q.T @ v
+    coefs += correction
+    v -= Q @ correction
+
+    norm = np.linalg.norm(v)
+    if norm <= np.sqrt(tol) * np.linalg.norm(x) or norm == 0.0:
+        return coefs, None, 0.0
+
+    return coefs, v / norm, norm
+
+
+class YFeatureOrthogonalizer:
+    r"""
+    Incremental version of :py:func:`Y_feature_orthogonalizer`, which keeps an
+    orthonormal basis :math:`\mathbf{Q}` of the features selected so far, such
+    that the orthogonalization
+
+    .. math::
+        \mathbf{Y} \leftarrow \mathbf{Y} - \mathbf{Q}\mathbf{Q}^T \mathbf{Y}
+        = \mathbf{Y} -
+        \mathbf{X} \left(\mathbf{X}^T\mathbf{X}\right)^{-1}\mathbf{X}^T \mathbf{Y}
+
+    does not require the pseudo-inverse of :math:`\mathbf{X}^T\mathbf{X}`.
+    Selected features are appended one at a time by Gram-Schmidt
+    orthogonalization, at a cost linear in the number of samples.
+
+    Parameters
+    ----------
+
+    tol: float
+         cutoff below which a new feature is considered linearly dependent on
+         the previous ones, as the cutoff for small eigenvalues in
+         :py:func:`Y_feature_orthogonalizer`
+
+    Attributes
+    ----------
+
+    Q_: ndarray of shape (n_samples x rank)
+        orthonormal basis of the space spanned by the appended features
+
+    n_vectors_: int
+        number of features that have been appended
+    """
+
+    def __init__(self, tol=1e-12):
+        self.tol = tol
+        self.Q_ = None
+        self.n_vectors_ = 0
+
+    def append(self, x):
+        """
+        Adds a selected feature to the basis.
+
+        Parameters
+        ----------
+
+        x: ndarray of shape (n_samples,)
+           selected feature
+        """
+
+        x = np.asarray(x, dtype=float).ravel()
+        if self.Q_ is None:
+            self.Q_ = np.zeros((x.shape[0], 0))
+
+        _, q, _ = _gram_schmidt(self.Q_, x, self.tol)
+        if q is not None:
+            self.Q_ = np.hstack([self.Q_, q[:, None]])
+
+        self.n_vectors_ += 1
+        return self
+
+    def orthogonalize(self, y, copy=True):
+        """
+        Orthogonalizes a property matrix by the appended features.
+
+        Parameters
+        ----------
+
+        y: ndarray of shape (n_samples x n_properties)
+           property matrix
+
+        copy: bool
+              whether to return a copy of y or edit in-place, default=True
+        """
+
+        if copy:
+            y = y.copy()
+
+        if self.Q_ is not None:
+            y -= self.Q_ @ (self.Q_.T @ y)
+
+        return y
+
+
+class YSampleOrthogonalizer:
+    r"""
+    Incremental version of :py:func:`Y_sample_orthogonalizer`, which keeps the
+    regression weights :math:`\mathbf{W} = \left(\mathbf{X}_{\mathbf{r}}^T
+    \mathbf{X}_{\mathbf{r}}\right)^{-1}\mathbf{X}_{\mathbf{r}}^T
+    \mathbf{Y}_{\mathbf{r}}` of the reference samples up to date as they
+    are appended, such that the orthogonalization
+
+    .. math::
+        \mathbf{Y} \leftarrow \mathbf{Y} - \mathbf{X}\mathbf{W}
+
+    does not require the pseudo-inverse of
+    :math:`\mathbf{X}_{\mathbf{r}}^T\mathbf{X}_{\mathbf{r}}`.
+
+    The reference samples are factorized as
+    :math:`\mathbf{X}_{\mathbf{r}}^T = \mathbf{Q}\mathbf{R}`, with the
+    orthonormal basis :math:`\mathbf{Q}` of their span grown by Gram-Schmidt
+    orthogonalization, so that :math:`\mathbf{W} = \mathbf{Q}
+    \left(\mathbf{R}\mathbf{R}^T\right)^{-1}\mathbf{R}\mathbf{Y}_{\mathbf{r}}`.
+    As long as the reference samples are linearly independent, :math:`\mathbf{R}`
+    is triangular and each new sample only adds one term to :math:`\mathbf{W}`.
+    Once a linearly dependent sample is appended, :math:`\mathbf{W}` becomes a
+    least-squares solution, and is obtained from the small matrices
+    :math:`\left(\mathbf{R}\mathbf{R}^T\right)^{-1}` and
+    :math:`\mathbf{R}\mathbf{Y}_{\mathbf{r}}`, the former being kept up to
+    date with rank-one updates.
+
+    Parameters
+    ----------
+
+    tol: float
+         cutoff for small eigenvalues of
+         :math:`\mathbf{X}_{\mathbf{r}}^T\mathbf{X}_{\mathbf{r}}`, as in
+         :py:func:`Y_sample_orthogonalizer`
+
+    Attributes
+    ----------
+
+    Q_: ndarray of shape (n_features x rank)
+        orthonormal basis of the space spanned by the reference samples
+
+    W_: ndarray of shape (n_features x n_properties)
+        regression weights of the reference properties on the reference samples
+
+    n_vectors_: int
+        number of reference samples that have been appended
+    """
+
+    def __init__(self, tol=1e-12):
+        self.tol = tol
+        self.Q_ = None
+        self.W_ = None
+        self.n_vectors_ = 0
+
+    def append(self, x_ref, y_ref):
+        """
+        Adds a reference sample.
+
+        Parameters
+        ----------
+
+        x_ref: ndarray of shape (n_features,)
+               reference sample
+
+        y_ref: ndarray of shape (n_properties,)
+               properties of the reference sample
+        """
+
+        x_ref = np.asarray(x_ref, dtype=float).ravel()
+        y_ref = np.asarray(y_ref, dtype=float).ravel()
+
+        if self.Q_ is None:
+            self.Q_ = np.zeros((x_ref.shape[0], 0))
+            self.W_ = np.zeros((x_ref.shape[0], y_ref.shape[0]))
+            # (R R^T)^{-1} and R Y_r, with Q^T X_r^T = R
+            self._RRt_inv = np.zeros((0, 0))
+            self._RYr = np.zeros((0, y_ref.shape[0]))
+            self._independent = True
+
+        coefs, q, norm = _gram_schmidt(self.Q_, x_ref, self.tol)
+
+        # R R^T += coefs coefs^T, with the Sherman-Morrison formula
+        u = self._RRt_inv @ coefs
+        gamma = 1 + coefs @ u
+        self._RRt_inv -= np.outer(u, u) / gamma
+        self._RYr += np.outer(coefs, y_ref)
+
+        if q is not None:
+            # the new sample has a component out of the previous span, which
+            # borders R R^T with norm * coefs and norm ** 2. Its inverse is
+            # obtained by block inversion, the Schur complement of the new
+            # diagonal element being norm ** 2 / gamma
+            rank = self.Q_.shape[1]
+            v = (norm / gamma) * u
+            schur = norm ** 2 / gamma
+            RRt_inv = np.empty((rank + 1, rank + 1))
+            RRt_inv[:rank, :rank] = self._RRt_inv + np.outer(v, v) / schur
+            RRt_inv[:rank, rank] = RRt_inv[rank, :rank] = -v / schur
+            RRt_inv[rank, rank] = 1 / schur
+            self._RRt_inv = RRt_inv
+            self._RYr = np.vstack([self._RYr, norm * y_ref])
+            self.Q_ = np.hstack([self.Q_, q[:, None]])
+
+            if self._independent:
+                # R is triangular, so the new row of R^{-T} Y_r is obtained
+                # by forward substitution, leaving the previous ones untouched
+                z = (y_ref - coefs @ (self.Q_[:, :rank].T @ self.W_)) / norm
+                self.W_ += np.outer(q, z)
+
+        elif np.any(x_ref):
+            self._independent = False
+
+        if not self._independent:
+            self.W_ = self.Q_ @ (self._RRt_inv @ self._RYr)
+
+        self.n_vectors_ += 1
+        return self
+
+    def orthogonalize(self, y, X, copy=True):
+        """
+        Orthogonalizes a matrix of targets given the appended reference samples.
+
+        Parameters
+        ----------
+
+        y: ndarray of shape (n_samples x n_properties)
+           property matrix
+
+        X: ndarray of shape (n_samples x n_features)
+           feature matrix
+
+        copy: bool
+              whether to return a copy of y or edit in-place, default=True
+        """
+
+        if copy:
+            y = y.copy()
+
+        if self.W_ is not None:
+            y -= (X @ self.W_).reshape(y.shape)
+
+        return y
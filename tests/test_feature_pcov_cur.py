@@ -44,6 +44,29 @@ class TestPCovCUR(unittest.TestCase):
 
         self.assertTrue(np.allclose(selector.selected_idx_, self.idx[:-1]))
 
+    def test_incremental(self):
+        """
+        This test checks that keeping the covariance up to date across
+        orthogonalizations returns the known set of indices
+        """
+        selector = PCovCUR(n_to_select=12, incremental=True)
+        selector.fit(self.X, self.y)
+
+        self.assertTrue(np.allclose(selector.selected_idx_, self.idx[:-1]))
+
+    def test_randomized_solver(self):
+        """
+        This test checks that the randomized solver returns the known set of
+        indices
+        """
+        selector = PCovCUR(n_to_select=12, svd_solver="randomized")
+        selector.fit(self.X, self.y)
+
+        self.assertTrue(np.allclose(selector.selected_idx_, self.idx[:-1]))
+
+        with self.assertRaises(ValueError):
+            PCovCUR(n_to_select=2, svd_solver="bad").fit(self.X, self.y)
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -1,6 +1,7 @@
 import unittest
 
 import numpy as np
+import scipy.sparse
 from sklearn import exceptions
 
 # from sklearn.datasets import load_boston as load
@@ -46,6 +47,126 @@ class TestCUR(unittest.TestCase):
 
         self.assertTrue(np.allclose(selector.selected_idx_, ref_idx))
 
+    def test_restart_duplicated(self):
+        """
+        This test checks that the previous selections are orthogonalized
+        away by a restart, when some of them duplicate each other
+        """
+        X = np.random.RandomState(0).normal(size=(50, 10))
+        X = np.hstack([X, X[:, :4]])
+
+        selector = CUR(n_to_select=4, iterative=False).fit(X)
+        selector.n_to_select = 8
+        selector.fit(X, warm_start=True)
+
+        self.assertLessEqual(
+            np.linalg.norm(selector.X_current_[:, selector.selected_idx_[:4]]), 1e-8
+        )
+
+    def test_subspace_solver(self):
+        """
+        This test checks that the warm-started subspace iteration selects the
+        same indices as the ARPACK solver
+        """
+        for k in [1, 3]:
+            with self.subTest(k=k):
+                ref_selector = CUR(n_to_select=self.X.shape[-1] - 3, k=k).fit(self.X)
+                selector = CUR(
+                    n_to_select=self.X.shape[-1] - 3, k=k, svd_solver="subspace"
+                )
+                selector.fit(self.X)
+                self.assertTrue(
+                    np.allclose(selector.selected_idx_, ref_selector.selected_idx_)
+                )
+
+        with self.assertRaises(ValueError):
+            CUR(n_to_select=2, svd_solver="bad").fit(self.X)
+
+        # unconverged singular vectors are reported
+        selector = CUR(n_to_select=2, k=3, svd_solver="subspace").fit(self.X)
+        selector._singular_vectors = None
+        with self.assertWarns(exceptions.ConvergenceWarning):
+            selector._subspace_iteration(selector.X_current_, max_iter=1, rtol=0)
+
+    def test_covariance(self):
+        """
+        This test checks that working on the covariance selects the same
+        indices as working on X, including after a restart
+        """
+        n_to_select = self.X.shape[-1] - 3
+        for k in [1, 3]:
+            with self.subTest(k=k):
+                ref_selector = CUR(n_to_select=n_to_select, k=k).fit(self.X)
+                selector = CUR(n_to_select=n_to_select, k=k, covariance=True)
+                selector.fit(self.X)
+                self.assertTrue(
+                    np.allclose(selector.selected_idx_, ref_selector.selected_idx_)
+                )
+                self.assertFalse(hasattr(selector, "X_current_"))
+
+        ref_selector = CUR(n_to_select=n_to_select).fit(self.X)
+        selector = CUR(n_to_select=1, covariance=True).fit(self.X)
+        for i in range(2, n_to_select):
+            selector.n_to_select = i
+            selector.fit(self.X, warm_start=True)
+            self.assertEqual(
+                selector.selected_idx_[i - 1], ref_selector.selected_idx_[i - 1]
+            )
+
+    def test_randomized_solver(self):
+        """
+        This test checks that the randomized solver selects the same indices
+        as the ARPACK solver, and is reproducible for a given random state
+        """
+        n_to_select = self.X.shape[-1] - 3
+        ref_selector = CUR(n_to_select=n_to_select).fit(self.X)
+        selector = CUR(n_to_select=n_to_select, svd_solver="randomized", random_state=0)
+        selector.fit(self.X)
+        self.assertTrue(np.allclose(selector.selected_idx_, ref_selector.selected_idx_))
+
+        selector2 = CUR(
+            n_to_select=n_to_select, svd_solver="randomized", random_state=0
+        )
+        selector2.fit(self.X)
+        self.assertTrue(np.allclose(selector.pi_, selector2.pi_))
+
+    def test_implicit_deflation(self):
+        """
+        This test checks that the implicit deflation selects the same indices
+        as the explicit one for every solver, without densifying sparse input,
+        including after a restart
+        """
+        n_to_select = self.X.shape[-1] - 3
+        X_sparse = scipy.sparse.csc_matrix(self.X)
+        for svd_solver in ["arpack", "subspace", "randomized"]:
+            with self.subTest(svd_solver=svd_solver):
+                ref_selector = CUR(
+                    n_to_select=n_to_select,
+                    svd_solver=svd_solver,
+                    deflation="explicit",
+                    random_state=0,
+                ).fit(self.X)
+                selector = CUR(
+                    n_to_select=n_to_select, svd_solver=svd_solver, random_state=0
+                ).fit(X_sparse)
+                self.assertTrue(
+                    np.allclose(selector.selected_idx_, ref_selector.selected_idx_)
+                )
+                self.assertFalse(hasattr(selector, "X_current_"))
+                self.assertTrue(scipy.sparse.issparse(selector.X_selected_))
+
+        ref_selector = CUR(n_to_select=n_to_select).fit(self.X)
+        selector = CUR(n_to_select=1, deflation="implicit").fit(self.X)
+        for i in range(2, n_to_select, 5):
+            selector.n_to_select = i
+            selector.fit(self.X, warm_start=True)
+            self.assertTrue(
+                np.allclose(selector.selected_idx_, ref_selector.selected_idx_[:i])
+            )
+
+        with self.assertRaises(ValueError):
+            CUR(n_to_select=2, deflation="bad").fit(self.X)
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -1,5 +1,7 @@
 import unittest
 
+import numpy as np
+import scipy.sparse
 from sklearn.datasets import load_boston
 from sklearn.utils.validation import NotFittedError
 
@@ -58,6 +60,100 @@ class TestFPS(unittest.TestCase):
             selector = FPS(n_to_select=10)
             _ = selector.get_select_distance()
 
+    def test_block_size(self):
+        """
+        This test checks that the blocked update selects the same features
+        as the update over the full matrix
+        """
+        ref_selector = FPS(n_to_select=len(self.idx) - 1).fit(self.X)
+        selector = FPS(n_to_select=len(self.idx) - 1, block_size=4).fit(self.X)
+        self.assertTrue(np.allclose(selector.selected_idx_, ref_selector.selected_idx_))
+
+    def test_sketch(self):
+        """
+        This test checks that maintaining the distances on a random sketch and
+        re-scoring the candidates selects the same features as the full update
+        """
+        ref_selector = FPS(n_to_select=len(self.idx) - 1).fit(self.X)
+
+        for sketch_tolerance in [None, 1.0]:
+            with self.subTest(sketch_tolerance=sketch_tolerance):
+                selector = FPS(
+                    n_to_select=len(self.idx) - 1,
+                    sketch_size=32,
+                    sketch_tolerance=sketch_tolerance,
+                    block_size=2,
+                )
+                selector.fit(self.X)
+                self.assertTrue(
+                    np.allclose(selector.selected_idx_, ref_selector.selected_idx_)
+                )
+
+    def test_no_partial_fit(self):
+        """
+        This test checks that streaming selection is refused for features
+        """
+        with self.assertRaises(ValueError):
+            FPS(n_to_select=2).partial_fit(self.X)
+
+    def test_lazy(self):
+        """
+        This test checks that lazily re-scoring the candidates which reach the
+        top of the heap selects the same features as the full update
+        """
+        ref_selector = FPS(n_to_select=len(self.idx) - 1).fit(self.X)
+        selector = FPS(n_to_select=len(self.idx) - 1, lazy=True).fit(self.X)
+        self.assertTrue(np.allclose(selector.selected_idx_, ref_selector.selected_idx_))
+
+    def test_batch(self):
+        """
+        This test checks that selecting a batch of far-apart features per
+        update gives the FPS selection for batches of one feature, and that
+        larger batches select distinct features
+        """
+        ref_selector = FPS(n_to_select=len(self.idx) - 1).fit(self.X)
+        selector = FPS(n_to_select=len(self.idx) - 1, batch_size=1).fit(self.X)
+        self.assertTrue(np.allclose(selector.selected_idx_, ref_selector.selected_idx_))
+
+        selector = FPS(n_to_select=len(self.idx) - 1, batch_size=4).fit(self.X)
+        self.assertEqual(len(np.unique(selector.selected_idx_)), len(self.idx) - 1)
+        self.assertTrue(
+            np.allclose(selector.X_selected_, self.X[:, selector.selected_idx_])
+        )
+
+    def test_dtype(self):
+        """
+        This test checks that float32 features are selected in float32 end to
+        end, with the same selection as in float64
+        """
+        ref_selector = FPS(n_to_select=len(self.idx) - 1).fit(self.X)
+        selector = FPS(n_to_select=len(self.idx) - 1).fit(self.X.astype(np.float32))
+        self.assertTrue(np.allclose(selector.selected_idx_, ref_selector.selected_idx_))
+        self.assertEqual(selector.X_selected_.dtype, np.float32)
+        self.assertEqual(selector.haussdorf_.dtype, np.float32)
+
+    def test_sparse(self):
+        """
+        This test checks that sparse features are selected as their dense
+        counterparts, and that the selected features are stored sparsely
+        """
+        X = scipy.sparse.random(300, 200, density=0.05, format="csc", random_state=0)
+
+        ref_selector = FPS(n_to_select=20).fit(X.toarray())
+
+        for params in [{}, {"block_size": 37}, {"lazy": True}, {"batch_size": 1}]:
+            with self.subTest(**params):
+                selector = FPS(n_to_select=20, **params).fit(X)
+                self.assertTrue(
+                    np.allclose(selector.selected_idx_, ref_selector.selected_idx_)
+                )
+                self.assertTrue(scipy.sparse.issparse(selector.X_selected_))
+                self.assertTrue(
+                    np.allclose(
+                        selector.X_selected_.toarray(), ref_selector.X_selected_
+                    )
+                )
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -0,0 +1,94 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+from sklearn.datasets import load_boston
+
+from skcosmo.feature_selection import (
+    FPS,
+    VoronoiFPS,
+)
+
+
+class TestVoronoiFPS(unittest.TestCase):
+    def setUp(self):
+        self.X, _ = load_boston(return_X_y=True)
+        self.idx = [9, 3, 11, 6, 1, 10, 8, 0, 12, 2, 5, 7, 4]
+
+        # keep the calibration of the switching point out of the user cache
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.cache_dir.cleanup)
+        env = mock.patch.dict(os.environ, {"SKCOSMO_CACHE_DIR": self.cache_dir.name})
+        env.start()
+        self.addCleanup(env.stop)
+
+    def test_restart(self):
+        """
+        This test checks that the model can be restarted with a new number of
+        features and `warm_start`
+        """
+
+        selector = VoronoiFPS(n_to_select=1, initialize=self.idx[0])
+        selector.fit(self.X)
+
+        for i in range(2, len(self.idx)):
+            selector.n_to_select = i
+            selector.fit(self.X, warm_start=True)
+            self.assertEqual(selector.selected_idx_[i - 1], self.idx[i - 1])
+
+    def test_same_result(self):
+        """
+        This test checks that the feature-selecting VoronoiFPS selects the same
+        features as FPS, both when pruning and when computing all distances,
+        and that it leaves the input untouched
+        """
+
+        X = np.asfortranarray(np.random.RandomState(0).normal(size=(20, 300)))
+        X_copy = X.copy()
+
+        fps = FPS(n_to_select=50, initialize=3)
+        fps.fit(X)
+
+        for full_fraction in [1e-6, 0.5, 1.0]:
+            with self.subTest(full_fraction=full_fraction):
+                selector = VoronoiFPS(
+                    n_to_select=50, initialize=3, full_fraction=full_fraction
+                )
+                selector.fit(X)
+
+                self.assertTrue(np.allclose(selector.selected_idx_, fps.selected_idx_))
+                self.assertTrue(
+                    np.allclose(
+                        selector.get_select_distance(), fps.get_select_distance()
+                    )
+                )
+                self.assertTrue(np.allclose(selector.X_selected_, fps.X_selected_))
+                self.assertTrue(np.array_equal(X, X_copy))
+
+    def test_metric(self):
+        """
+        This test checks that a named metric is applied between the columns of X
+        """
+
+        X = np.asfortranarray(np.random.RandomState(1).normal(size=(20, 100)))
+
+        selector = VoronoiFPS(
+            n_to_select=10, initialize=0, metric="manhattan", full_fraction=0.5
+        )
+        selector.fit(X)
+
+        # brute-force farthest point sampling on the columns
+        D = np.abs(X[:, :, None] - X[:, None, :]).sum(axis=0)
+        idx = [0]
+        d = D[0].copy()
+        for _ in range(9):
+            idx.append(np.argmax(d))
+            d = np.minimum(d, D[idx[-1]])
+
+        self.assertTrue(np.array_equal(selector.selected_idx_, idx))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
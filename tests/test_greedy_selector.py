@@ -1,4 +1,8 @@
+import os
+import tempfile
 import unittest
+from contextlib import contextmanager
+from unittest import mock
 
 import numpy as np
 from sklearn.datasets import load_boston
@@ -24,6 +28,39 @@ class GreedyTester(GreedySelector):
         return scores
 
 
+class LazyGreedyTester(GreedyTester):
+    """Declares its (constant) score monotone, and counts its evaluations"""
+
+    _monotone_score = True
+
+    def _init_greedy_search(self, X, y, n_to_select):
+        super()._init_greedy_search(X, y, n_to_select)
+        self.n_evaluations_ = 0
+
+    def score(self, X, y=None):
+        scores = np.linalg.norm(X, axis=0)
+        scores[self.selected_idx_[: self.n_selected_]] = 0.0
+        return scores
+
+    def _score_candidates(self, X, y, candidates):
+        self.n_evaluations_ += len(candidates)
+        return np.linalg.norm(X[:, candidates], axis=0)
+
+
+@contextmanager
+def interrupt_after(cls, n_selected):
+    """Interrupts the selections of `cls` once `n_selected` have been made"""
+    update_post_selection = cls._update_post_selection
+
+    def interrupt(self, X, y, last_selected):
+        if self.n_selected_ == n_selected:
+            raise KeyboardInterrupt
+        update_post_selection(self, X, y, last_selected)
+
+    with mock.patch.object(cls, "_update_post_selection", interrupt):
+        yield
+
+
 class TestGreedy(unittest.TestCase):
     def setUp(self):
         self.X, _ = load_boston(return_X_y=True)
@@ -113,6 +150,176 @@ class TestGreedy(unittest.TestCase):
         Xr = selector.transform(self.X)
         self.assertEqual(Xr.shape[1], self.X.shape[1] // 2)
 
+    def test_lazy(self):
+        selector = LazyGreedyTester(n_to_select=10).fit(self.X)
+        lazy_selector = LazyGreedyTester(n_to_select=10, lazy=True).fit(self.X)
+
+        self.assertTrue(
+            np.allclose(selector.selected_idx_, lazy_selector.selected_idx_)
+        )
+        # the up-to-date scores at the top of the heap are not re-evaluated
+        self.assertLess(lazy_selector.n_evaluations_, 10 * self.X.shape[1])
+
+        with self.assertWarns(Warning):
+            LazyGreedyTester(score_threshold=20, n_to_select=12, lazy=True).fit(self.X)
+
+    def test_lazy_not_monotone(self):
+        with self.assertRaises(ValueError):
+            GreedyTester(lazy=True).fit(self.X)
+
+    def test_store_selected(self):
+        selector = GreedyTester(n_to_select=10).fit(self.X)
+        index_selector = GreedyTester(n_to_select=10, store_selected=False)
+        index_selector.fit(self.X)
+
+        self.assertTrue(
+            np.allclose(selector.selected_idx_, index_selector.selected_idx_)
+        )
+        self.assertFalse(hasattr(index_selector, "X_selected_"))
+        self.assertTrue(
+            np.allclose(selector.transform(self.X), index_selector.transform(self.X))
+        )
+
+        # the selections of a previous fit are not kept
+        selector.store_selected = False
+        selector.fit(self.X)
+        self.assertFalse(hasattr(selector, "X_selected_"))
+
+    def test_reads_selected(self):
+        class ReadingGreedyTester(GreedyTester):
+            _reads_selected = True
+
+        with self.assertRaises(ValueError):
+            ReadingGreedyTester(store_selected=False).fit(self.X)
+
+    def test_restart_growth(self):
+        """
+        This test checks that restarting one selection at a time grows the
+        selections in place while the buffer has room
+        """
+        selector = GreedyTester(n_to_select=2).fit(self.X)
+        n_reallocations = 0
+        for n_to_select in range(3, 13):
+            X_selected = selector.X_selected_
+            selector.n_to_select = n_to_select
+            selector.fit(self.X, warm_start=True)
+
+            if not np.shares_memory(X_selected, selector.X_selected_):
+                n_reallocations += 1
+            self.assertTrue(
+                np.allclose(selector.X_selected_, self.X[:, selector.selected_idx_])
+            )
+
+        # the capacity doubles from 2 to 4, 8 and 16 selections
+        self.assertEqual(n_reallocations, 3)
+
+    def test_checkpoint(self):
+        """
+        This test checks that an interrupted selection resumes from the last
+        checkpoint, without making its selections again
+        """
+        ref_selector = GreedyTester(n_to_select=10).fit(self.X)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            checkpoint = os.path.join(tmpdir, "selector.pkl")
+
+            # a new selection is started when there is no checkpoint yet
+            selector = GreedyTester(
+                n_to_select=10, checkpoint=checkpoint, checkpoint_every=3
+            )
+            with interrupt_after(GreedyTester, 7):
+                with self.assertRaises(KeyboardInterrupt):
+                    selector.resume(self.X)
+
+            selector = GreedyTester(
+                n_to_select=10, checkpoint=checkpoint, checkpoint_every=3
+            )
+            with mock.patch.object(
+                GreedyTester,
+                "_get_best_new_selection",
+                autospec=True,
+                side_effect=GreedyTester._get_best_new_selection,
+            ) as get_best:
+                selector.resume(self.X)
+
+            self.assertEqual(get_best.call_count, 4)
+            self.assertTrue(
+                np.allclose(selector.selected_idx_, ref_selector.selected_idx_)
+            )
+            self.assertTrue(np.allclose(selector.X_selected_, ref_selector.X_selected_))
+
+            with self.assertRaises(ValueError):
+                GreedyTester(checkpoint=checkpoint).resume(self.X[:, :5])
+
+        with self.assertRaises(ValueError):
+            GreedyTester().resume(self.X)
+
+        with self.assertRaises(ValueError):
+            GreedyTester(checkpoint_every=0).fit(self.X)
+
+    def test_callback(self):
+        """
+        This test checks that the callback is given each selection and its
+        score, that it can stop the selection, and that the time spent in each
+        selection is recorded across warm starts
+        """
+        infos = []
+        selector = GreedyTester(n_to_select=5, callback=infos.append).fit(self.X)
+
+        self.assertEqual([info["iteration"] for info in infos], list(range(5)))
+        self.assertEqual(
+            [info["selected"] for info in infos], selector.selected_idx_.tolist()
+        )
+        scores = np.linalg.norm(self.X, axis=0)
+        self.assertTrue(
+            np.allclose(
+                [info["score"] for info in infos], scores[selector.selected_idx_]
+            )
+        )
+        self.assertEqual(selector.timings_.shape, (5, 2))
+        self.assertTrue(np.all(selector.timings_ >= 0))
+        self.assertTrue(
+            np.allclose(
+                selector.timings_,
+                [[info["score_time"], info["update_time"]] for info in infos],
+            )
+        )
+
+        selector.n_to_select = 8
+        selector.fit(self.X, warm_start=True)
+        self.assertEqual(selector.timings_.shape, (8, 2))
+
+        selector = GreedyTester(
+            n_to_select=8, callback=lambda info: info["iteration"] == 2
+        ).fit(self.X)
+        self.assertEqual(len(selector.selected_idx_), 3)
+        self.assertEqual(selector.X_selected_.shape, (self.X.shape[0], 3))
+
+    def test_checkpoint_parameters(self):
+        """
+        This test checks that the checkpoint does not hold the parameters,
+        which are those of the resuming selector, so that it can select more
+        and be given a callback which cannot be pickled
+        """
+        ref_selector = GreedyTester(n_to_select=10).fit(self.X)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            checkpoint = os.path.join(tmpdir, "selector.pkl")
+            GreedyTester(
+                n_to_select=5, checkpoint=checkpoint, callback=lambda info: False
+            ).fit(self.X)
+
+            infos = []
+            selector = GreedyTester(
+                n_to_select=10,
+                checkpoint=checkpoint,
+                callback=lambda info: infos.append(info),
+            )
+            selector.resume(self.X)
+
+        self.assertTrue(np.allclose(selector.selected_idx_, ref_selector.selected_idx_))
+        self.assertEqual([info["iteration"] for info in infos], list(range(5, 10)))
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
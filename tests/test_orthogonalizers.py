@@ -8,6 +8,8 @@ from skcosmo.utils import (
     X_orthogonalizer,
     Y_feature_orthogonalizer,
     Y_sample_orthogonalizer,
+    YFeatureOrthogonalizer,
+    YSampleOrthogonalizer,
 )
 
 EPSILON = 1e-8
@@ -120,6 +122,53 @@ class TestXOrth(unittest.TestCase):
 
         self.assertLessEqual(np.linalg.norm(X_correlated), EPSILON)
 
+    def test_block(self):
+        # checks that orthogonalizing by a block of columns at once removes
+        # the space they span, even when they are not orthogonal
+
+        X_random = self.random_state.uniform(
+            -1, 1, size=(self.n_samples, self.n_features)
+        )
+        idx = self.random_state.choice(self.n_features, 10, replace=False)
+        x2 = X_random[:, idx]
+        x2 = np.hstack([x2, x2[:, :2] + x2[:, 2:4]])
+
+        projector = x2 @ np.linalg.pinv(x2.T @ x2) @ x2.T
+        ref_X = X_random - projector @ X_random
+
+        new_X = X_orthogonalizer(X_random, x2=x2, block=True, copy=True)
+        self.assertTrue(np.allclose(new_X, ref_X))
+        self.assertLessEqual(np.linalg.norm(new_X[:, idx]), EPSILON)
+
+        with self.assertWarns(Warning, msg="Column vector contains only zeros."):
+            X_orthogonalizer(X_random, x2=np.zeros((self.n_samples, 2)), block=True)
+
+    def test_block_dependent(self):
+        # checks that null and duplicated columns of the block, placed before
+        # independent ones, do not hide the directions of the latter, such that
+        # the block gives the same result as orthogonalizing by each column
+
+        X_random = self.random_state.uniform(
+            -1, 1, size=(self.n_samples, self.n_features)
+        )
+        X_random[:, 3] = 0.0
+        X_random[:, 7] = 2 * X_random[:, 5]
+        idx = [5, 3, 7, 1, 2]
+
+        ref_X = X_random.copy()
+        for c in idx:
+            if np.linalg.norm(ref_X[:, c]) > EPSILON:
+                ref_X = X_orthogonalizer(ref_X, c=c)
+
+        new_X = X_orthogonalizer(X_random, x2=X_random[:, idx], block=True, copy=True)
+        self.assertTrue(np.allclose(new_X, ref_X))
+        self.assertLessEqual(np.linalg.norm(new_X[:, idx]), EPSILON)
+
+        x2 = np.zeros((self.n_samples, 3))
+        x2[0, 0] = x2[1, 2] = 1.0
+        new_X = X_orthogonalizer(X_random, x2=x2, block=True, copy=True)
+        self.assertLessEqual(np.linalg.norm(new_X[:2]), EPSILON)
+
     def test_multicolumn(self):
         # checks that an error is raised when x2 is the wrong shape for x1
         with self.assertRaises(ValueError) as cm:
@@ -207,6 +256,44 @@ class TestYOrths(unittest.TestCase):
         new_y = Y_sample_orthogonalizer(self.y, self.X, yr, Xr, tol=EPSILON, copy=False)
         self.assertTrue(np.allclose(self.y, new_y))
 
+    def test_incremental_feature(self):
+        # checks that the YFeatureOrthogonalizer matches the Y_feature_orthogonalizer
+        # as features are appended, including linearly dependent ones
+
+        c = self.random_state.choice(self.X.shape[-1], 4, replace=False)
+        Xc = np.hstack([self.X[:, c], 2.0 * self.X[:, c[:1]]])
+
+        orthogonalizer = YFeatureOrthogonalizer(tol=EPSILON)
+        for i in range(Xc.shape[-1]):
+            orthogonalizer.append(Xc[:, i])
+            new_y = orthogonalizer.orthogonalize(self.y)
+            self.assertTrue(
+                np.allclose(new_y, Y_feature_orthogonalizer(self.y, Xc[:, : i + 1]))
+            )
+
+        self.assertEqual(orthogonalizer.Q_.shape[-1], 4)
+
+    def test_incremental_sample(self):
+        # checks that the YSampleOrthogonalizer matches the Y_sample_orthogonalizer
+        # as samples are appended, including linearly dependent ones
+
+        Xs = self.X[:, :5]
+        r = self.random_state.choice(self.X.shape[0], 8, replace=False)
+        r[3] = r[1]
+
+        orthogonalizer = YSampleOrthogonalizer(tol=EPSILON)
+        for i in range(len(r)):
+            orthogonalizer.append(Xs[r[i]], self.y[r[i]])
+            new_y = orthogonalizer.orthogonalize(self.y, Xs)
+            self.assertTrue(
+                np.allclose(
+                    new_y,
+                    Y_sample_orthogonalizer(
+                        self.y, Xs, self.y[r[: i + 1]], Xs[r[: i + 1]], tol=EPSILON
+                    ),
+                )
+            )
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
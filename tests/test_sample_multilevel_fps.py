@@ -0,0 +1,197 @@
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import scipy.sparse
+from sklearn.datasets import load_boston
+
+from skcosmo.sample_selection import (
+    FPS,
+    MultilevelFPS,
+    merge_fps_summaries,
+)
+
+
+def select_partition(X, indices, n_to_select):
+    """Selects on a partition in a worker, and only returns the summary"""
+    return FPS(n_to_select=n_to_select).fit(X).get_summary(X, indices=indices)
+
+
+class TestMultilevelFPS(unittest.TestCase):
+    def setUp(self):
+        self.X, _ = load_boston(return_X_y=True)
+        self.idx = [0, 410, 492, 102, 134, 413, 54, 32, 353, 126]
+
+    def covering_radius(self, selected_idx):
+        distances = np.linalg.norm(
+            self.X[:, np.newaxis] - self.X[np.newaxis, selected_idx], axis=2
+        )
+        return distances.min(axis=1).max()
+
+    def test_single_shard(self):
+        """
+        This test checks that a single shard gives the same selection as FPS
+        """
+        selector = MultilevelFPS(n_to_select=len(self.idx), n_shards=1)
+        selector.fit(self.X)
+        self.assertTrue(np.allclose(selector.selected_idx_, self.idx))
+        self.assertTrue(np.allclose(selector.X_selected_, self.X[self.idx]))
+
+    def test_coverage_radius(self):
+        """
+        This test checks that all the samples are covered within the reported
+        radius, and that exact FPS cannot do better than the lower bound
+        """
+        n_to_select = len(self.idx)
+        fps_radius = self.covering_radius(self.idx)
+
+        for n_shards in [2, 5, 100]:
+            with self.subTest(n_shards=n_shards):
+                selector = MultilevelFPS(n_to_select=n_to_select, n_shards=n_shards)
+                selector.fit(self.X)
+
+                self.assertEqual(len(selector.selected_idx_), n_to_select)
+                self.assertTrue(
+                    np.all(np.isin(selector.selected_idx_, selector.candidates_))
+                )
+                self.assertLessEqual(
+                    self.covering_radius(selector.selected_idx_),
+                    selector.coverage_radius_ + 1e-8,
+                )
+                self.assertLessEqual(selector.radius_lower_bound_, fps_radius)
+
+                # the bound from the smallest distance between the selections
+                # and the farthest candidate
+                points = np.append(
+                    selector.selected_idx_,
+                    selector.candidates_[np.argmax(selector.haussdorf_)],
+                )
+                pairwise = np.linalg.norm(
+                    self.X[points, np.newaxis] - self.X[np.newaxis, points], axis=2
+                )
+                np.fill_diagonal(pairwise, np.inf)
+                self.assertAlmostEqual(
+                    selector.radius_lower_bound_,
+                    max(selector.shard_radius_.max(), pairwise.min()) / 2,
+                )
+
+    def test_n_jobs(self):
+        """
+        This test checks that running the shards in parallel gives the same
+        selection as the serial run
+        """
+        ref_selector = MultilevelFPS(n_to_select=len(self.idx)).fit(self.X)
+        selector = MultilevelFPS(n_to_select=len(self.idx), n_jobs=2).fit(self.X)
+        self.assertTrue(np.allclose(selector.selected_idx_, ref_selector.selected_idx_))
+        self.assertEqual(selector.coverage_radius_, ref_selector.coverage_radius_)
+
+    def test_sparse(self):
+        """
+        This test checks that sparse samples are selected as their dense
+        counterpart
+        """
+        X = scipy.sparse.random(400, 30, density=0.2, format="csr", random_state=0)
+        ref_selector = MultilevelFPS(n_to_select=10).fit(X.toarray())
+        selector = MultilevelFPS(n_to_select=10).fit(X)
+        self.assertTrue(np.allclose(selector.selected_idx_, ref_selector.selected_idx_))
+        self.assertTrue(np.allclose(selector.haussdorf_, ref_selector.haussdorf_))
+        self.assertAlmostEqual(selector.coverage_radius_, ref_selector.coverage_radius_)
+        self.assertAlmostEqual(
+            selector.radius_lower_bound_, ref_selector.radius_lower_bound_
+        )
+
+    def test_bad_n_shards(self):
+        """
+        This test checks that the number of shards must be a positive integer
+        """
+        for n_shards in [0, 2.5]:
+            with self.subTest(n_shards=n_shards):
+                with self.assertRaises(ValueError):
+                    MultilevelFPS(n_to_select=1, n_shards=n_shards).fit(self.X)
+
+    def test_warm_start(self):
+        """
+        This test checks that a warm start continues the selection among the
+        candidates, and is rejected when there are not enough of them
+        """
+        selector = MultilevelFPS(n_to_select=5, n_shards=2).fit(self.X)
+        self.assertEqual(len(selector.candidates_), 10)
+
+        selector.n_to_select = 10
+        selector.fit(self.X, warm_start=True)
+        self.assertEqual(len(np.unique(selector.selected_idx_)), 10)
+        self.assertTrue(np.all(np.isin(selector.selected_idx_, selector.candidates_)))
+
+        selector.n_to_select = 11
+        with self.assertRaises(ValueError):
+            selector.fit(self.X, warm_start=True)
+
+    def test_no_repeated_merge(self):
+        """
+        This test checks that a merged candidate is not selected again when
+        its coverage radius dominates the bounds of the other candidates
+        """
+        summaries = [
+            {
+                "selected_idx": np.array([0]),
+                "X_selected": np.array([[0.0, 0.0]]),
+                "radius": np.array([100.0]),
+                "n_samples": 10,
+            },
+            {
+                "selected_idx": np.array([10]),
+                "X_selected": np.array([[1.0, 0.0]]),
+                "radius": np.array([0.0]),
+                "n_samples": 10,
+            },
+        ]
+        summary = merge_fps_summaries(summaries, 2)
+        self.assertTrue(np.allclose(summary["selected_idx"], [0, 10]))
+        self.assertTrue(np.allclose(summary["radius"], [100.0, 0.0]))
+
+    def test_merge_summaries(self):
+        """
+        This test checks that the summaries of selections made in separate
+        processes on disjoint partitions merge into a selection covering all
+        the samples within the merged radius
+        """
+        n_to_select = len(self.idx)
+        partitions = np.array_split(
+            np.random.RandomState(0).permutation(len(self.X)), 3
+        )
+
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            summaries = list(
+                executor.map(
+                    select_partition,
+                    [self.X[indices] for indices in partitions],
+                    partitions,
+                    [n_to_select] * len(partitions),
+                )
+            )
+
+        summary = merge_fps_summaries(summaries, n_to_select)
+        self.assertEqual(len(np.unique(summary["selected_idx"])), n_to_select)
+        self.assertTrue(
+            np.allclose(summary["X_selected"], self.X[summary["selected_idx"]])
+        )
+        self.assertEqual(summary["n_samples"], len(self.X))
+        self.assertLessEqual(
+            self.covering_radius(summary["selected_idx"]),
+            summary["radius"].max() + 1e-8,
+        )
+
+        # merging is associative up to the order of the selections
+        partial = merge_fps_summaries(summaries[:2], n_to_select)
+        summary = merge_fps_summaries([partial, summaries[2]], n_to_select)
+        self.assertLessEqual(
+            self.covering_radius(summary["selected_idx"]),
+            summary["radius"].max() + 1e-8,
+        )
+
+        with self.assertRaises(ValueError):
+            merge_fps_summaries(summaries, 0)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
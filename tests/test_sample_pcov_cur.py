@@ -1,9 +1,12 @@
+import os
+import tempfile
 import unittest
 
 import numpy as np
 from sklearn.datasets import load_boston
 
 from skcosmo.sample_selection import PCovCUR
+from test_greedy_selector import interrupt_after
 
 EPSILON = 1e-6
 
@@ -65,6 +68,55 @@ class TestPCovCUR(unittest.TestCase):
             selector = PCovCUR(n_to_select=10, k=k)
             selector.fit(self.X, self.y)
 
+    def test_incremental(self):
+        """
+        This test checks that keeping the Gram matrix up to date across
+        orthogonalizations returns the known set of indices
+        """
+        selector = PCovCUR(n_to_select=10, mixing=0.5, incremental=True)
+        selector.fit(self.X, self.y)
+
+        self.assertTrue(np.allclose(selector.selected_idx_, self.idx))
+
+    def test_randomized_solver(self):
+        """
+        This test checks that the randomized solver returns the known set of
+        indices
+        """
+        selector = PCovCUR(n_to_select=10, mixing=0.5, svd_solver="randomized")
+        selector.fit(self.X, self.y)
+
+        self.assertTrue(np.allclose(selector.selected_idx_, self.idx))
+
+        with self.assertRaises(ValueError):
+            PCovCUR(n_to_select=2, svd_solver="bad").fit(self.X, self.y)
+
+    def test_store_selected(self):
+        """
+        This test checks that the index-only mode is refused, as the selected
+        samples are needed to orthogonalize y
+        """
+        with self.assertRaises(ValueError):
+            PCovCUR(n_to_select=2, store_selected=False).fit(self.X, self.y)
+
+    def test_checkpoint(self):
+        """
+        This test checks that an interrupted selection resumes from the last
+        checkpoint, orthogonalized by the selections it holds
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            checkpoint = os.path.join(tmpdir, "selector.pkl")
+            selector = PCovCUR(
+                n_to_select=10, mixing=0.5, checkpoint=checkpoint, checkpoint_every=3
+            )
+            with interrupt_after(PCovCUR, 7):
+                with self.assertRaises(KeyboardInterrupt):
+                    selector.fit(self.X, self.y)
+
+            selector = PCovCUR(n_to_select=10, mixing=0.5, checkpoint=checkpoint)
+            selector.resume(self.X, self.y)
+            self.assertTrue(np.allclose(selector.selected_idx_, self.idx))
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -1,5 +1,7 @@
 import unittest
+from itertools import product
 
+import numpy as np
 from sklearn.datasets import load_boston
 
 from skcosmo.sample_selection import PCovFPS
@@ -24,6 +26,75 @@ class TestPCovFPS(unittest.TestCase):
             selector.fit(self.X, y=self.y, warm_start=True)
             self.assertEqual(selector.selected_idx_[i - 1], self.idx[i - 1])
 
+    def test_n_jobs(self):
+        """
+        This test checks that sharding the update among threads selects the
+        same samples as the serial update
+        """
+        selector = PCovFPS(n_to_select=len(self.idx), initialize=self.idx[0], n_jobs=2)
+        selector.fit(self.X, y=self.y)
+        self.assertTrue(np.allclose(selector.selected_idx_, self.idx))
+
+    def test_feature_map(self):
+        """
+        This test checks that the distances computed from the explicit PCovR
+        feature map select the same samples as the PCovR kernel, where a 1-D
+        y is taken as a single property
+        """
+        ref_selector = PCovFPS(n_to_select=len(self.idx), initialize=self.idx[0])
+        ref_selector.fit(self.X, y=self.y.reshape(-1, 1))
+
+        for y, n_jobs in product([self.y, self.y.reshape(-1, 1)], [None, 2]):
+            with self.subTest(y_shape=y.shape, n_jobs=n_jobs):
+                selector = PCovFPS(
+                    n_to_select=len(self.idx),
+                    initialize=self.idx[0],
+                    feature_map=True,
+                    n_jobs=n_jobs,
+                )
+                selector.fit(self.X, y=y)
+                self.assertTrue(
+                    np.allclose(selector.selected_idx_, ref_selector.selected_idx_)
+                )
+                self.assertTrue(
+                    np.allclose(
+                        selector.get_select_distance()[1:],
+                        ref_selector.get_select_distance()[1:],
+                    )
+                )
+                self.assertFalse(hasattr(selector, "pcovr_distance_"))
+
+    def test_batch(self):
+        """
+        This test checks that selecting a batch of far-apart samples per
+        update gives the PCov-FPS selection for batches of one sample, and
+        that larger batches select distinct samples
+        """
+        y = self.y.reshape(-1, 1)
+        for feature_map in [False, True]:
+            with self.subTest(feature_map=feature_map):
+                ref_selector = PCovFPS(
+                    n_to_select=len(self.idx),
+                    initialize=self.idx[0],
+                    feature_map=feature_map,
+                )
+                ref_selector.fit(self.X, y=y)
+
+                selector = PCovFPS(
+                    n_to_select=len(self.idx),
+                    initialize=self.idx[0],
+                    feature_map=feature_map,
+                    batch_size=1,
+                )
+                selector.fit(self.X, y=y)
+                self.assertTrue(
+                    np.allclose(selector.selected_idx_, ref_selector.selected_idx_)
+                )
+
+                selector.batch_size = 4
+                selector.fit(self.X, y=y)
+                self.assertEqual(len(np.unique(selector.selected_idx_)), len(self.idx))
+
     def test_no_mixing_1(self):
         """
         This test checks that the model throws an error when mixing = 1.0
@@ -1,6 +1,7 @@
 import unittest
 
 import numpy as np
+import scipy.sparse
 from sklearn import exceptions
 
 # from sklearn.datasets import load_boston as load
@@ -48,6 +49,79 @@ class TestCUR(unittest.TestCase):
 
         self.assertTrue(np.allclose(selector.selected_idx_, ref_idx))
 
+    def test_subspace_solver(self):
+        """
+        This test checks that the warm-started subspace iteration selects the
+        same indices as the ARPACK solver
+        """
+        for k in [1, 3]:
+            with self.subTest(k=k):
+                ref_selector = CUR(n_to_select=self.n_select, k=k).fit(self.X)
+                selector = CUR(n_to_select=self.n_select, k=k, svd_solver="subspace")
+                selector.fit(self.X)
+                self.assertTrue(
+                    np.allclose(selector.selected_idx_, ref_selector.selected_idx_)
+                )
+
+        with self.assertRaises(ValueError):
+            CUR(n_to_select=2, svd_solver="bad").fit(self.X)
+
+    def test_covariance(self):
+        """
+        This test checks that working on the Gram matrix selects the same
+        indices as working on X
+        """
+        ref_selector = CUR(n_to_select=self.n_select).fit(self.X)
+        selector = CUR(n_to_select=self.n_select, covariance=True).fit(self.X)
+        self.assertTrue(np.allclose(selector.selected_idx_, ref_selector.selected_idx_))
+
+    def test_randomized_solver(self):
+        """
+        This test checks that the randomized solver selects the same indices
+        as the ARPACK solver
+        """
+        ref_selector = CUR(n_to_select=self.n_select).fit(self.X)
+        selector = CUR(n_to_select=self.n_select, svd_solver="randomized")
+        selector.fit(self.X)
+        self.assertTrue(np.allclose(selector.selected_idx_, ref_selector.selected_idx_))
+
+    def test_implicit_deflation(self):
+        """
+        This test checks that the implicit deflation selects the same indices
+        as the explicit one for every solver, without densifying sparse input,
+        including after a restart
+        """
+        n_to_select = self.n_select
+        X_sparse = scipy.sparse.csr_matrix(self.X)
+        for svd_solver in ["arpack", "subspace", "randomized"]:
+            with self.subTest(svd_solver=svd_solver):
+                ref_selector = CUR(
+                    n_to_select=n_to_select,
+                    svd_solver=svd_solver,
+                    deflation="explicit",
+                    random_state=0,
+                ).fit(self.X)
+                selector = CUR(
+                    n_to_select=n_to_select, svd_solver=svd_solver, random_state=0
+                ).fit(X_sparse)
+                self.assertTrue(
+                    np.allclose(selector.selected_idx_, ref_selector.selected_idx_)
+                )
+                self.assertFalse(hasattr(selector, "X_current_"))
+                self.assertTrue(scipy.sparse.issparse(selector.X_selected_))
+
+        ref_selector = CUR(n_to_select=n_to_select).fit(self.X)
+        selector = CUR(n_to_select=1, deflation="implicit").fit(self.X)
+        for i in range(2, n_to_select, 5):
+            selector.n_to_select = i
+            selector.fit(self.X, warm_start=True)
+            self.assertTrue(
+                np.allclose(selector.selected_idx_, ref_selector.selected_idx_[:i])
+            )
+
+        with self.assertRaises(ValueError):
+            CUR(n_to_select=2, deflation="bad").fit(self.X)
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
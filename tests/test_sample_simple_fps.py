@@ -1,9 +1,15 @@
+import os
+import tempfile
 import unittest
 
+import numpy as np
+import scipy.sparse
+from sklearn import config_context
 from sklearn.datasets import load_boston
 from sklearn.utils.validation import NotFittedError
 
 from skcosmo.sample_selection import FPS
+from test_greedy_selector import interrupt_after
 
 
 class TestFPS(unittest.TestCase):
@@ -55,6 +61,464 @@ class TestFPS(unittest.TestCase):
             selector = FPS(n_to_select=1)
             _ = selector.get_select_distance()
 
+    def test_block_size(self):
+        """
+        This test checks that the blocked update, also from a memory-mapped
+        array, selects the same samples as the in-memory update
+        """
+        ref_selector = FPS(n_to_select=len(self.idx)).fit(self.X)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "X.npy")
+            np.save(filename, self.X)
+            X_mmap = np.load(filename, mmap_mode="r")
+
+            for block_size in [1, 7, 100, 10000]:
+                with self.subTest(block_size=block_size):
+                    selector = FPS(n_to_select=len(self.idx), block_size=block_size)
+                    selector.fit(X_mmap)
+                    self.assertTrue(
+                        np.allclose(selector.selected_idx_, ref_selector.selected_idx_)
+                    )
+                    self.assertTrue(
+                        np.allclose(selector.haussdorf_, ref_selector.haussdorf_)
+                    )
+            del X_mmap, selector
+
+        with self.assertRaises(ValueError):
+            FPS(n_to_select=1, block_size=0).fit(self.X)
+
+    def test_sketch(self):
+        """
+        This test checks that maintaining the distances on a random sketch and
+        re-scoring the candidates selects the same samples as the full update
+        """
+        ref_selector = FPS(n_to_select=50).fit(self.X)
+
+        for sketch_tolerance in [None, 1.0]:
+            with self.subTest(sketch_tolerance=sketch_tolerance):
+                selector = FPS(
+                    n_to_select=50,
+                    sketch_size=8,
+                    sketch_tolerance=sketch_tolerance,
+                    block_size=4,
+                )
+                selector.fit(self.X)
+                self.assertTrue(
+                    np.allclose(selector.selected_idx_, ref_selector.selected_idx_)
+                )
+                self.assertTrue(
+                    np.allclose(
+                        selector.get_select_distance(),
+                        ref_selector.get_select_distance(),
+                    )
+                )
+
+                # the distances which were not re-scored are estimates, so the
+                # covering radius is computed from X
+                self.assertAlmostEqual(
+                    selector.get_summary(self.X)["radius"].max(),
+                    np.sqrt(ref_selector.get_distance().max()),
+                )
+
+        with self.assertRaises(ValueError):
+            FPS(n_to_select=1, sketch_size=0).fit(self.X)
+
+    def test_n_jobs(self):
+        """
+        This test checks that sharding the update among threads selects the
+        same samples as the serial update
+        """
+        ref_selector = FPS(n_to_select=len(self.idx)).fit(self.X)
+
+        for n_jobs, block_size in [(2, None), (3, 50), (-1, None)]:
+            with self.subTest(n_jobs=n_jobs, block_size=block_size):
+                selector = FPS(
+                    n_to_select=len(self.idx), n_jobs=n_jobs, block_size=block_size
+                )
+                selector.fit(self.X)
+                self.assertTrue(
+                    np.allclose(selector.selected_idx_, ref_selector.selected_idx_)
+                )
+                self.assertIsNone(selector._executor)
+
+    def test_partial_fit(self):
+        """
+        This test checks that the streaming selection covers all the samples
+        within the reported radius, and that it is within the approximation
+        guarantee of exact FPS
+        """
+        n_to_select = len(self.idx)
+
+        selector = FPS(n_to_select=n_to_select)
+        for batch in np.array_split(self.X, 7):
+            selector.partial_fit(batch)
+
+        self.assertEqual(selector.n_seen_, len(self.X))
+        self.assertLessEqual(len(selector.selected_idx_), n_to_select)
+        self.assertTrue(
+            np.allclose(selector.X_selected_, self.X[selector.selected_idx_])
+        )
+        self.assertTrue(
+            np.allclose(
+                selector.get_support(indices=True), sorted(selector.selected_idx_)
+            )
+        )
+        self.assertTrue(
+            np.allclose(
+                selector.transform(self.X), self.X[sorted(selector.selected_idx_)]
+            )
+        )
+
+        distances = np.linalg.norm(
+            self.X[:, np.newaxis] - selector.X_selected_[np.newaxis], axis=2
+        )
+        self.assertLessEqual(distances.min(axis=1).max(), selector.coverage_radius_)
+
+        fps = FPS(n_to_select=n_to_select).fit(self.X)
+        fps_distances = np.linalg.norm(
+            self.X[:, np.newaxis] - fps.X_selected_[np.newaxis], axis=2
+        )
+        fps_radius = fps_distances.min(axis=1).max()
+        self.assertLessEqual(selector.radius_lower_bound_, fps_radius)
+        self.assertLessEqual(
+            selector.coverage_radius_, 8 * selector.radius_lower_bound_
+        )
+
+    def test_partial_fit_after_fit(self):
+        """
+        This test checks that a fit drops the state of a previous streaming
+        selection, so that a later partial_fit starts a new stream
+        """
+        batches = np.array_split(self.X, 3)
+
+        selector = FPS(n_to_select=len(self.idx))
+        selector.partial_fit(batches[0])
+        selector.fit(self.X)
+        self.assertFalse(hasattr(selector, "n_seen_"))
+        self.assertTrue(np.allclose(selector.selected_idx_, self.idx))
+
+        selector.partial_fit(batches[2])
+        ref_selector = FPS(n_to_select=len(self.idx)).partial_fit(batches[2])
+        self.assertEqual(selector.n_seen_, len(batches[2]))
+        self.assertTrue(np.allclose(selector.selected_idx_, ref_selector.selected_idx_))
+        self.assertEqual(selector.coverage_radius_, ref_selector.coverage_radius_)
+
+    def test_bad_partial_fit(self):
+        """
+        This test checks that streaming selection requires an integer number of
+        selections and a consistent number of features
+        """
+        with self.assertRaises(ValueError):
+            FPS(n_to_select=0.5).partial_fit(self.X)
+
+        selector = FPS(n_to_select=2).partial_fit(self.X[:10])
+        with self.assertRaises(ValueError):
+            selector.partial_fit(self.X[:10, :3])
+
+    def test_summary(self):
+        """
+        This test checks that the summary covers each sample within the radius
+        of its closest selection, and maps the selections to global indices
+        """
+        selector = FPS(n_to_select=len(self.idx)).fit(self.X)
+        summary = selector.get_summary(self.X, indices=np.arange(len(self.X)) + 10)
+
+        self.assertTrue(np.allclose(summary["selected_idx"], np.add(self.idx, 10)))
+        self.assertTrue(np.allclose(summary["X_selected"], self.X[self.idx]))
+        self.assertEqual(summary["n_samples"], len(self.X))
+
+        distances = np.linalg.norm(
+            self.X[:, np.newaxis] - self.X[np.newaxis, self.idx], axis=2
+        )
+        closest = np.argmin(distances, axis=1)
+        self.assertTrue(
+            np.allclose(
+                [distances[closest == i, i].max() for i in range(len(self.idx))],
+                summary["radius"],
+            )
+        )
+
+        # the distances are computed by blocks of a few samples
+        with config_context(working_memory=1e-3):
+            block_summary = selector.get_summary(self.X)
+        self.assertTrue(np.allclose(block_summary["radius"], summary["radius"]))
+
+    def test_lazy(self):
+        """
+        This test checks that lazily re-scoring the candidates which reach the
+        top of the heap selects the same samples as the full update, also
+        after a warm start, and that the distances which were not re-scored
+        are upper bounds
+        """
+        ref_selector = FPS(n_to_select=50).fit(self.X)
+
+        selector = FPS(n_to_select=10, lazy=True).fit(self.X)
+        selector.n_to_select = 50
+        selector.fit(self.X, warm_start=True)
+        self.assertTrue(np.allclose(selector.selected_idx_, ref_selector.selected_idx_))
+        self.assertTrue(
+            np.allclose(
+                selector.get_select_distance(), ref_selector.get_select_distance()
+            )
+        )
+        self.assertTrue(
+            np.all(selector.get_distance() >= ref_selector.get_distance() - 1e-8)
+        )
+        self.assertAlmostEqual(
+            selector.get_summary(self.X)["radius"].max(),
+            np.sqrt(ref_selector.get_distance().max()),
+        )
+
+        with self.assertRaises(ValueError):
+            FPS(n_to_select=1, lazy=True, sketch_size=2).fit(self.X)
+
+    def test_batch(self):
+        """
+        This test checks that selecting a batch of far-apart samples per
+        update gives the FPS selection for batches of one sample, and that
+        larger batches keep the Haussdorf distances exact and the selected
+        samples far apart, also when sharded and after a warm start
+        """
+        ref_selector = FPS(n_to_select=50).fit(self.X)
+        selector = FPS(n_to_select=50, batch_size=1).fit(self.X)
+        self.assertTrue(np.allclose(selector.selected_idx_, ref_selector.selected_idx_))
+        self.assertTrue(
+            np.allclose(
+                selector.get_select_distance(), ref_selector.get_select_distance()
+            )
+        )
+
+        # exact FPS covers the samples within twice the optimal radius
+        ref_radius = np.sqrt(ref_selector.get_distance().max())
+
+        for n_jobs in [None, 2]:
+            with self.subTest(n_jobs=n_jobs):
+                selector = FPS(n_to_select=20, batch_size=8, n_jobs=n_jobs)
+                selector.fit(self.X)
+                selector.n_to_select = 50
+                selector.fit(self.X, warm_start=True)
+
+                self.assertEqual(len(np.unique(selector.selected_idx_)), 50)
+                self.assertTrue(
+                    np.allclose(selector.X_selected_, self.X[selector.selected_idx_])
+                )
+
+                distances = (
+                    (self.X[:, np.newaxis] - self.X[np.newaxis, selector.selected_idx_])
+                    ** 2
+                ).sum(axis=2)
+                self.assertTrue(
+                    np.allclose(
+                        selector.get_distance(), distances.min(axis=1), atol=1e-6
+                    )
+                )
+
+                # the selections and the farthest sample are pairwise at least
+                # this far apart, which no selection of 50 samples can cover
+                min_distance = min(
+                    selector.get_select_distance().min(), selector.get_distance().max()
+                )
+                self.assertLessEqual(np.sqrt(min_distance) / 2, ref_radius)
+
+    def test_batch_threshold(self):
+        """
+        This test checks that the batches stop at the score threshold, and
+        that the batch size must be a positive integer
+        """
+        threshold = FPS(n_to_select=20).fit(self.X).get_select_distance()[-1]
+        with self.assertWarns(Warning):
+            selector = FPS(n_to_select=40, batch_size=8, score_threshold=threshold)
+            selector.fit(self.X)
+        self.assertLess(selector.n_selected_, 40)
+        self.assertTrue(np.all(selector.get_select_distance() >= threshold))
+
+        for batch_size in [0, 2.5]:
+            with self.subTest(batch_size=batch_size):
+                with self.assertRaises(ValueError):
+                    FPS(n_to_select=1, batch_size=batch_size).fit(self.X)
+
+        with self.assertRaises(ValueError):
+            FPS(n_to_select=1, batch_size=2, lazy=True).fit(self.X)
+
+    def test_dtype(self):
+        """
+        This test checks that float32 samples are selected in float32 end to
+        end, with the same selection as in float64, and that the distances can
+        be accumulated in float64
+        """
+        X = self.X.astype(np.float32)
+
+        for distance_dtype in [None, np.float64]:
+            with self.subTest(distance_dtype=distance_dtype):
+                selector = FPS(n_to_select=len(self.idx), distance_dtype=distance_dtype)
+                selector.fit(X)
+                self.assertTrue(np.allclose(selector.selected_idx_, self.idx))
+                self.assertEqual(selector.X_selected_.dtype, np.float32)
+
+                expected = np.float32 if distance_dtype is None else np.float64
+                self.assertEqual(selector.norms_.dtype, expected)
+                self.assertEqual(selector.haussdorf_.dtype, expected)
+
+        with self.assertRaises(ValueError):
+            FPS(n_to_select=1, distance_dtype=int).fit(X)
+
+    def test_sparse(self):
+        """
+        This test checks that sparse samples are selected as their dense
+        counterparts, in CSR or CSC format and along all the update paths, and
+        that the selected samples are stored sparsely
+        """
+        X = scipy.sparse.random(200, 300, density=0.05, random_state=0)
+        X_dense = X.toarray()
+
+        ref_selector = FPS(n_to_select=20).fit(X_dense)
+
+        for params in [{}, {"block_size": 37, "n_jobs": 2}, {"sketch_size": 30}]:
+            for fmt in ["csr", "csc"]:
+                with self.subTest(fmt=fmt, **params):
+                    selector = FPS(n_to_select=20, **params).fit(X.asformat(fmt))
+                    self.assertTrue(
+                        np.allclose(selector.selected_idx_, ref_selector.selected_idx_)
+                    )
+                    self.assertTrue(
+                        np.allclose(
+                            selector.get_select_distance(),
+                            ref_selector.get_select_distance(),
+                        )
+                    )
+                    self.assertTrue(scipy.sparse.issparse(selector.X_selected_))
+                    self.assertTrue(
+                        np.allclose(
+                            selector.X_selected_.toarray(), ref_selector.X_selected_
+                        )
+                    )
+
+        summary = FPS(n_to_select=20).fit(X).get_summary(X)
+        ref_summary = ref_selector.get_summary(X_dense)
+        self.assertTrue(np.allclose(summary["radius"], ref_summary["radius"]))
+
+    def test_store_selected(self):
+        """
+        This test checks that the index-only mode selects the same samples,
+        also lazily and when streaming, and still gives the summary
+        """
+        ref_selector = FPS(n_to_select=len(self.idx)).fit(self.X)
+        for kwargs in [{}, {"lazy": True}, {"block_size": 100}]:
+            with self.subTest(**kwargs):
+                selector = FPS(
+                    n_to_select=len(self.idx), store_selected=False, **kwargs
+                )
+                selector.fit(self.X)
+                self.assertTrue(np.allclose(selector.selected_idx_, self.idx))
+                self.assertFalse(hasattr(selector, "X_selected_"))
+
+        summary = selector.get_summary(self.X)
+        ref_summary = ref_selector.get_summary(self.X)
+        self.assertTrue(np.allclose(summary["X_selected"], self.X[self.idx]))
+        self.assertTrue(np.allclose(summary["radius"], ref_summary["radius"]))
+
+        selector = FPS(n_to_select=len(self.idx), store_selected=False)
+        selector.partial_fit(self.X)
+        self.assertFalse(hasattr(selector, "X_selected_"))
+
+    def test_checkpoint(self):
+        """
+        This test checks that an interrupted selection resumes from the last
+        checkpoint to the same selection, also lazily and in batches, where
+        a batch is not split between checkpoints
+        """
+        for kwargs in [{}, {"lazy": True}, {"batch_size": 4}]:
+            with self.subTest(**kwargs), tempfile.TemporaryDirectory() as tmpdir:
+                ref_selector = FPS(n_to_select=30, **kwargs).fit(self.X)
+
+                checkpoint = os.path.join(tmpdir, "selector.pkl")
+                selector = FPS(
+                    n_to_select=30, checkpoint=checkpoint, checkpoint_every=5, **kwargs
+                )
+                with interrupt_after(FPS, 18):
+                    with self.assertRaises(KeyboardInterrupt):
+                        selector.fit(self.X)
+
+                selector = FPS(n_to_select=30, checkpoint=checkpoint, **kwargs)
+                selector.resume(self.X)
+                self.assertTrue(
+                    np.allclose(selector.selected_idx_, ref_selector.selected_idx_)
+                )
+                self.assertTrue(
+                    np.allclose(selector.haussdorf_, ref_selector.haussdorf_)
+                )
+
+    def test_callback(self):
+        """
+        This test checks that the callback is given the distance of each
+        selection, including the first one made when initializing, also when
+        the selection is lazy or in batches
+        """
+        for kwargs in [{}, {"lazy": True}, {"batch_size": 3}]:
+            with self.subTest(**kwargs):
+                infos = []
+                selector = FPS(
+                    n_to_select=len(self.idx), callback=infos.append, **kwargs
+                )
+                selector.fit(self.X)
+
+                self.assertEqual(
+                    [info["iteration"] for info in infos], list(range(len(self.idx)))
+                )
+                self.assertEqual(
+                    [info["selected"] for info in infos],
+                    selector.selected_idx_.tolist(),
+                )
+                self.assertTrue(
+                    np.allclose(
+                        [info["score"] for info in infos],
+                        selector.get_select_distance(),
+                    )
+                )
+                self.assertEqual(len(selector.timings_), selector.n_selected_)
+
+                selector.n_to_select = len(self.idx) + 5
+                selector.fit(self.X, warm_start=True)
+                self.assertEqual(len(selector.timings_), selector.n_selected_)
+
+        selector = FPS(n_to_select=len(self.idx), callback=lambda info: True)
+        selector.fit(self.X)
+        self.assertEqual(selector.selected_idx_.tolist(), [self.idx[0]])
+        self.assertEqual(selector.X_selected_.shape, (1, self.X.shape[1]))
+        self.assertEqual(len(selector.timings_), 1)
+
+    def test_callback_batch(self):
+        """
+        This test checks that a stop requested in the middle of a batch is
+        deferred to its end, so that the distances stay exact, also in the
+        checkpoint
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            checkpoint = os.path.join(tmpdir, "selector.pkl")
+            selector = FPS(
+                n_to_select=40,
+                batch_size=8,
+                checkpoint=checkpoint,
+                callback=lambda info: info["iteration"] >= 13,
+            )
+            selector.fit(self.X)
+
+            # the first selection is made when initializing, then in batches
+            self.assertEqual(len(selector.selected_idx_), 17)
+            distances = (
+                (self.X[:, np.newaxis] - self.X[np.newaxis, selector.selected_idx_])
+                ** 2
+            ).sum(axis=2)
+            self.assertTrue(np.allclose(selector.get_distance(), distances.min(axis=1)))
+
+            ref_selector = FPS(n_to_select=40, batch_size=8).fit(self.X)
+            selector = FPS(n_to_select=40, batch_size=8, checkpoint=checkpoint)
+            selector.resume(self.X)
+            self.assertTrue(
+                np.allclose(selector.selected_idx_, ref_selector.selected_idx_)
+            )
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -1,4 +1,9 @@
+import json
+import os
+import tempfile
 import unittest
+import warnings
+from unittest import mock
 
 import numpy as np
 from sklearn.exceptions import NotFittedError
@@ -6,7 +11,13 @@ from sklearn.exceptions import NotFittedError
 from skcosmo.sample_selection import (
     FPS,
     VoronoiFPS,
+    calibrate_voronoi_fps,
 )
+from skcosmo._voronoi_fps import (
+    _DEFAULT_FULL_FRACTION,
+    _get_calibration_key,
+)
+from test_greedy_selector import interrupt_after
 from test_sample_simple_fps import TestFPS
 
 
@@ -14,6 +25,18 @@ class TestVoronoiFPS(TestFPS):
     def setUp(self):
         super().setUp()
 
+        # keep the calibration of the switching point out of the user cache
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.cache_dir.cleanup)
+        env = mock.patch.dict(os.environ, {"SKCOSMO_CACHE_DIR": self.cache_dir.name})
+        env.start()
+        self.addCleanup(env.stop)
+
+        # and warn about the missing calibrations in each test
+        missing = mock.patch("skcosmo._voronoi_fps._MISSING_CALIBRATIONS", set())
+        missing.start()
+        self.addCleanup(missing.stop)
+
     def test_restart(self):
         """
         This test checks that the model can be restarted with a new number of
@@ -28,6 +51,28 @@ class TestVoronoiFPS(TestFPS):
             selector.fit(self.X, warm_start=True)
             self.assertEqual(selector.selected_idx_[i - 1], self.idx[i - 1])
 
+    def test_dtype(self):
+        """
+        This test checks that float32 samples are selected in float32 end to
+        end, including the distances used to prune the Voronoi cells
+        """
+        X = self.X.astype(np.float32)
+
+        for distance_dtype in [None, np.float64]:
+            with self.subTest(distance_dtype=distance_dtype):
+                selector = VoronoiFPS(
+                    n_to_select=len(self.idx),
+                    distance_dtype=distance_dtype,
+                    full_fraction=0.5,
+                )
+                selector.fit(X)
+                self.assertTrue(np.allclose(selector.selected_idx_, self.idx))
+                self.assertEqual(selector.X_selected_.dtype, np.float32)
+
+                expected = np.float32 if distance_dtype is None else np.float64
+                for distances in [selector.haussdorf_, selector.dSL_]:
+                    self.assertEqual(distances.dtype, expected)
+
     def test_initialize(self):
         """
         This test checks that the model can be initialized in all applicable manners
@@ -53,11 +98,24 @@ class TestVoronoiFPS(TestFPS):
         """
         selector = VoronoiFPS(n_to_select=1)
         selector.fit(self.X)
-        self.assertTrue(1 > selector.full_fraction)
+        self.assertTrue(1 > selector.full_fraction_)
 
         selector = VoronoiFPS(n_to_select=1, full_fraction=0.5)
         selector.fit(self.X)
-        self.assertEqual(selector.full_fraction, 0.5)
+        self.assertEqual(selector.full_fraction_, 0.5)
+
+        # the switching point is resolved again at each fit
+        selector = VoronoiFPS(n_to_select=1, metric="manhattan")
+        selector.fit(self.X)
+        self.assertEqual(selector.full_fraction_, 1.0)
+        selector.metric = "euclidean"
+        selector.fit(self.X)
+        self.assertIsNone(selector.full_fraction)
+        self.assertEqual(selector.full_fraction_, _DEFAULT_FULL_FRACTION)
+
+        with self.subTest(name="deprecated_ntrial"):
+            with self.assertWarns(FutureWarning):
+                VoronoiFPS(n_to_select=1, n_trial_calculation=4).fit(self.X)
 
         with self.subTest(name="bad_ntrial"):
             with self.assertRaises(ValueError) as cm:
@@ -94,6 +152,51 @@ class TestVoronoiFPS(TestFPS):
                     f"Switching point should be real and more than 0 and less than 1 received {selector.full_fraction}",
                 )
 
+    def test_calibration_cache(self):
+        """
+        This test checks that the fits use the default switching point, with a
+        single warning and without writing to the cache, until it has been
+        calibrated
+        """
+        path = os.path.join(self.cache_dir.name, "voronoi_fps_calibration.json")
+        key = _get_calibration_key(self.X.shape[1], self.X.dtype)
+
+        with self.assertWarns(Warning) as cm:
+            selector = VoronoiFPS(n_to_select=1).fit(self.X)
+        self.assertIn("calibrate_voronoi_fps", str(cm.warning))
+        self.assertEqual(selector.full_fraction_, _DEFAULT_FULL_FRACTION)
+        self.assertFalse(os.path.exists(path))
+
+        # the missing switching point is only warned about once
+        with warnings.catch_warnings(record=True) as record:
+            warnings.simplefilter("always")
+            selector = VoronoiFPS(n_to_select=1).fit(self.X)
+        self.assertEqual(len(record), 0)
+        self.assertEqual(selector.full_fraction_, _DEFAULT_FULL_FRACTION)
+
+        full_fraction = calibrate_voronoi_fps(self.X.shape[1], n_samples=1000)
+        with open(path) as f:
+            self.assertEqual(json.load(f)[key], full_fraction)
+        selector = VoronoiFPS(n_to_select=1).fit(self.X)
+        self.assertEqual(selector.full_fraction_, full_fraction)
+
+        with open(path, "w") as f:
+            json.dump({key: 0.123}, f)
+        selector = VoronoiFPS(n_to_select=1).fit(self.X)
+        self.assertEqual(selector.full_fraction_, 0.123)
+
+    def test_calibration_size(self):
+        """
+        This test checks that the matrix timed by the calibration stays small
+        for a large number of features
+        """
+        with mock.patch(
+            "skcosmo._voronoi_fps._measure_full_fraction", return_value=0.5
+        ) as measure:
+            calibrate_voronoi_fps(5000, cache_dir=self.cache_dir.name)
+        X = measure.call_args[0][0]
+        self.assertEqual(X.shape, (64, 8192))
+
     def test_get_distances(self):
         """
         This test checks that the haussdorf distances are returnable after fitting
@@ -119,6 +222,77 @@ class TestVoronoiFPS(TestFPS):
 
         self.assertTrue(np.allclose(vselector.selected_idx_, selector.selected_idx_))
 
+    def test_metric(self):
+        """
+        This test checks that named and callable metrics select the same
+        points as a plain FPS with the same metric, while computing fewer
+        distances
+        """
+        X = self.X[:200]
+        n_to_select = 50
+
+        D = np.abs(X[:, None, :] - X[None, :, :]).sum(axis=-1)
+        ref_idx = [0]
+        haussdorf = D[0].copy()
+        for _ in range(n_to_select - 1):
+            ref_idx.append(np.argmax(haussdorf))
+            np.minimum(haussdorf, D[ref_idx[-1]], haussdorf)
+
+        n_distances = []
+
+        def manhattan(X, i, indices):
+            n_distances.append(len(indices))
+            return np.abs(X[indices] - X[i]).sum(axis=-1)
+
+        for metric in ["manhattan", manhattan]:
+            with self.subTest(metric=metric):
+                selector = VoronoiFPS(
+                    n_to_select=n_to_select, metric=metric, full_fraction=1.0
+                )
+                selector.fit(X)
+                self.assertTrue(np.allclose(selector.selected_idx_, ref_idx))
+
+        # distances to the previous selections and to the active points only
+        self.assertLess(sum(n_distances), n_to_select * X.shape[0])
+
+    def test_ties(self):
+        """
+        This test checks that, among points equally far from the selections,
+        the one with the smallest index is selected, as in a search over all the
+        points
+        """
+        X = np.random.RandomState(0).randint(3, size=(300, 4)).astype(float)
+        n_to_select = 40
+
+        D = ((X[:, None, :] - X[None, :, :]) ** 2).sum(axis=-1)
+        ref_idx = [0]
+        haussdorf = D[0].copy()
+        for _ in range(n_to_select - 1):
+            ref_idx.append(np.argmax(haussdorf))
+            np.minimum(haussdorf, D[ref_idx[-1]], haussdorf)
+
+        selector = VoronoiFPS(n_to_select=n_to_select, full_fraction=0.5)
+        selector.fit(X)
+        self.assertTrue(np.allclose(selector.selected_idx_, ref_idx))
+
+    def test_cell_index(self):
+        """
+        This test checks that the members and radius of each Voronoi cell are
+        consistent with the cell location of the points, including after a
+        restart
+        """
+        selector = VoronoiFPS(n_to_select=10, full_fraction=0.5)
+        selector.fit(self.X)
+        selector.n_to_select = 20
+        selector.fit(self.X, warm_start=True)
+
+        for c in range(selector.n_selected_):
+            members = np.where(selector.vlocation_of_idx == c)[0]
+            self.assertTrue(np.array_equal(np.sort(selector._cell_members[c]), members))
+            self.assertAlmostEqual(
+                selector.cell_radius_[c], selector.haussdorf_[members].max()
+            )
+
     def test_nothing_updated_points(self):
         """
         This test checks that in the case where we have no points to update,
@@ -178,6 +352,46 @@ class TestVoronoiFPS(TestFPS):
             )
         )
 
+    def test_store_selected(self):
+        """
+        This test checks that the index-only mode selects the same samples
+        when the distances to the previous selections are computed from X
+        """
+        ref_selector = FPS(n_to_select=50).fit(self.X)
+        selector = VoronoiFPS(n_to_select=50, store_selected=False, full_fraction=0.5)
+        selector.fit(self.X)
+        self.assertTrue(np.allclose(selector.selected_idx_, ref_selector.selected_idx_))
+        self.assertFalse(hasattr(selector, "X_selected_"))
+
+    def test_checkpoint(self):
+        """
+        This test checks that an interrupted selection resumes from the last
+        checkpoint to the same selection, with the switching point resolved
+        by the interrupted fit
+        """
+        for kwargs in [{}, {"metric": "manhattan"}]:
+            with self.subTest(**kwargs), tempfile.TemporaryDirectory() as tmpdir:
+                ref_selector = VoronoiFPS(n_to_select=30, **kwargs).fit(self.X)
+
+                checkpoint = os.path.join(tmpdir, "selector.pkl")
+                selector = VoronoiFPS(
+                    n_to_select=30, checkpoint=checkpoint, checkpoint_every=5, **kwargs
+                )
+                with interrupt_after(VoronoiFPS, 18):
+                    with self.assertRaises(KeyboardInterrupt):
+                        selector.fit(self.X)
+
+                selector = VoronoiFPS(n_to_select=30, checkpoint=checkpoint, **kwargs)
+                selector.resume(self.X)
+                self.assertIsNone(selector.full_fraction)
+                self.assertEqual(selector.full_fraction_, ref_selector.full_fraction_)
+                self.assertTrue(
+                    np.allclose(selector.selected_idx_, ref_selector.selected_idx_)
+                )
+                self.assertTrue(
+                    np.allclose(selector.haussdorf_, ref_selector.haussdorf_)
+                )
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)